@@ -0,0 +1,188 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from models import Tournament, open_data_base
+from settings import AUTOSAVE_DELAY, AUTOSAVE_MAX_DELAY
+
+
+class DeferredWriter(ABC):
+    """une écriture différée, faite en arrière-plan"""
+
+    def __init__(self, delay: float, max_delay: float):
+        """
+        Initializes a thread writing the items queued by `add` in batches.
+
+        A batch is written once no new item has come for `delay` seconds,
+        or `max_delay` seconds after its oldest item, so that a steady flow
+        of items is still written. `flush` writes the queued items at once
+        and `close` stops the thread after writing them. An error raised
+        by a write is raised again by the next `flush` or `close`.
+
+        :param delay: The time without new item before writing, in
+            seconds.
+        :type delay: float
+        :param max_delay: The maximum time an item waits, in seconds.
+        :type max_delay: float
+        """
+        self.delay = delay
+        self.max_delay = max_delay
+        self.condition = threading.Condition()
+        self.pending = []
+        self.first_time = 0.0
+        self.last_time = 0.0
+        self.urgent = False
+        self.writing = False
+        self.closed = False
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def add(self, item):
+        """
+        Queues an item to write.
+
+        :param item: The item.
+        """
+        with self.condition:
+            now = time.monotonic()
+            if not self.pending:
+                self.first_time = now
+            self.last_time = now
+            self.pending.append(item)
+            self.condition.notify_all()
+
+    def run(self):
+        """Writes the queued items until the writer is closed."""
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                while not self.closed and not self.urgent:
+                    deadline = min(self.last_time + self.delay,
+                                   self.first_time + self.max_delay)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                items = self.pending
+                self.pending = []
+                self.urgent = False
+                self.writing = True
+            try:
+                self.write(items)
+            # kept for the thread waiting for the items to be written
+            except Exception as error:
+                self.error = error
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
+
+    @abstractmethod
+    def write(self, items: list):
+        """
+        Writes a batch of items.
+
+        :param items: The items, in the order they were queued.
+        :type items: list
+        """
+
+    def flush(self):
+        """
+        Writes the queued items at once and waits until they are written.
+
+        :raises Exception: The error raised by a write since the last
+            flush, if any.
+        """
+        with self.condition:
+            if self.thread.is_alive():
+                self.urgent = True
+                self.condition.notify_all()
+                while self.pending or self.writing:
+                    self.condition.wait()
+                self.urgent = False
+                items = []
+            else:
+                items = self.pending
+                self.pending = []
+        if items:
+            self.write(items)
+        self.raise_error()
+
+    def close(self):
+        """
+        Writes the queued items at once, then stops the thread.
+
+        :raises Exception: The error raised by a write since the last
+            flush, if any.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join()
+        self.flush()
+
+    def raise_error(self):
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+
+class TournamentSaver(DeferredWriter):
+    """la sauvegarde d'un tournoi en arrière-plan"""
+
+    def __init__(self,
+                 tournament: Tournament,
+                 delay: float = AUTOSAVE_DELAY,
+                 max_delay: float = AUTOSAVE_MAX_DELAY):
+        """
+        Initializes the thread saving a tournament while the menus are
+        used.
+
+        Once started, `Tournament.save` only notifies the saver, and the
+        notifications received in a row are coalesced into a single save,
+        serialized and written by the thread, so that the menus do not
+        wait for the whole file to be written. `Tournament.flush` saves at
+        once, at the end of a round or of the tournament, and `close`, when
+        the menus of the tournament are left.
+
+        The thread saves while holding `Tournament.lock`, which the menus
+        hold while they change the tournament and record the change, so
+        that a change is never saved halfway.
+
+        :param tournament: The tournament to save.
+        :type tournament: Tournament
+        :param delay: The time without new change before saving, in
+            seconds.
+        :type delay: float
+        :param max_delay: The maximum time a change waits, in seconds.
+        :type max_delay: float
+        """
+        super().__init__(delay, max_delay)
+        self.tournament = tournament
+        self.requests = 0
+        self.saves = 0
+
+    def start(self):
+        self.tournament.saver = self
+        super().start()
+
+    def request(self):
+        """Notifies the saver that the tournament has changed."""
+        self.requests += 1
+        self.add(None)
+
+    def write(self, items: list):
+        with self.tournament.lock:
+            open_data_base().save_tournament(self.tournament)
+        self.saves += 1
+
+    def close(self):
+        self.tournament.saver = None
+        super().close()
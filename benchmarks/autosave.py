@@ -0,0 +1,91 @@
+"""
+Measures the time the menus wait for `Tournament.save`, for tournaments
+of growing size, when the file is written at once and when the save is
+left to an `autosave.TournamentSaver`, for a burst of changes a fraction
+of a second apart, as while registering players or entering results.
+The number of saves written and the time of the final flush are also
+measured.
+
+Run from the root of the project:
+    python -m benchmarks.autosave
+"""
+import os
+import statistics
+import tempfile
+import time
+
+from autosave import TournamentSaver
+from benchmarks.tournament_load import generate_tournament_data
+from models import Tournament
+from settings import TOURNAMENT_FILE_PATH
+
+FIELD_SIZES = [100, 1_000, 5_000]
+CHANGES = 20
+# time between two changes, as between two keystrokes
+CHANGE_INTERVAL = 0.05
+
+
+def load_tournament(size: int) -> Tournament:
+    """
+    Loads a tournament of `size` players whose rounds have been played,
+    as a tournament in progress.
+
+    :rtype: Tournament
+    """
+    data = generate_tournament_data(size)
+    data["end_date"] = None
+    tournament = Tournament(data["name"], data["place"])
+    tournament.load(data)
+    return tournament
+
+
+def time_saves(tournament: Tournament) -> list[float]:
+    """
+    Saves the tournament `CHANGES` times, `CHANGE_INTERVAL` seconds apart.
+
+    :return: The time of each call to `Tournament.save`, in seconds.
+    :rtype: list[float]
+    """
+    times = []
+    for _ in range(CHANGES):
+        start = time.perf_counter()
+        tournament.save()
+        times.append(time.perf_counter() - start)
+        time.sleep(CHANGE_INTERVAL)
+    return times
+
+
+def run():
+    print(f"{'joueurs': >8} {'taille (ko)': >11} {'direct (ms)': >11}"
+          f" {'différé (ms)': >12} {'max (ms)': >8} {'écritures': >9}"
+          f" {'vidage (ms)': >11}")
+    directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as data_directory:
+        os.chdir(data_directory)
+        try:
+            for size in FIELD_SIZES:
+                tournament = load_tournament(size)
+                direct_times = time_saves(tournament)
+                kilobytes = os.path.getsize(
+                    f"{TOURNAMENT_FILE_PATH}{tournament.name}.json") / 1024
+
+                saver = TournamentSaver(tournament)
+                saver.start()
+                deferred_times = time_saves(tournament)
+                start = time.perf_counter()
+                tournament.flush()
+                flush_time = time.perf_counter() - start
+                saver.close()
+
+                print(f"{size: >8} {kilobytes: >11.0f}"
+                      f" {statistics.median(direct_times) * 1e3: >11.2f}"
+                      f" {statistics.median(deferred_times) * 1e3: >12.3f}"
+                      f" {max(deferred_times) * 1e3: >8.3f}"
+                      f" {f'{saver.saves}/{saver.requests}': >9}"
+                      f" {flush_time * 1e3: >11.1f}")
+        finally:
+            os.chdir(directory)
+
+
+if __name__ == "__main__":
+    run()
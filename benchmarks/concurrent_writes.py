@@ -0,0 +1,313 @@
+"""
+Stress test of the data files shared by several programs: processes add
+players to the data base, register players to a tournament, then save
+the results of a round of this tournament at the same time, while
+another process reads the files. The updates lost and the files read
+half-written are counted, with the file locks and without them.
+
+Run from the root of the project:
+    python -m benchmarks.concurrent_writes
+    python -m benchmarks.concurrent_writes --processes 2 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Union
+
+import locking
+from controllers import CommandLineController
+from models import DataBase, MatchResult, Player, Tournament
+from settings import PLAYERS_FILE_PATH, TOURNAMENT_FILE_PATH
+
+PROCESSES = [1, 4, 16]
+NEW_PLAYERS = 400
+BOARDS = 50
+# small journal, so that it is often compacted while players are added
+JOURNAL_MAX_SIZE = 4096
+# results recorded in the journal between two saves of the tournament
+SAVE_EVERY = 5
+TOURNAMENT_NAME = "Open"
+MODES = {"avec": True, "sans": False}
+
+
+def start_worker(directory: str, locked: bool):
+    os.chdir(directory)
+    sys.stdout = open(os.devnull, "w")
+    if not locked:
+        locking.fcntl = None
+    DataBase.player_registry.journal_max_size = JOURNAL_MAX_SIZE
+
+
+def add_players(numbers: list[int]) -> int:
+    """
+    Adds players to the data base, one at a time.
+
+    :return: The number of failed writes.
+    :rtype: int
+    """
+    errors = 0
+    for number in numbers:
+        try:
+            DataBase.write_new_player_in_json(Player(
+                f"cc{number:05d}", f"Nom{number}", f"Prénom{number}",
+                "01/01/2000"))
+        # without the locks, a write may fail in many ways
+        except Exception:
+            errors += 1
+    return errors
+
+
+def register_players(numbers: list[int]) -> int:
+    """
+    Registers players to the tournament, one command at a time, as a
+    registration desk would.
+
+    :return: The number of failed registrations.
+    :rtype: int
+    """
+    controller = CommandLineController()
+    errors = 0
+    for number in numbers:
+        try:
+            controller.register_players(TOURNAMENT_NAME, [f"cc{number:05d}"])
+        except Exception:
+            errors += 1
+    return errors
+
+
+def save_results(match_numbers: list[int], seed: int) -> int:
+    """
+    Loads the tournament once, then assigns results to some matches of
+    its round, recording each result and saving the tournament every
+    `SAVE_EVERY` results, as a program left open would.
+
+    :return: The number of failed writes.
+    :rtype: int
+    """
+    generator = random.Random(seed)
+    errors = 0
+    try:
+        tournament = CommandLineController().load_tournament(
+            TOURNAMENT_NAME)
+        played_round = tournament.rounds[-1]
+    except Exception:
+        return len(match_numbers)
+    for count, match_number in enumerate(match_numbers, 1):
+        try:
+            match = played_round.matches[match_number - 1]
+            match.assign_outcome(generator.choice(
+                [MatchResult.PLAYER1, MatchResult.PLAYER2,
+                 MatchResult.DRAW]))
+            tournament.record_result(played_round, match)
+            if count % SAVE_EVERY == 0:
+                tournament.save()
+        except Exception:
+            errors += 1
+    try:
+        tournament.save()
+    except Exception:
+        errors += 1
+    return errors
+
+
+def read_files(directory: str, stop, counts):
+    """
+    Reads the players file and the tournament file without locking them,
+    as another program would, until `stop` is set. The number of reads
+    and of files found missing or half-written are added to `counts`.
+    """
+    os.chdir(directory)
+    tournament_path = f"{TOURNAMENT_FILE_PATH}{TOURNAMENT_NAME}.json"
+    reads = failures = 0
+    while not stop.is_set():
+        for path in (PLAYERS_FILE_PATH, tournament_path):
+            if path == tournament_path and not os.path.exists(path):
+                continue
+            reads += 1
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    json.load(file)
+            except (OSError, json.JSONDecodeError):
+                failures += 1
+    counts[0] += reads
+    counts[1] += failures
+
+
+def run_phase(pool, function, shares: list[tuple]) -> tuple[float, int]:
+    """
+    Runs a function in every process of a pool, each with its share of
+    the work, and waits for all of them.
+
+    :return: The time taken in seconds and the number of errors.
+    :rtype: tuple[float, int]
+    """
+    start = time.perf_counter()
+    errors = sum(pool.starmap(function, shares))
+    return time.perf_counter() - start, errors
+
+
+def lost_results(tournament_data: dict) -> int:
+    """
+    Counts the matches of the round without result, or whose players'
+    scores do not add up to their results.
+
+    :rtype: int
+    """
+    scores = {player["national_player_number"]: player["score"]
+              for player in tournament_data["players"]}
+    lost = 0
+    for match in tournament_data["rounds"][-1]["matches"]:
+        outcome = MatchResult.from_points(*match["result"])
+        if (outcome is MatchResult.PENDING
+                or [scores[number] for number in match["players"]]
+                != list(match["result"])):
+            lost += 1
+    return lost
+
+
+def load_tournament() -> Union[Tournament, None]:
+    """
+    Loads the tournament as a program opening it would.
+
+    :return: The tournament, or `None` if it cannot be loaded, e.g. when
+        its file or the list of the tournaments in progress was damaged
+        by the writes made without the locks.
+    :rtype: Tournament or None
+    """
+    try:
+        with redirect_stdout(StringIO()):
+            return CommandLineController().load_tournament(TOURNAMENT_NAME)
+    except Exception:
+        return None
+
+
+def run_phases(processes: int,
+               locked: bool,
+               data_directory: str) -> list[tuple]:
+    """
+    Runs the three phases in a pool of processes.
+
+    :return: For each phase, its label, the number of operations, the
+        time taken, the number of updates lost and of errors.
+    :rtype: list[tuple]
+    """
+    measures = []
+    with multiprocessing.Pool(processes, start_worker,
+                              (data_directory, locked)) as pool:
+        numbers = list(range(NEW_PLAYERS))
+        seconds, errors = run_phase(
+            pool, add_players,
+            [(numbers[index::processes],) for index in range(processes)])
+        DataBase.player_registry.signature = None
+        with redirect_stdout(StringIO()):
+            found = len(DataBase.player_registry.all())
+        measures.append(("joueurs", NEW_PLAYERS, seconds,
+                         NEW_PLAYERS - found, errors))
+
+        numbers = list(range(2 * BOARDS))
+        seconds, errors = run_phase(
+            pool, register_players,
+            [(numbers[index::processes],) for index in range(processes)])
+        tournament = load_tournament()
+        if tournament is None:
+            # every registration is counted as lost, and the round is
+            # played by a new tournament replacing the damaged one
+            tournament = Tournament(TOURNAMENT_NAME, "Paris")
+        measures.append(("inscriptions", 2 * BOARDS, seconds,
+                         2 * BOARDS - len(tournament.players), errors))
+
+        # completes the registrations lost without the locks, so that the
+        # round has the same number of matches
+        registered = {player.national_player_number
+                      for player in tournament.players}
+        for number in numbers:
+            if f"cc{number:05d}" not in registered:
+                tournament.add_player(f"cc{number:05d}")
+        tournament.add_round()
+        tournament.rounds[-1].add_match()
+        with redirect_stdout(StringIO()):
+            tournament.save()
+        match_numbers = list(range(1, BOARDS + 1))
+        seconds, errors = run_phase(
+            pool, save_results,
+            [(match_numbers[index::processes], index)
+             for index in range(processes)])
+        try:
+            with redirect_stdout(StringIO()):
+                lost = lost_results(DataBase.read_tournament(
+                    f"{TOURNAMENT_NAME}.json"))
+        # a damaged file loses every result
+        except Exception:
+            lost = BOARDS
+        measures.append(("résultats", BOARDS, seconds, lost, errors))
+    return measures
+
+
+def run_mode(processes: int, locked: bool) -> list[tuple]:
+    """
+    Runs the three phases in a new data directory.
+
+    :return: For each phase, its label, the number of operations, the
+        time taken, the number of updates lost and of errors, then the
+        number of reads and of failed reads.
+    :rtype: list[tuple]
+    """
+    measures = []
+    directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as data_directory:
+        os.chdir(data_directory)
+        try:
+            DataBase.check_existence_json_file(PLAYERS_FILE_PATH)
+            with redirect_stdout(StringIO()):
+                Tournament(TOURNAMENT_NAME, "Paris").save()
+
+            manager = multiprocessing.Manager()
+            stop = manager.Event()
+            counts = manager.list([0, 0])
+            reader = multiprocessing.Process(
+                target=read_files, args=(data_directory, stop, counts))
+            reader.start()
+            try:
+                measures.extend(run_phases(processes, locked,
+                                           data_directory))
+            finally:
+                stop.set()
+                reader.join()
+                measures.append(tuple(counts))
+                manager.shutdown()
+        finally:
+            os.chdir(directory)
+    return measures
+
+
+def run(processes_numbers: list[int]):
+    print(f"{'verrous': >7} {'processus': >9} {'opération': >12}"
+          f" {'nombre': >7} {'durée (s)': >9} {'par seconde': >11}"
+          f" {'perdues': >7} {'erreurs': >7} {'lectures': >8}"
+          f" {'incomplètes': >11}")
+    for processes in processes_numbers:
+        for label, locked in MODES.items():
+            *phases, (reads, failures) = run_mode(processes, locked)
+            for index, (operation, count, seconds, lost, errors) in (
+                    enumerate(phases)):
+                reader = (f" {reads: >8} {failures: >11}" if index == 0
+                          else "")
+                print(f"{label: >7} {processes: >9} {operation: >12}"
+                      f" {count: >7} {seconds: >9.2f}"
+                      f" {count / seconds: >11.0f} {lost: >7}"
+                      f" {errors: >7}{reader}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, nargs="+",
+                        default=PROCESSES)
+    arguments = parser.parse_args()
+    run(arguments.processes)
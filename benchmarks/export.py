@@ -0,0 +1,68 @@
+"""
+Measures the throughput and the peak memory of the report export, for a
+list of 100 000 players and the match results of an archive of 200
+tournaments stored in a SQLite data base. The peak memory of building the
+whole table before writing it is given for comparison.
+
+Run from the root of the project:
+    python -m benchmarks.export
+"""
+import os
+import tempfile
+import tracemalloc
+
+from benchmarks.player_history import generate_archive
+from export import EXPORT_WRITERS, ReportExporter
+from sqlite_database import SQLiteDataBase
+
+PLAYERS_NUMBER = 100_000
+TOURNAMENTS_NUMBER = 200
+
+
+def fill_data_base(data_base: SQLiteDataBase):
+    """Inserts the synthetic players and tournaments."""
+    with data_base.connection:
+        data_base.connection.executemany(
+            "INSERT INTO players VALUES (?, ?, ?, ?, 0)",
+            ((f"cc{number:06d}", f"Nom{number}", f"Prénom{number}",
+              "01/01/2000")
+             for number in range(PLAYERS_NUMBER)))
+    for json_file, tournament_data in generate_archive(
+            TOURNAMENTS_NUMBER).items():
+        tournament_data["name"] = json_file.removesuffix(".json")
+        data_base.insert_tournament(tournament_data)
+
+
+def run():
+    print(f"{'rapport': >8} {'format': >8} {'lignes': >8}"
+          f" {'lignes/s': >10} {'mémoire max (Mo)': >17}")
+    with tempfile.TemporaryDirectory() as directory:
+        data_base = SQLiteDataBase(os.path.join(directory, "export.sqlite3"))
+        fill_data_base(data_base)
+        exporter = ReportExporter(data_base)
+
+        for report in exporter.REPORTS:
+            for export_format in EXPORT_WRITERS:
+                path = os.path.join(directory, f"{report}.{export_format}")
+                result = exporter.export(report, export_format, path)
+
+                # traced apart, as tracing slows the export down
+                tracemalloc.start()
+                exporter.export(report, export_format, path)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{report: >8} {export_format: >8} {result.rows: >8}"
+                      f" {result.rows_per_second: >10.0f}"
+                      f" {peak / 2 ** 20: >17.1f}")
+
+            tracemalloc.start()
+            rows = list(exporter.rows(report))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{report: >8} {'table': >8} {len(rows): >8}"
+                  f" {'': >10} {peak / 2 ** 20: >17.1f}")
+            del rows
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,124 @@
+"""
+Measures the time of each command of the command-line mode while running
+whole tournaments of 16 to 256 players, in a temporary data directory,
+and the cost of clearing the terminal with a shell command, as the menus
+did, compared with writing the escape sequences.
+
+Run from the root of the project:
+    python -m benchmarks.headless_event
+"""
+import io
+import os
+import random
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from main import main
+from models import DataBase, Player
+
+FIELD_SIZES = [16, 64, 256]
+ROUNDS = 7
+CLEARS = 50
+NOTATIONS = ["1-0", "0-1", "1/2-1/2"]
+
+
+def run_command(times: dict, name: str, *arguments: str) -> str:
+    """
+    Runs a command, adding its time to `times[name]`.
+
+    :return: The output of the command.
+    :rtype: str
+    """
+    output = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        status = main(list(arguments))
+    times.setdefault(name, []).append(time.perf_counter() - start)
+    if status:
+        raise RuntimeError(f"{' '.join(arguments)} a échoué.")
+    return output.getvalue()
+
+
+def run_event(size: int, generator: random.Random) -> dict:
+    """
+    Runs a tournament from its creation to its end.
+
+    :param size: The number of players.
+    :type size: int
+    :return: The times of each command, in seconds.
+    :rtype: dict[str, list[float]]
+    """
+    times = {}
+    name = f"Tournoi {size}"
+    run_command(times, "creer", "creer", name, "Paris", "-r", str(ROUNDS))
+    run_command(times, "inscrire", "inscrire", name,
+                *(f"bb{number:05d}" for number in range(size)))
+    for _ in range(ROUNDS):
+        pairings = run_command(times, "ronde", "ronde", name)
+        results_file = "resultats.txt"
+        with open(results_file, "w", encoding="utf-8") as file:
+            for line in pairings.splitlines()[1:]:
+                match_number = line.split("\t")[0]
+                file.write(f"{match_number} {generator.choice(NOTATIONS)}\n")
+        run_command(times, "resultats", "resultats", name, results_file)
+    run_command(times, "terminer", "terminer", name)
+    run_command(times, "exporter", "exporter", "matchs", "csv")
+    return times
+
+
+def time_clears() -> tuple[float, float]:
+    """
+    Returns the mean time of clearing the terminal with the `clear`
+    command, then with the escape sequences, in milliseconds.
+
+    :rtype: tuple[float, float]
+    """
+    start = time.perf_counter()
+    for _ in range(CLEARS):
+        os.system("clear > /dev/null 2>&1")
+    shell_time = (time.perf_counter() - start) / CLEARS * 1e3
+
+    with open(os.devnull, "w") as output:
+        start = time.perf_counter()
+        for _ in range(CLEARS):
+            output.write("\033[H\033[2J\033[3J")
+            output.flush()
+        escape_time = (time.perf_counter() - start) / CLEARS * 1e3
+    return shell_time, escape_time
+
+
+def run():
+    commands = ["creer", "inscrire", "ronde", "resultats", "terminer",
+                "exporter"]
+    print(f"{'joueurs': >8}"
+          + "".join(f" {command + ' (ms)': >15}" for command in commands)
+          + f" {'total (s)': >10}")
+    generator = random.Random(0)
+    directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as data_directory:
+        os.chdir(data_directory)
+        try:
+            with redirect_stdout(io.StringIO()):
+                for number in range(max(FIELD_SIZES)):
+                    DataBase.write_new_player_in_json(Player(
+                        f"bb{number:05d}", f"Nom{number}",
+                        f"Prénom{number}", "01/01/2000"))
+            for size in FIELD_SIZES:
+                times = run_event(size, generator)
+                total = sum(sum(values) for values in times.values())
+                means = [sum(times[command]) / len(times[command]) * 1e3
+                         for command in commands]
+                print(f"{size: >8}"
+                      + "".join(f" {mean: >15.1f}" for mean in means)
+                      + f" {total: >10.2f}")
+        finally:
+            os.chdir(directory)
+
+    shell_time, escape_time = time_clears()
+    print(f"effacement de l'écran : {shell_time:.2f} ms avec `clear`, "
+          f"{escape_time:.4f} ms avec les séquences d'échappement")
+
+
+if __name__ == "__main__":
+    run()
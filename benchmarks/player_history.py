@@ -0,0 +1,111 @@
+"""
+Measures the cost of building the player history index from an archive
+of tournaments, of reading it back from its file, of the first query on a
+player, which sorts its history, and of the history, head-to-head and
+lifetime score queries.
+
+Run from the root of the project:
+    python -m benchmarks.player_history
+"""
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.tournament_load import generate_tournament_data
+from models import DataBase, PlayerHistory
+
+ARCHIVE_SIZES = [10, 100, 1_000]
+FIELD_SIZE = 100
+PLAYERS_POOL = 2_000
+LOOKUPS = 1_000
+
+
+def generate_archive(size: int) -> dict:
+    """
+    Builds the data of finished tournaments whose players are drawn from
+    a pool of `PLAYERS_POOL` players.
+
+    :param size: The number of tournaments.
+    :type size: int
+    :return: The tournament data keyed by tournament file name.
+    :rtype: dict
+    """
+    generator = random.Random(size)
+    archive = {}
+    for number in range(size):
+        data = generate_tournament_data(FIELD_SIZE)
+        numbers = {player["national_player_number"]: f"bb{drawn:05d}"
+                   for player, drawn in zip(data["players"], generator.sample(
+                       range(PLAYERS_POOL), FIELD_SIZE))}
+        for player in data["players"]:
+            player["national_player_number"] = numbers[
+                player["national_player_number"]]
+        for played_round in data["rounds"]:
+            for match in played_round["matches"]:
+                match["players"] = [numbers[player_number]
+                                    for player_number in match["players"]]
+        archive[f"Tournoi {number}.json"] = data
+    return archive
+
+
+def time_queries(data_base: DataBase, players: list[str]) -> list[float]:
+    """
+    Returns the mean time of the first query on each player, then of each
+    query, in microseconds.
+
+    :rtype: list[float]
+    """
+    times = []
+    for query in (lambda player, _: data_base.find_player_history(player),
+                  lambda player, _: data_base.find_player_history(player),
+                  data_base.find_head_to_head,
+                  lambda player, _: data_base.find_lifetime_score(player)):
+        start = time.perf_counter()
+        for player, opponent in zip(players, reversed(players)):
+            query(player, opponent)
+        times.append((time.perf_counter() - start) / len(players) * 1e6)
+    return times
+
+
+def run():
+    print(f"{'tournois': >9} {'index (s)': >10} {'lecture (s)': >12}"
+          f" {'1re requête (µs)': >17} {'historique (µs)': >16}"
+          f" {'face-à-face (µs)': >17} {'score (µs)': >11}")
+    generator = random.Random(0)
+    players = [f"bb{number:05d}"
+               for number in generator.sample(range(PLAYERS_POOL), LOOKUPS)]
+    with tempfile.TemporaryDirectory() as directory:
+        for size in ARCHIVE_SIZES:
+            archive = generate_archive(size)
+            path = os.path.join(directory, f"history_{size}.json")
+
+            start = time.perf_counter()
+            history = PlayerHistory(path)
+            history.games = {}
+            for json_file, data in archive.items():
+                history.add(json_file, data)
+            history.write()
+            build_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            history = PlayerHistory(path)
+            history.read()
+            read_time = time.perf_counter() - start
+
+            # the archive is not written in the data directory, so the
+            # index is not compared with the tournament files
+            history.changes_seen = history.changes
+            data_base = DataBase()
+            data_base.player_history = history
+            (first_time, history_time,
+             head_to_head_time, score_time) = time_queries(data_base,
+                                                           players)
+
+            print(f"{size: >9} {build_time: >10.3f} {read_time: >12.3f}"
+                  f" {first_time: >17.1f} {history_time: >16.1f}"
+                  f" {head_to_head_time: >17.1f} {score_time: >11.1f}")
+
+
+if __name__ == "__main__":
+    run()
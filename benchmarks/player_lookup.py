@@ -0,0 +1,78 @@
+"""
+Measures the cost of looking up players by national player number as the
+players file grows.
+
+Run from the root of the project:
+    python -m benchmarks.player_lookup
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from models import PlayerRegistry
+
+FILE_SIZES = [1_000, 10_000, 50_000]
+LOOKUPS = 300
+
+
+def generate_players_file(path: str, size: int) -> list[str]:
+    """
+    Writes a synthetic players file.
+
+    :param path: The path of the file to write.
+    :type path: str
+    :param size: The number of players to generate.
+    :type size: int
+    :return: The national player numbers written to the file.
+    :rtype: list[str]
+    """
+    players_data = [
+        {"national_player_number": f"aa{number:05d}",
+         "name": f"Nom{number}",
+         "first_name": f"Prenom{number}",
+         "birthday": "01/01/2000",
+         "score": 0}
+        for number in range(size)
+    ]
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(players_data, file, indent=4, ensure_ascii=False)
+    return [data["national_player_number"] for data in players_data]
+
+
+def find_by_parsing(path: str, player_number: str):
+    """Previous behaviour: parse the whole file and scan it."""
+    with open(path, "r", encoding="utf-8") as file:
+        for data in json.load(file):
+            if data["national_player_number"] == player_number:
+                return data
+    return None
+
+
+def run():
+    print(f"{'joueurs': >8} {'parse+scan (s)': >15} {'registre (s)': >13}"
+          f" {'gain': >8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in FILE_SIZES:
+            path = os.path.join(directory, f"players_{size}.json")
+            numbers = random.Random(size).sample(
+                generate_players_file(path, size), LOOKUPS)
+
+            start = time.perf_counter()
+            for number in numbers:
+                find_by_parsing(path, number)
+            parse_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            registry = PlayerRegistry(path)
+            for number in numbers:
+                registry.get(number)
+            registry_time = time.perf_counter() - start
+
+            print(f"{size: >8} {parse_time: >15.4f} {registry_time: >13.4f}"
+                  f" {parse_time / registry_time: >7.0f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,98 @@
+"""
+Measures the player search index on registries of growing size: the time
+to build it, to add a player, and the mean time of prefix and fuzzy
+searches, compared with a scan of every normalized name.
+
+Run from the root of the project:
+    python -m benchmarks.player_search
+"""
+import random
+import time
+
+from search import PlayerSearchIndex, normalize
+
+REGISTRY_SIZES = [1_000, 10_000, 100_000]
+QUERIES = 200
+NAMES = ["Dupont", "Durand", "Lefèvre", "Moreau", "Girard", "Bonnet",
+         "François", "Mercier", "Faure", "Rousseau", "Blanc", "Guérin",
+         "Le Goff", "Nguyen", "Chevalier", "Garnier", "Chrétien", "Lemaître",
+         "Benoît", "Noël", "Perrin", "Brunet", "Gauthier", "Fontaine"]
+SUFFIXES = ["", "ard", "eau", "in", "on", "et", "ier", "ault", "ot", "ès"]
+FIRST_NAMES = ["Jean", "Zoé", "Hélène", "Loïc", "Anaïs", "Jérôme", "Chloé",
+               "Léa", "Noé", "Théo", "Inès", "Maël", "Gaëlle", "Émile",
+               "Cécile", "Hugo", "Lucas", "Manon", "Camille", "Sébastien"]
+
+
+def generate_players(size: int) -> list[dict]:
+    """
+    Builds synthetic players whose names are drawn from French names with
+    accents and suffixes.
+
+    :param size: The number of players.
+    :type size: int
+    :rtype: list[dict]
+    """
+    generator = random.Random(size)
+    return [{"national_player_number": f"dd{number:05d}",
+             "name": (generator.choice(NAMES) + generator.choice(SUFFIXES)
+                      + generator.choice(SUFFIXES)),
+             "first_name": generator.choice(FIRST_NAMES)}
+            for number in range(size)]
+
+
+def misspell(name: str, generator: random.Random) -> str:
+    """Swaps two neighbouring letters of a name."""
+    position = generator.randrange(1, len(name) - 1)
+    return (name[:position - 1] + name[position] + name[position - 1]
+            + name[position + 1:])
+
+
+def scan(players: list[tuple[str, str]], prefix: str) -> list[str]:
+    """Previous behaviour: compare the prefix with every name."""
+    return [number for number, name in players if name.startswith(prefix)]
+
+
+def mean_time(function, queries: list[str]) -> float:
+    """Returns the mean time of a query, in milliseconds."""
+    start = time.perf_counter()
+    for query in queries:
+        function(query)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def run():
+    print(f"{'joueurs': >8} {'index (s)': >10} {'ajout (µs)': >11}"
+          f" {'préfixe (ms)': >13} {'approchée (ms)': >15}"
+          f" {'parcours (ms)': >14}")
+    for size in REGISTRY_SIZES:
+        players = generate_players(size)
+        generator = random.Random(0)
+        drawn = generator.sample(players, QUERIES)
+        prefixes = [normalize(player["name"])[:3] for player in drawn]
+        misspelled = [misspell(player["name"], generator) for player in drawn]
+
+        normalize.cache_clear()
+        start = time.perf_counter()
+        index = PlayerSearchIndex()
+        index.build(players)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for number in range(QUERIES):
+            index.add({"national_player_number": f"ee{number:05d}",
+                       "name": f"Nouveau{number}",
+                       "first_name": "Joueur"})
+        add_time = (time.perf_counter() - start) / QUERIES * 1e6
+
+        normalized = [(player["national_player_number"],
+                       normalize(player["name"])) for player in players]
+        scan_time = mean_time(lambda query: scan(normalized, query),
+                              prefixes)
+        print(f"{size: >8} {build_time: >10.3f} {add_time: >11.1f}"
+              f" {mean_time(index.search, prefixes): >13.2f}"
+              f" {mean_time(index.search, misspelled): >15.2f}"
+              f" {scan_time: >14.2f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,88 @@
+"""
+Measures the time taken to rate an archive of tournaments from scratch,
+with the per round vectorised computation of `RatingEngine` and with a
+loop over the games, then the time taken to rate one more tournament.
+
+Run from the root of the project:
+    python -m benchmarks.ratings
+"""
+import time
+
+from benchmarks.player_history import generate_archive
+from ratings import RatingEngine
+
+# a weekly club tournament for one year, ten years and fifty years
+ARCHIVE_SIZES = [52, 520, 2_600]
+
+
+def rate_with_loop(engine: RatingEngine, archive: dict) -> dict:
+    """
+    Rates an archive game by game, with the K-factors of `engine`.
+
+    :return: The rating and number of games of each player.
+    :rtype: dict
+    """
+    ratings = {}
+    for tournament_data in archive.values():
+        for played_round in tournament_data["rounds"]:
+            changes = []
+            for match in played_round["matches"]:
+                if not any(match["result"]):
+                    continue
+                players = [ratings.setdefault(player_number,
+                                              [engine.initial_rating, 0])
+                           for player_number in match["players"]]
+                expected = 1 / (1 + 10 ** ((players[1][0] - players[0][0])
+                                           / 400))
+                for player, score, expected_score in (
+                        (players[0], match["result"][0], expected),
+                        (players[1], match["result"][1], 1 - expected)):
+                    if player[1] < engine.new_player_games:
+                        k = engine.k_new_player
+                    elif player[0] >= engine.top_rating:
+                        k = engine.k_top_player
+                    else:
+                        k = engine.k
+                    changes.append((player, k * (score - expected_score)))
+            for player, change in changes:
+                player[0] += change
+                player[1] += 1
+    return ratings
+
+
+def run():
+    print(f"{'tournois': >9} {'parties': >9} {'boucle (s)': >11}"
+          f" {'vectorisé (s)': >14} {'+1 tournoi (ms)': >16}"
+          f" {'écart max': >10}")
+    for size in ARCHIVE_SIZES:
+        archive = generate_archive(size + 1)
+        last_file = list(archive)[-1]
+        last_tournament = archive.pop(last_file)
+        games = sum(len(played_round["matches"])
+                    for tournament_data in archive.values()
+                    for played_round in tournament_data["rounds"])
+
+        engine = RatingEngine(path="")
+        start = time.perf_counter()
+        reference = rate_with_loop(engine, archive)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine.recompute(archive.items())
+        vectorised_time = time.perf_counter() - start
+
+        difference = max(abs(engine.rating(player_number) - rating)
+                         for player_number, (rating, _)
+                         in reference.items())
+
+        start = time.perf_counter()
+        engine.rate_tournament(last_tournament)
+        incremental_time = time.perf_counter() - start
+
+        print(f"{size: >9} {games: >9} {loop_time: >11.3f}"
+              f" {vectorised_time: >14.3f} {incremental_time * 1000: >16.2f}"
+              f" {difference: >10.1e}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,187 @@
+"""
+Load generator for the result server: concurrent clients, each with its
+own connection, submit the results of a round of 200 boards, and the
+throughput and the latency of the requests are measured, with the
+results written in batches or one at a time.
+
+By default the server is started in this process, on a synthetic
+tournament stored in a temporary data directory. With `--url`, the
+pending matches of a running server are submitted instead, e.g. from
+another computer of the network.
+
+Run from the root of the project:
+    python -m benchmarks.result_server
+    python -m benchmarks.result_server --clients 8 --url http://127.0.0.1:8080
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from urllib.parse import urlsplit
+
+from models import RESULT_NOTATIONS, Player, Tournament
+from server import ResultServer
+
+BOARDS = 200
+CLIENTS = [1, 4, 16, 64]
+WRITE_MODES = {"par lots": None, "une à une": 0.0}
+
+
+def submit_results(url: str,
+                   match_numbers: list[int],
+                   clients: int,
+                   seed: int = 0) -> dict:
+    """
+    Submits a random result for each match, from several clients at once.
+
+    :param url: The address of the server, e.g. "http://127.0.0.1:8080".
+    :type url: str
+    :param match_numbers: The matches to submit.
+    :type match_numbers: list[int]
+    :param clients: The number of clients, each submitting a share of the
+        matches one after the other.
+    :type clients: int
+    :return: The number of requests, the throughput in requests per
+        second and the latencies in milliseconds.
+    :rtype: dict
+    """
+    address = urlsplit(url)
+    notations = list(RESULT_NOTATIONS)[:3]
+    latencies = []
+    errors = []
+
+    def client(numbers: list[int], generator: random.Random):
+        connection = http.client.HTTPConnection(address.hostname,
+                                                address.port)
+        for match_number in numbers:
+            body = json.dumps({"match_number": match_number,
+                               "result": generator.choice(notations)})
+            start = time.perf_counter()
+            connection.request("POST", "/resultats", body,
+                               {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            if response.status != 200:
+                errors.append(response.status)
+        connection.close()
+
+    threads = [threading.Thread(target=client,
+                                args=(match_numbers[index::clients],
+                                      random.Random(seed + index)))
+               for index in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    return {"requests": len(latencies),
+            "errors": len(errors),
+            "requests_per_second": len(latencies) / seconds,
+            "median_ms": statistics.median(latencies) * 1e3,
+            "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1e3,
+            "max_ms": latencies[-1] * 1e3}
+
+
+def start_tournament(name: str) -> Tournament:
+    """
+    Saves a tournament of `2 * BOARDS` synthetic players and starts its
+    first round.
+
+    :rtype: Tournament
+    """
+    tournament = Tournament(name, "Paris", max_round=5)
+    for number in range(2 * BOARDS):
+        tournament.players.append(Player(f"dd{number:05d}",
+                                         f"Nom{number}",
+                                         f"Prénom{number}",
+                                         "01/01/2000"))
+    with redirect_stdout(StringIO()):
+        tournament.save()
+    tournament.add_round()
+    tournament.rounds[-1].add_match()
+    tournament.record_round_start()
+    return tournament
+
+
+def print_measure(label: str, clients: int, measure: dict, batches: str):
+    print(f"{label: >10} {clients: >8}"
+          f" {measure['requests_per_second']: >10.0f}"
+          f" {measure['median_ms']: >12.2f} {measure['p95_ms']: >10.2f}"
+          f" {measure['max_ms']: >10.2f} {batches: >9}"
+          f" {measure['errors']: >8}")
+
+
+def print_header():
+    print(f"{'écriture': >10} {'clients': >8} {'requêtes/s': >10}"
+          f" {'médiane (ms)': >12} {'p95 (ms)': >10} {'max (ms)': >10}"
+          f" {'écritures': >9} {'erreurs': >8}")
+
+
+def run(clients_numbers: list[int]):
+    print_header()
+    directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as data_directory:
+        os.chdir(data_directory)
+        try:
+            for clients in clients_numbers:
+                for label, delay in WRITE_MODES.items():
+                    tournament = start_tournament(f"Open {label} {clients}")
+                    options = ({} if delay is None
+                               else {"delay": delay, "max_delay": delay})
+                    server = ResultServer(tournament, ("127.0.0.1", 0),
+                                          **options)
+                    server.writer.start()
+                    thread = threading.Thread(target=server.serve_forever)
+                    thread.start()
+
+                    host, port = server.server_address[:2]
+                    measure = submit_results(
+                        f"http://{host}:{port}",
+                        list(range(1, BOARDS + 1)),
+                        clients)
+
+                    server.shutdown()
+                    thread.join()
+                    server.server_close()
+                    server.writer.close()
+                    print_measure(label, clients, measure,
+                                  str(server.writer.batches))
+        finally:
+            os.chdir(directory)
+
+
+def run_remote(url: str, clients: int):
+    address = urlsplit(url)
+    connection = http.client.HTTPConnection(address.hostname, address.port)
+    connection.request("GET", "/ronde")
+    state = json.loads(connection.getresponse().read())
+    connection.close()
+    pending = [match["match_number"] for match in state["matches"]
+               if match["result"] is None]
+    print(f"{state['tournament']}, ronde {state['round_number']} :"
+          f" {len(pending)} résultats à envoyer")
+    print_header()
+    print_measure("serveur", clients,
+                  submit_results(url, pending, clients), "-")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, nargs="+", default=CLIENTS)
+    parser.add_argument("--url", help="adresse d'un serveur déjà lancé")
+    arguments = parser.parse_args()
+    if arguments.url:
+        run_remote(arguments.url, arguments.clients[0])
+    else:
+        run(arguments.clients)
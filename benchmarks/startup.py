@@ -0,0 +1,132 @@
+"""
+Measures the start-up of the application in new interpreters: the time
+to import `main`, the modules taking the longest to import according to
+`python -X importtime`, the time to display the first menu and quit, and
+the time of a command of the command-line mode.
+
+The results are printed and written as JSON, so that two versions of the
+project can be compared.
+
+Run from the root of the project:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeats 5 --output result.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.swiss_pairing import revision
+
+REPEATS = 10
+SLOWEST_MODULES = 10
+OUTPUT_FILE_PATH = "benchmarks/startup_results.json"
+
+
+def run_python(arguments: list[str],
+               directory: str,
+               stdin: str = "") -> tuple[float, str]:
+    """
+    Runs a new interpreter from a directory, with the project importable.
+
+    :return: The time taken in seconds and the standard error output.
+    :rtype: tuple[float, str]
+    """
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.getcwd(), environment.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, *arguments],
+                             cwd=directory,
+                             env=environment,
+                             input=stdin,
+                             capture_output=True,
+                             text=True,
+                             check=True)
+    return time.perf_counter() - start, process.stderr
+
+
+def import_times(report: str) -> dict[str, int]:
+    """
+    Reads the cumulative import time of each module, in microseconds, from
+    the report of `python -X importtime`.
+
+    :rtype: dict[str, int]
+    """
+    times = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def run(repeats: int, output: str):
+    project = os.getcwd()
+    measures = {"interpreter": [], "import_main": [], "first_menu": [],
+                "command": []}
+    with tempfile.TemporaryDirectory() as directory:
+        # compiles the modules once, as an installed application would be
+        run_python(["-c", "import main"], directory)
+        for repeat in range(repeats):
+            measures["interpreter"].append(
+                run_python(["-c", "pass"], directory)[0])
+            measures["import_main"].append(
+                run_python(["-c", "import main"], directory)[0])
+            measures["first_menu"].append(
+                run_python([os.path.join(project, "main.py")], directory,
+                           stdin="4\n")[0])
+            measures["command"].append(
+                run_python([os.path.join(project, "main.py"), "creer",
+                            f"Tournoi {repeat}", "Paris"], directory)[0])
+        report = run_python(["-X", "importtime", "-c", "import main"],
+                            directory)[1]
+
+    medians = {name: statistics.median(times)
+               for name, times in measures.items()}
+    labels = {"interpreter": "interpréteur seul",
+              "import_main": "import de main",
+              "first_menu": "premier menu",
+              "command": "commande creer"}
+    print(f"{'démarrage': >20} {'médiane (ms)': >13} {'min (ms)': >9}")
+    for name, label in labels.items():
+        print(f"{label: >20} {medians[name] * 1e3: >13.1f}"
+              f" {min(measures[name]) * 1e3: >9.1f}")
+
+    times = import_times(report)
+    slowest = sorted(((module, time_us) for module, time_us in times.items()
+                      if module != "main"),
+                     key=lambda item: item[1],
+                     reverse=True)[:SLOWEST_MODULES]
+    print(f"import de main : {times.get('main', 0) / 1e3:.1f} ms,"
+          f" modules les plus longs à importer :")
+    for module, time_us in slowest:
+        print(f"{module: >30} {time_us / 1e3: >8.1f} ms")
+
+    report = {"benchmark": "startup",
+              "date": datetime.now().isoformat(timespec="seconds"),
+              "revision": revision(),
+              "python": platform.python_version(),
+              "repeats": repeats,
+              "median_seconds": medians,
+              "import_main_microseconds": times.get("main", 0),
+              "slowest_imports_microseconds": dict(slowest)}
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4)
+    print(f"Résultats enregistrés dans {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--output", default=OUTPUT_FILE_PATH)
+    arguments = parser.parse_args()
+    run(arguments.repeats, arguments.output)
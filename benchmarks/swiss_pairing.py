@@ -0,0 +1,181 @@
+"""
+Plays full Swiss tournaments on synthetic fields of growing size and
+measures the pairing of each round: the time spent sorting the players
+(`Tournament.add_round`), the time spent pairing them (`Round.add_match`),
+the number of matchings computed (a retry happens when the window graph
+has no complete pairing) and the rounds that could not be paired.
+
+The results are printed and written as JSON, so that two versions of the
+project can be compared.
+
+Run from the root of the project:
+    python -m benchmarks.swiss_pairing
+    python -m benchmarks.swiss_pairing --sizes 10 100 --output result.json
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime
+
+import pairing
+from models import Player, Tournament
+
+FIELD_SIZES = [10, 100, 1_000, 10_000]
+SEED = 2024
+OUTPUT_FILE_PATH = "benchmarks/swiss_pairing_results.json"
+
+
+class MatchingCounter:
+    """compte les couplages calculés"""
+
+    def __init__(self, matching):
+        """
+        Wraps the matching function used by `pairing.pair_players`.
+
+        :param matching: The function to wrap.
+        :type matching: callable
+        """
+        self.matching = matching
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.matching(*args, **kwargs)
+
+
+def generate_players(size: int) -> list[Player]:
+    """
+    Builds a field of synthetic players.
+
+    :param size: The number of players.
+    :type size: int
+    :rtype: list[Player]
+    """
+    return [Player(f"aa{number:05d}",
+                   f"Nom{number}",
+                   f"Prenom{number}",
+                   "01/01/2000")
+            for number in range(size)]
+
+
+def play_round(played_round, generator: random.Random):
+    """
+    Gives a random result to every match of a round, the best ranked
+    player being slightly favoured.
+
+    :param played_round: The round to play.
+    :type played_round: Round
+    :param generator: The seeded random generator.
+    :type generator: random.Random
+    """
+    for match in played_round.matches:
+        match.assign_result(generator.choices(
+            [match.player1, match.player2, "match nul"],
+            weights=[45, 35, 20])[0])
+    played_round.ended()
+
+
+def run_tournament(size: int, seed: int) -> dict:
+    """
+    Plays a Swiss tournament of ceil(log2(size)) rounds without saving it.
+
+    :param size: The number of players.
+    :type size: int
+    :param seed: The seed of the random generator.
+    :type seed: int
+    :return: The measures of the tournament and of each of its rounds.
+    :rtype: dict
+    """
+    generator = random.Random(seed + size)
+    random.seed(seed + size)
+    tournament = Tournament(f"Tournoi de {size} joueurs", "Benchmark")
+    tournament.players = generate_players(size)
+    tournament.max_round = max(1, math.ceil(math.log2(size)))
+
+    counter = MatchingCounter(pairing.max_weight_matching)
+    pairing.max_weight_matching = counter
+    rounds = []
+    try:
+        for _ in range(tournament.max_round):
+            start = time.perf_counter()
+            tournament.add_round()
+            sort_time = time.perf_counter() - start
+
+            calls = counter.calls
+            start = time.perf_counter()
+            tournament.rounds[-1].add_match()
+            pairing_time = time.perf_counter() - start
+
+            paired = len(tournament.rounds[-1].matches) == size // 2
+            rounds.append({"round": tournament.round_number,
+                           "sort_seconds": sort_time,
+                           "pairing_seconds": pairing_time,
+                           "matchings": counter.calls - calls,
+                           "paired": paired})
+            if not paired:
+                break
+            play_round(tournament.rounds[-1], generator)
+    finally:
+        pairing.max_weight_matching = counter.matching
+
+    pairing_times = [measure["pairing_seconds"] for measure in rounds]
+    return {"players": size,
+            "rounds_planned": tournament.max_round,
+            "rounds_played": len(rounds),
+            "retries": sum(measure["matchings"] - 1 for measure in rounds),
+            "failures": sum(not measure["paired"] for measure in rounds),
+            "failure_rate": (sum(not measure["paired"] for measure in rounds)
+                             / len(rounds)),
+            "pairing_seconds_total": sum(pairing_times),
+            "pairing_seconds_max": max(pairing_times),
+            "rounds": rounds}
+
+
+def revision() -> str:
+    """Returns the current git revision, or an empty string."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run(sizes: list[int], seed: int, output: str):
+    print(f"{'joueurs': >8} {'tours': >6} {'tri max (s)': >12}"
+          f" {'appariement max (s)': >20} {'total (s)': >10}"
+          f" {'reprises': >9} {'échecs': >7}")
+    results = []
+    for size in sizes:
+        result = run_tournament(size, seed)
+        results.append(result)
+        sort_max = max(measure["sort_seconds"]
+                       for measure in result["rounds"])
+        print(f"{size: >8} {result['rounds_played']: >6}"
+              f" {sort_max: >12.4f}"
+              f" {result['pairing_seconds_max']: >20.4f}"
+              f" {result['pairing_seconds_total']: >10.4f}"
+              f" {result['retries']: >9} {result['failures']: >7}")
+
+    report = {"benchmark": "swiss_pairing",
+              "date": datetime.now().isoformat(timespec="seconds"),
+              "revision": revision(),
+              "python": platform.python_version(),
+              "seed": seed,
+              "results": results}
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4)
+    print(f"Résultats enregistrés dans {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=FIELD_SIZES)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", default=OUTPUT_FILE_PATH)
+    arguments = parser.parse_args()
+    run(arguments.sizes, arguments.seed, arguments.output)
@@ -0,0 +1,188 @@
+"""
+Measures the time taken by Tournament.load and the memory held by the
+loaded tournament, for tournaments of growing size, in the current file
+format, in the legacy format and with packed rounds. Then measures the
+memory held by an archive of tournaments played by the same players.
+
+Run from the root of the project:
+    python -m benchmarks.tournament_load
+"""
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from models import (Player,
+                    Tournament,
+                    LEGACY_TIMESTAMP_FORMAT,
+                    TOURNAMENT_FORMAT_VERSION,
+                    encode_timestamp)
+
+FIELD_SIZES = [10, 100, 1_000, 5_000]
+ROUNDS = 11
+ARCHIVE_TOURNAMENTS = 20
+ARCHIVE_FIELD_SIZE = 1_000
+
+
+def generate_tournament_data(size: int, legacy: bool = False) -> dict:
+    """
+    Builds the data of a finished tournament with random pairings and
+    results.
+
+    :param size: The number of players.
+    :type size: int
+    :param legacy: If True, the data is built in the legacy format where
+        matches embed the players and dates are "dd-mm-yyyy HH:MM".
+    :type legacy: bool
+    :rtype: dict
+    """
+    generator = random.Random(size)
+    start = datetime(2024, 9, 6, 9, 0)
+
+    def timestamp(value):
+        if legacy:
+            return value.strftime(LEGACY_TIMESTAMP_FORMAT)
+        return encode_timestamp(value)
+
+    players = [{"national_player_number": f"aa{number:05d}",
+                "name": f"Nom{number}",
+                "first_name": f"Prenom{number}",
+                "birthday": "01/01/2000",
+                "score": 0}
+               for number in range(size)]
+
+    rounds = []
+    rounds_number = min(ROUNDS, size - 1)
+    for round_number in range(1, rounds_number + 1):
+        order = players[:]
+        generator.shuffle(order)
+        matches = []
+        for index in range(0, size, 2):
+            player1, player2 = order[index], order[index + 1]
+            result = generator.choice([[1, 0], [0, 1], [0.5, 0.5]])
+            if legacy:
+                matches.append({
+                    "match_number": index // 2 + 1,
+                    "player1": dict(player1),
+                    "player2": dict(player2),
+                    "result": [["Payer1", result[0]], ["Player2", result[1]]]
+                })
+            else:
+                matches.append({
+                    "match_number": index // 2 + 1,
+                    "players": [player1["national_player_number"],
+                                player2["national_player_number"]],
+                    "result": result
+                })
+        round_start = start + timedelta(hours=round_number)
+        rounds.append({"name": f"round {round_number}",
+                       "round_number": round_number,
+                       "start_time": timestamp(round_start),
+                       "end_time": timestamp(round_start
+                                             + timedelta(minutes=50)),
+                       "matches": matches})
+
+    data = {"name": f"Tournoi de {size} joueurs",
+            "place": "Cannes",
+            "description": "",
+            "start_date": timestamp(start),
+            "end_date": timestamp(start + timedelta(hours=12)),
+            "round_number": rounds_number,
+            "max_round": rounds_number,
+            "players": players,
+            "rounds": rounds}
+    if not legacy:
+        data["version"] = TOURNAMENT_FORMAT_VERSION
+    return data
+
+
+def time_load(data: dict, packed: bool = False) \
+        -> tuple[float, float, float]:
+    """
+    Returns the time taken to parse the JSON text of a tournament and to
+    load it into a `Tournament`, and the memory held by the tournament
+    once loaded, in megabytes.
+
+    :param data: The tournament data.
+    :type data: dict
+    :param packed: If True, the rounds are loaded as `PackedRound`.
+    :type packed: bool
+    :rtype: tuple[float, float, float]
+    """
+    text = json.dumps(data)
+
+    start = time.perf_counter()
+    loaded_data = json.loads(text)
+    parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tournament = Tournament(loaded_data["name"], loaded_data["place"])
+    tournament.load(loaded_data, packed)
+    load_time = time.perf_counter() - start
+
+    loaded_data = json.loads(text)
+    tracemalloc.start()
+    tournament = Tournament(loaded_data["name"], loaded_data["place"])
+    tournament.load(loaded_data, packed)
+    memory = tracemalloc.get_traced_memory()[0] / 1024 ** 2
+    tracemalloc.stop()
+
+    return parse_time, load_time, memory
+
+
+def measure_archive(packed: bool) -> tuple[float, int]:
+    """
+    Loads `ARCHIVE_TOURNAMENTS` tournaments played by the same
+    `ARCHIVE_FIELD_SIZE` players, as `DataBase.read_tournament` would,
+    the file data being dropped once loaded.
+
+    :param packed: If True, the rounds are loaded as `PackedRound`.
+    :type packed: bool
+    :return: The memory held by the tournaments, in megabytes, and the
+        number of player identities in memory.
+    :rtype: tuple[float, int]
+    """
+    texts = []
+    for number in range(ARCHIVE_TOURNAMENTS):
+        data = generate_tournament_data(ARCHIVE_FIELD_SIZE)
+        data["name"] = f"Tournoi {number}"
+        random.Random(number).shuffle(data["players"])
+        texts.append(json.dumps(data))
+
+    tracemalloc.start()
+    tournaments = []
+    for text in texts:
+        data = json.loads(text)
+        tournaments.append(Tournament(data["name"], data["place"]))
+        tournaments[-1].load(data, packed)
+        del data
+    memory = tracemalloc.get_traced_memory()[0] / 1024 ** 2
+    tracemalloc.stop()
+    return memory, len(Player.identities)
+
+
+def run():
+    print(f"{'joueurs': >8} {'format': >10} {'taille (ko)': >12}"
+          f" {'json (s)': >9} {'load (s)': >9} {'mémoire (Mo)': >13}")
+    for size in FIELD_SIZES:
+        for label, legacy, packed in (("v3", False, False),
+                                      ("v1", True, False),
+                                      ("v3 packed", False, True)):
+            data = generate_tournament_data(size, legacy)
+            kilobytes = len(json.dumps(data, indent=4)) / 1024
+            parse_time, load_time, memory = time_load(data, packed)
+            print(f"{size: >8} {label: >10}"
+                  f" {kilobytes: >12.0f} {parse_time: >9.4f}"
+                  f" {load_time: >9.4f} {memory: >13.2f}")
+
+    print(f"\n{ARCHIVE_TOURNAMENTS} tournois de {ARCHIVE_FIELD_SIZE}"
+          f" joueurs identiques")
+    for label, packed in (("v3", False), ("v3 packed", True)):
+        memory, identities = measure_archive(packed)
+        print(f"{label: >10} {memory: >8.2f} Mo"
+              f" {identities: >6} identités de joueurs")
+
+
+if __name__ == "__main__":
+    run()
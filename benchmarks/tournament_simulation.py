@@ -0,0 +1,63 @@
+"""
+Measures the number of simulations per second of `simulate_tournament`
+on Swiss tournaments stopped halfway, with one process and with one
+process per CPU core.
+
+Run from the root of the project:
+    python -m benchmarks.tournament_simulation
+"""
+import math
+import os
+import random
+
+from benchmarks.swiss_pairing import generate_players, play_round
+from models import Tournament
+from ratings import RatingEngine
+from simulation import simulate_tournament
+
+FIELD_SIZES = [16, 64, 256]
+SIMULATIONS = 200
+SEED = 2024
+
+
+def halfway_tournament(size: int) -> Tournament:
+    """
+    Plays the first half of the rounds of a Swiss tournament.
+
+    :param size: The number of players.
+    :type size: int
+    :rtype: Tournament
+    """
+    generator = random.Random(SEED + size)
+    random.seed(SEED + size)
+    tournament = Tournament(f"Tournoi de {size} joueurs", "Benchmark")
+    tournament.players = generate_players(size)
+    tournament.max_round = max(2, math.ceil(math.log2(size)))
+    for _ in range(tournament.max_round // 2):
+        tournament.add_round()
+        tournament.rounds[-1].add_match()
+        play_round(tournament.rounds[-1], generator)
+    return tournament
+
+
+def run():
+    cores = os.cpu_count() or 1
+    print(f"{'joueurs': >8} {'tours restants': >15}"
+          f" {'1 processus (sim/s)': >20}"
+          f" {f'{cores} processus (sim/s)': >20}")
+    ratings = RatingEngine(path="")
+    for size in FIELD_SIZES:
+        tournament = halfway_tournament(size)
+        speeds = [simulate_tournament(tournament,
+                                      SIMULATIONS,
+                                      workers,
+                                      SEED,
+                                      ratings).simulations_per_second
+                  for workers in (1, cores)]
+        print(f"{size: >8}"
+              f" {tournament.max_round - tournament.round_number: >15}"
+              f" {speeds[0]: >20.1f} {speeds[1]: >20.1f}")
+
+
+if __name__ == "__main__":
+    run()
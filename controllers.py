@@ -1,19 +1,29 @@
-import json
-from typing import Union
+import re
+import sys
+from typing import Iterable, Union
 
-from models import Tournament, Player, DataBase
-from settings import PLAYERS_FILE_PATH
-from views import TournamentView, DataBaseView, ApplicationView
+from autosave import TournamentSaver
+from export import ReportExporter
+from models import (Tournament, Player, MatchResult, DataBase,
+                    RESULT_NOTATIONS, open_data_base)
+from views import (TournamentView, DataBaseView, ApplicationView,
+                   CommandLineView)
+
+# ratings and simulation compute with numpy, which takes longer to import
+# than the rest of the application: they are imported when first used
 
 
 class MainController:
 
     def __init__(self):
-        self.tournament_view = TournamentView()
-        self.data_base = DataBase()
+        self.data_base = open_data_base()
         self.data_base_view = DataBaseView()
         self.application_view = ApplicationView()
-        self.reload_data_base = ReloadDataBase()
+        self.tournament_view = TournamentView(self.data_base_view,
+                                              self.application_view)
+        self.reload_data_base = ReloadDataBase(self.data_base,
+                                               self.data_base_view,
+                                               self.application_view)
 
     def run(self):
         """
@@ -101,16 +111,23 @@ class MainController:
                             current state.
         :type tournament: Tournament
         """
-        # add players
-        while True:
-            players_boarding_over = (
-                self.register_players_to_tournament(tournament))
-            # run rounds
-            if players_boarding_over:
-                self.run_rounds_tournament(tournament)
-                break
-            else:
-                break
+        # the tournament is saved in the background while its menus are
+        # used, and at once when they are left
+        saver = TournamentSaver(tournament)
+        saver.start()
+        try:
+            # add players
+            while True:
+                players_boarding_over = (
+                    self.register_players_to_tournament(tournament))
+                # run rounds
+                if players_boarding_over:
+                    self.run_rounds_tournament(tournament)
+                    break
+                else:
+                    break
+        finally:
+            saver.close()
 
     def run_rounds_tournament(self, tournament):
         """
@@ -123,19 +140,23 @@ class MainController:
         :type tournament: Tournament
         """
 
+        from ratings import RatingEngine
+
         while True:
 
             if tournament.round_number != tournament.max_round:
                 if (len(tournament.rounds) == 0
                         or tournament.rounds[-1].end_time):
 
-                    self.add_round_to_tournament(tournament)
-                    tournament.save()
+                    with tournament.lock:
+                        self.add_round_to_tournament(tournament)
+                        tournament.record_round_start()
 
                     if (len(tournament.rounds[-1].matches) !=
                             len(tournament.players) / 2):
                         self.tournament_view.display_matches_creation_error_message()  # noqa: E501
                         tournament.ended()
+                        RatingEngine().update(self.data_base)
                         self.tournament_view.display_tournament_ended(
                             tournament)
                         break
@@ -143,7 +164,7 @@ class MainController:
             elif tournament.rounds[-1].end_time:
 
                 tournament.ended()
-                tournament.save()
+                RatingEngine().update(self.data_base)
                 self.application_view.clear_console()
                 self.tournament_view.display_tournament_ended(tournament)
                 break
@@ -155,7 +176,11 @@ class MainController:
             option = self.application_view.choose_option()
             if option == "1":  # Enter the results of matches
                 self.validate_results(tournament)
-            elif option == "2":  # return
+            elif option == "2":  # chances of the players
+                from simulation import simulate_tournament
+                self.tournament_view.display_simulation(
+                    simulate_tournament(tournament))
+            elif option == "3":  # return
                 tournament.save()
                 break
             else:
@@ -249,11 +274,13 @@ class MainController:
                     break
 
             if not already_registered_player:
-                player = tournament.add_player(player_number)
+                with tournament.lock:
+                    player = tournament.add_player(player_number)
 
                 if not player:
                     self.reload_data_base.create_new_player(player_number)
-                    tournament.add_player(player_number)
+                    with tournament.lock:
+                        tournament.add_player(player_number)
 
     @staticmethod
     def add_round_to_tournament(tournament: Tournament):
@@ -276,12 +303,11 @@ class MainController:
 
         """
         while not tournament.rounds[-1].end_time:
-            tournament.save()
             self.application_view.clear_console()
             match_without_result = 0
 
             for match in tournament.rounds[-1].matches:
-                if match.result == [(match.player1, 0), (match.player2, 0)]:
+                if match.outcome is MatchResult.PENDING:
                     match_without_result += 1
 
             if match_without_result == 0:
@@ -292,7 +318,10 @@ class MainController:
                 TournamentView.display_valid_result()
                 option = self.application_view.choose_option()
                 if option == "1":  # the user validates the results
-                    tournament.rounds[-1].ended()
+                    with tournament.lock:
+                        tournament.rounds[-1].ended()
+                        tournament.record_round_end()
+                    tournament.flush()
                     break
 
             self.application_view.clear_console()
@@ -305,22 +334,27 @@ class MainController:
                 match = tournament.rounds[-1].matches[int(match_number) - 1]
                 TournamentView.display_assign_match_result(match)
                 result = self.application_view.choose_option()
-                if result == "1":
-                    match.result = match.assign_result(match.player1)
-                elif result == "2":
-                    match.result = match.assign_result(match.player2)
-                elif result == "3":
-                    match.result = match.assign_result()
+                winners = {"1": match.player1,
+                           "2": match.player2,
+                           "3": "match nul"}
+                if result not in winners:
+                    continue
+                with tournament.lock:
+                    match.result = match.assign_result(winners[result])
+                    tournament.record_result(tournament.rounds[-1], match)
             else:
                 break
 
 
 class ReloadDataBase:
 
-    def __init__(self):
-        self.data_base_view = DataBaseView()
-        self.application_view = ApplicationView()
-        self.data_base = DataBase()
+    def __init__(self,
+                 data_base: Union[DataBase, None] = None,
+                 data_base_view: Union[DataBaseView, None] = None,
+                 application_view: Union[ApplicationView, None] = None):
+        self.data_base_view = data_base_view or DataBaseView()
+        self.application_view = application_view or ApplicationView()
+        self.data_base = data_base or open_data_base()
 
     def add_player_database(self):
         """
@@ -343,7 +377,8 @@ class ReloadDataBase:
             players_number = self.data_base_view.ask_national_player_number()
 
             for player_number in players_number:
-                found_player = DataBase().find_player_in_json(player_number)
+                found_player = self.data_base.find_player_in_json(
+                    player_number)
 
                 if found_player:
                     player = Player(found_player["national_player_number"],
@@ -380,7 +415,7 @@ class ReloadDataBase:
         """
         data = self.data_base_view.player_not_in_database(player_number)
         new_player = Player(**data)
-        DataBase.write_new_player_in_json(new_player)
+        self.data_base.write_new_player_in_json(new_player)
         self.data_base_view.display_players_list(
             [new_player],
             "Nouveau joueur")
@@ -396,6 +431,8 @@ class ReloadDataBase:
             player number or name.
         - View details of completed tournaments, including rounds and
             participants.
+        - Export the list of players or the results of the matches to a
+            file.
         """
 
         while True:
@@ -404,31 +441,21 @@ class ReloadDataBase:
             option = self.application_view.choose_option()
 
             if option == "1":  # Joueurs enregistrés
-                json_file = PLAYERS_FILE_PATH
-                DataBase.check_existence_json_file(json_file)
+                self.application_view.clear_console()
+                self.data_base_view.display_menu_registered_players()
+                option = self.application_view.choose_option()
 
-                with (open(json_file, "r", encoding="utf-8") as file):
-                    players_data = json.load(file)
-                    players = [Player(**data) for data in players_data]
-                    self.application_view.clear_console()
-                    self.data_base_view.display_menu_registered_players()
-                    option = self.application_view.choose_option()
-
-                    if option == "1":  # sorted by national player number
-                        sorted_players = self.data_base.sort_players(
-                            players,
-                            "national_player_number"
-                        )
-                        title = "Liste des joueurs classée par leur numéro"
-                    elif option == "2":  # sorted by name
-                        title = "Liste des joueurs classée par leur nom"
-                        sorted_players = self.data_base.sort_players(players)
-                    self.application_view.clear_console()
-                    self.data_base_view.display_players_list(
-                        sorted_players,
-                        title
-                    )
-                    self.application_view.break_point()
+                if option == "1":  # sorted by national player number
+                    criterion = "national_player_number"
+                    title = "Liste des joueurs classée par leur numéro"
+                elif option == "2":  # sorted by name
+                    criterion = "name"
+                    title = "Liste des joueurs classée par leur nom"
+                else:
+                    continue
+                self.data_base_view.browse_players(self.data_base,
+                                                   criterion,
+                                                   title)
 
             elif option == "2":  # Tournois enregistrés
                 loaded_tournament = self.reload_tournament()
@@ -442,9 +469,34 @@ class ReloadDataBase:
                     self.application_view.clear_console()
                     self.data_base_view.display_all_tournament(tournament)
 
+            elif option == "3":  # export the reports
+                self.export_reports()
+
             else:
                 break
 
+    def export_reports(self):
+        """
+        Asks for a report and a file format, then writes the report to a
+        file of the exports directory.
+        """
+        self.application_view.clear_console()
+        self.data_base_view.display_menu_export_report()
+        report = {"1": "joueurs",
+                  "2": "matchs"}.get(self.application_view.choose_option())
+        if report is None:
+            return
+
+        self.data_base_view.display_menu_export_format()
+        formats = {"1": "csv", "2": "jsonl", "3": "html"}
+        export_format = formats.get(self.application_view.choose_option())
+        if export_format is None:
+            return
+
+        result = ReportExporter(self.data_base).export(report, export_format)
+        self.data_base_view.display_export_done(result)
+        self.application_view.break_point()
+
     def reload_tournament(self, criterion: str = "all") -> Union[dict, None]:
         """
         Reloads a tournament based on the specified criterion and
@@ -460,10 +512,309 @@ class ReloadDataBase:
         :rtype: dict
         :raises IndexError: If the user selects an invalid index from the list.
         """
-        tournaments = DataBase().find_tournaments(criterion)
+        tournaments = self.data_base.find_tournaments(criterion)
         index = self.data_base_view.display_reload_tournament(tournaments)
         if index != "":
-            loaded_tournament = tournaments[int(index) - 1]
+            loaded_tournament = self.data_base.read_tournament(
+                tournaments[int(index) - 1]["file"])
             return loaded_tournament
         else:
             return
+
+
+class CommandLineController:
+
+    def __init__(self):
+        self.data_base = open_data_base()
+        self.command_line_view = CommandLineView()
+
+    def load_tournament(self, name: str) -> Tournament:
+        """
+        Loads a tournament that has not ended.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :rtype: Tournament
+        :raises ValueError: If no tournament in progress has this name.
+        """
+        for header in self.data_base.find_tournaments("no_ended"):
+            if header["name"] == name:
+                loaded_tournament = self.data_base.read_tournament(
+                    header["file"])
+                if loaded_tournament is None:
+                    break
+                tournament = Tournament(loaded_tournament["name"],
+                                        loaded_tournament["place"])
+                tournament.load(loaded_tournament)
+                return tournament
+        raise ValueError(f"Aucun tournoi en cours ne s'appelle « {name} ».")
+
+    def create_tournament(self,
+                          name: str,
+                          place: str,
+                          description: str = "",
+                          max_round: int = 4):
+        """
+        Creates and saves a new tournament.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :param place: The location where the tournament is held.
+        :type place: str
+        :param description: A brief description of the tournament.
+        :type description: str
+        :param max_round: The number of rounds.
+        :type max_round: int
+        :raises ValueError: If a tournament already has this name, or if
+            the number of rounds is not positive.
+        """
+        if any(header["name"] == name
+               for header in self.data_base.find_tournaments()):
+            raise ValueError(f"Le tournoi « {name} » existe déjà.")
+        if max_round < 1:
+            raise ValueError("Le nombre de rondes doit être positif.")
+
+        tournament = Tournament(name, place, description, max_round)
+        tournament.save()
+        self.command_line_view.display_tournament_created(tournament)
+
+    def register_players(self, name: str, player_numbers: list[str]):
+        """
+        Registers players to a tournament whose first round has not
+        started. Either every player is registered, or none of them.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :param player_numbers: The national player numbers of players
+            already recorded in the data base.
+        :type player_numbers: list[str]
+        :raises ValueError: If the first round has started, or if a number
+            is malformed or unknown.
+        """
+        tournament = self.load_tournament(name)
+        if tournament.rounds:
+            raise ValueError("Les inscriptions sont closes : la première "
+                             "ronde a commencé.")
+
+        player_numbers = [player_number.lower()
+                          for player_number in player_numbers]
+        malformed = [player_number for player_number in player_numbers
+                     if not re.match(r"^[a-z]{2}\d{5}$", player_number)]
+        if malformed:
+            raise ValueError(f"Numéros invalides : {', '.join(malformed)}.")
+        unknown = [player_number for player_number in player_numbers
+                   if self.data_base.find_player_in_json(player_number)
+                   is None]
+        if unknown:
+            raise ValueError(f"Joueurs inconnus : {', '.join(unknown)}.")
+
+        registered = {player.national_player_number
+                      for player in tournament.players}
+        added = []
+        already_registered = []
+        for player_number in player_numbers:
+            if player_number in registered:
+                already_registered.append(player_number)
+            else:
+                tournament.add_player(player_number)
+                registered.add(player_number)
+                added.append(player_number)
+        tournament.save()
+        self.command_line_view.display_registered_players(tournament,
+                                                          added,
+                                                          already_registered)
+
+    def start_round(self, name: str):
+        """
+        Starts the next round of a tournament and lists its pairings.
+
+        The checks of the interactive mode apply: the previous round must
+        be over, and before the first round, the number of players must
+        be even and greater than the number of rounds. As in the
+        interactive mode, the tournament ends if no pairing avoids a
+        rematch.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :raises ValueError: If the round cannot start.
+        """
+        tournament = self.load_tournament(name)
+        if tournament.rounds and not tournament.rounds[-1].end_time:
+            raise ValueError(f"La ronde {tournament.round_number} n'est pas "
+                             "terminée.")
+        if tournament.round_number >= tournament.max_round:
+            raise ValueError("Toutes les rondes ont été jouées, le tournoi "
+                             "peut être terminé.")
+        if not tournament.rounds:
+            if len(tournament.players) % 2 != 0:
+                raise ValueError("Le nombre de joueurs inscrits n'est pas "
+                                 "pair.")
+            if len(tournament.players) < tournament.max_round + 1:
+                raise ValueError(f"Il faut au moins "
+                                 f"{tournament.max_round + 1} joueurs pour "
+                                 f"{tournament.max_round} rondes.")
+            if len(tournament.players) < 2 * tournament.max_round:
+                self.command_line_view.display_warning(
+                    "peu de joueurs pour ce nombre de rondes, certains "
+                    "appariements pourraient être impossibles.")
+
+        MainController.add_round_to_tournament(tournament)
+        tournament.record_round_start()
+        if len(tournament.rounds[-1].matches) != len(tournament.players) / 2:
+            from ratings import RatingEngine
+            tournament.ended()
+            RatingEngine().update(self.data_base)
+            raise ValueError("Aucun appariement n'évite de faire rejouer "
+                             "deux joueurs : le tournoi est terminé.")
+        self.command_line_view.display_pairings(tournament.rounds[-1])
+
+    @staticmethod
+    def read_results(lines: Iterable[str]) -> dict[int, MatchResult]:
+        """
+        Reads the results of matches, one per line: the match number then
+        the result, in a notation of `RESULT_NOTATIONS`, e.g. "3 1/2-1/2".
+        Empty lines and lines starting with "#" are ignored.
+
+        :param lines: The lines to read.
+        :type lines: Iterable[str]
+        :return: The result of each match, keyed by match number.
+        :rtype: dict[int, MatchResult]
+        :raises ValueError: If a line is malformed, or if a match appears
+            twice.
+        """
+        results = {}
+        for line_number, line in enumerate(lines, 1):
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            if (len(fields) != 2 or not fields[0].isdigit()
+                    or fields[1] not in RESULT_NOTATIONS):
+                raise ValueError(f"Ligne {line_number} invalide : "
+                                 f"« {line.strip()} ».")
+            match_number = int(fields[0])
+            if match_number in results:
+                raise ValueError(f"Ligne {line_number} : le match "
+                                 f"{match_number} apparaît deux fois.")
+            results[match_number] = RESULT_NOTATIONS[fields[1]]
+        return results
+
+    def submit_results(self, name: str, path: str):
+        """
+        Assigns the results read from a file to the matches of the current
+        round, see `read_results`. The round ends once every match has a
+        result.
+
+        The whole file is checked before any result is assigned.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :param path: The path to the file, or "-" for the standard input.
+        :type path: str
+        :raises ValueError: If no round is in progress, or if a result is
+            invalid or already assigned.
+        """
+        if path == "-":
+            results = self.read_results(sys.stdin)
+        else:
+            with open(path, "r", encoding="utf-8") as file:
+                results = self.read_results(file)
+
+        tournament = self.load_tournament(name)
+        if not tournament.rounds or tournament.rounds[-1].end_time:
+            raise ValueError("Aucune ronde n'est en cours.")
+        current_round = tournament.rounds[-1]
+        for match_number in results:
+            if not 1 <= match_number <= len(current_round.matches):
+                raise ValueError(f"La ronde {current_round.round_number} "
+                                 f"n'a pas de match {match_number}.")
+            match = current_round.matches[match_number - 1]
+            if match.outcome is not MatchResult.PENDING:
+                raise ValueError(f"Le résultat du match {match_number} est "
+                                 "déjà enregistré.")
+
+        for match_number, outcome in results.items():
+            match = current_round.matches[match_number - 1]
+            match.assign_outcome(outcome)
+            tournament.record_result(current_round, match)
+
+        if all(match.outcome is not MatchResult.PENDING
+               for match in current_round.matches):
+            current_round.ended()
+            tournament.record_round_end()
+        self.command_line_view.display_recorded_results(current_round,
+                                                        len(results))
+
+    def serve_results(self, name: str, host: str, port: int):
+        """
+        Receives the results of the current round of a tournament from
+        several arbiters at once, see `server.ResultServer`, until
+        interrupted with Ctrl+C.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :param host: The address to listen on.
+        :type host: str
+        :param port: The port to listen on.
+        :type port: int
+        :raises ValueError: If no round is in progress.
+        """
+        from server import ResultServer
+
+        tournament = self.load_tournament(name)
+        if not tournament.rounds or tournament.rounds[-1].end_time:
+            raise ValueError("Aucune ronde n'est en cours.")
+        server = ResultServer(tournament, (host, port))
+        self.command_line_view.display_server_started(server)
+        server.serve()
+        self.command_line_view.display_server_stopped(server)
+
+    def end_tournament(self, name: str):
+        """
+        Ends a tournament, updates the ratings and lists the final
+        ranking.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :raises ValueError: If no round has been played, or if the last
+            round is not over.
+        """
+        tournament = self.load_tournament(name)
+        if not tournament.rounds:
+            raise ValueError("Aucune ronde n'a été jouée.")
+        if not tournament.rounds[-1].end_time:
+            raise ValueError(f"La ronde {tournament.round_number} n'est pas "
+                             "terminée.")
+        from ratings import RatingEngine
+        tournament.ended()
+        RatingEngine().update(self.data_base)
+        self.command_line_view.display_final_ranking(tournament)
+
+    def export_report(self,
+                      report: str,
+                      export_format: str,
+                      path: Union[str, None] = None,
+                      criterion: Union[str, None] = None):
+        """
+        Exports a report to a file, see `ReportExporter.export`.
+
+        :param report: The report: "joueurs" or "matchs".
+        :type report: str
+        :param export_format: The file format: "csv", "jsonl" or "html".
+        :type export_format: str
+        :param path: The path of the file.
+        :type path: str or None
+        :param criterion: The sort order of the players, or the
+            tournaments of the matches.
+        :type criterion: str or None
+        :raises ValueError: If the criterion does not apply to the report.
+        """
+        criteria = {"joueurs": ("national_player_number", "name"),
+                    "matchs": ("all", "ended", "no_ended")}
+        if criterion is not None and criterion not in criteria[report]:
+            raise ValueError(f"Le rapport {report} accepte les critères "
+                             f"{', '.join(criteria[report])}.")
+        result = ReportExporter(self.data_base).export(report,
+                                                       export_format,
+                                                       path,
+                                                       criterion)
+        self.command_line_view.display_export_done(result)
@@ -0,0 +1,276 @@
+import csv
+import html
+import json
+import os
+import time
+from typing import Iterable, Iterator, NamedTuple, TextIO, Union
+
+from models import DataBase, half_points_to_score, open_data_base
+from settings import EXPORT_DIRECTORY
+
+PLAYER_COLUMNS = [("national_player_number", "N.P.N."),
+                  ("name", "Nom"),
+                  ("first_name", "Prénom"),
+                  ("birthday", "Date de naissance")]
+
+MATCH_COLUMNS = [("tournament", "Tournoi"),
+                 ("start_date", "Date"),
+                 ("round_number", "Ronde"),
+                 ("match_number", "Match"),
+                 ("player1", "N.P.N. 1"),
+                 ("name1", "Nom 1"),
+                 ("first_name1", "Prénom 1"),
+                 ("score1", "Score 1"),
+                 ("player2", "N.P.N. 2"),
+                 ("name2", "Nom 2"),
+                 ("first_name2", "Prénom 2"),
+                 ("score2", "Score 2")]
+
+
+def write_csv(file: TextIO, columns: list, rows: Iterable[tuple]) -> int:
+    """
+    Writes rows as CSV, separated by semicolons as expected by
+    spreadsheets in French.
+
+    :param file: The file to write to.
+    :type file: TextIO
+    :param columns: The key and label of each column.
+    :type columns: list[tuple[str, str]]
+    :param rows: The rows, one value per column.
+    :type rows: Iterable[tuple]
+    :return: The number of rows written.
+    :rtype: int
+    """
+    writer = csv.writer(file, delimiter=";")
+    writer.writerow(label for _, label in columns)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(file: TextIO, columns: list, rows: Iterable[tuple]) -> int:
+    """
+    Writes rows as JSON Lines, one object keyed by column per line.
+
+    :param file: The file to write to.
+    :type file: TextIO
+    :param columns: The key and label of each column.
+    :type columns: list[tuple[str, str]]
+    :param rows: The rows, one value per column.
+    :type rows: Iterable[tuple]
+    :return: The number of rows written.
+    :rtype: int
+    """
+    keys = [key for key, _ in columns]
+    count = 0
+    for row in rows:
+        file.write(json.dumps(dict(zip(keys, row)), ensure_ascii=False))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def write_html(file: TextIO,
+               columns: list,
+               rows: Iterable[tuple],
+               title: str = "") -> int:
+    """
+    Writes rows as a static HTML page holding a single table.
+
+    :param file: The file to write to.
+    :type file: TextIO
+    :param columns: The key and label of each column.
+    :type columns: list[tuple[str, str]]
+    :param rows: The rows, one value per column.
+    :type rows: Iterable[tuple]
+    :param title: The title of the page.
+    :type title: str
+    :return: The number of rows written.
+    :rtype: int
+    """
+    title = html.escape(title)
+    file.write("<!DOCTYPE html>\n"
+               "<html lang=\"fr\">\n<head>\n<meta charset=\"utf-8\">\n"
+               f"<title>{title}</title>\n"
+               "<style>table{border-collapse:collapse}"
+               "th,td{border:1px solid #999;padding:2px 6px}"
+               "th{background:#eee}</style>\n"
+               f"</head>\n<body>\n<h1>{title}</h1>\n<table>\n<thead><tr>")
+    file.write("".join(f"<th>{html.escape(label)}</th>"
+                       for _, label in columns))
+    file.write("</tr></thead>\n<tbody>\n")
+    count = 0
+    for row in rows:
+        file.write("<tr>")
+        file.write("".join(f"<td>{html.escape(str(value))}</td>"
+                           for value in row))
+        file.write("</tr>\n")
+        count += 1
+    file.write("</tbody>\n</table>\n</body>\n</html>\n")
+    return count
+
+
+EXPORT_WRITERS = {"csv": write_csv,
+                  "jsonl": write_jsonl,
+                  "html": write_html}
+
+
+class ExportResult(NamedTuple):
+    """un export terminé"""
+
+    path: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class ReportExporter:
+    """l'export des rapports"""
+
+    REPORTS = {"joueurs": ("Liste des joueurs", PLAYER_COLUMNS),
+               "matchs": ("Résultats des matchs", MATCH_COLUMNS)}
+
+    def __init__(self, data_base: Union[DataBase, None] = None):
+        """
+        Initializes the export of the reports to files.
+
+        The rows of a report are produced by a generator and written to
+        the file as they come, so the memory used does not grow with the
+        number of players or of matches: the player rows are read one at
+        a time from the data base, and the match rows one tournament at a
+        time.
+
+        :param data_base: The data base to read the reports from.
+            Defaults to the one selected in the settings.
+        :type data_base: DataBase or None
+        """
+        self.data_base = data_base or open_data_base()
+
+    def player_rows(self,
+                    criterion="national_player_number") -> Iterator[tuple]:
+        """
+        Yields a row for each registered player.
+
+        :param criterion: The sort order: "national_player_number" or
+            "name".
+        :type criterion: str
+        :rtype: Iterator[tuple]
+        """
+        for player in self.data_base.iter_players(criterion):
+            yield (player["national_player_number"],
+                   player["name"],
+                   player["first_name"],
+                   player["birthday"])
+
+    def match_rows(self, criterion="all") -> Iterator[tuple]:
+        """
+        Yields a row for each match of the tournaments, in the order of
+        the tournaments, then of their rounds and matches.
+
+        :param criterion: The tournaments to export: "all", "ended" or
+            "no_ended".
+        :type criterion: str
+        :rtype: Iterator[tuple]
+        """
+        headers = sorted(self.data_base.find_tournaments(criterion),
+                         key=lambda header: (header["start_date"],
+                                             header["file"]))
+        for header in headers:
+            tournament_data = self.data_base.read_tournament(header["file"])
+            if tournament_data is None:
+                continue
+            players = {player["national_player_number"]: player
+                       for player in tournament_data["players"]}
+            unknown = {"name": "", "first_name": ""}
+            for played_round in sorted(tournament_data["rounds"],
+                                       key=lambda data: data["round_number"]):
+                for match in played_round["matches"]:
+                    player1, player2 = match["players"]
+                    data1 = players.get(player1, unknown)
+                    data2 = players.get(player2, unknown)
+                    score1, score2 = (
+                        half_points_to_score(round(2 * score))
+                        for score in match["result"])
+                    yield (tournament_data["name"],
+                           tournament_data["start_date"][:10],
+                           played_round["round_number"],
+                           match["match_number"],
+                           player1, data1["name"], data1["first_name"],
+                           score1,
+                           player2, data2["name"], data2["first_name"],
+                           score2)
+
+    def rows(self, report: str, criterion: Union[str, None] = None) \
+            -> Iterator[tuple]:
+        """
+        Returns the rows of a report.
+
+        :param report: The report, a key of `REPORTS`.
+        :type report: str
+        :param criterion: The sort order of the players, or the
+            tournaments of the matches. Defaults to the order of the
+            report.
+        :type criterion: str or None
+        :rtype: Iterator[tuple]
+        """
+        if report == "joueurs":
+            return self.player_rows(criterion or "national_player_number")
+        return self.match_rows(criterion or "all")
+
+    def export(self,
+               report: str,
+               export_format: str,
+               path: Union[str, None] = None,
+               criterion: Union[str, None] = None) -> ExportResult:
+        """
+        Writes a report to a file, replacing it only once it is complete.
+
+        :param report: The report, a key of `REPORTS`.
+        :type report: str
+        :param export_format: The file format, a key of `EXPORT_WRITERS`.
+        :type export_format: str
+        :param path: The path of the file. Defaults to
+            `EXPORT_DIRECTORY/<report>.<format>`.
+        :type path: str or None
+        :param criterion: Passed to `rows`.
+        :type criterion: str or None
+        :return: The path of the file, the number of rows written and the
+            time taken.
+        :rtype: ExportResult
+        :raises ValueError: If the report or the format is unknown.
+        """
+        if report not in self.REPORTS:
+            raise ValueError(f"Rapport inconnu : {report}.")
+        if export_format not in EXPORT_WRITERS:
+            raise ValueError(f"Format inconnu : {export_format}.")
+        title, columns = self.REPORTS[report]
+        path = path or os.path.join(EXPORT_DIRECTORY,
+                                    f"{report}.{export_format}")
+
+        start = time.perf_counter()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary_file = f"{path}.tmp"
+        # "utf-8-sig" lets spreadsheets detect the encoding of CSV files
+        encoding = "utf-8-sig" if export_format == "csv" else "utf-8"
+        try:
+            with open(temporary_file, "w", encoding=encoding,
+                      newline="") as file:
+                rows = self.rows(report, criterion)
+                if export_format == "html":
+                    count = write_html(file, columns, rows, title)
+                else:
+                    count = EXPORT_WRITERS[export_format](file, columns,
+                                                          rows)
+            os.replace(temporary_file, path)
+        except BaseException:
+            # an interrupted export leaves neither a partial file nor the
+            # temporary one behind
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+            raise
+        return ExportResult(path, count, time.perf_counter() - start)
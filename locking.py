@@ -0,0 +1,90 @@
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the threads of a program are excluded
+    fcntl = None
+
+
+class FileLock:
+    """un verrou consultatif sur un fichier de données"""
+
+    def __init__(self, path: str):
+        """
+        Initializes an advisory lock on a data file, so that several
+        programs sharing the data directory, e.g. two registration desks,
+        change the file one at a time.
+
+        The lock is taken with `fcntl.flock` on the file `<path>.lock`,
+        kept open once opened. It can be held again by the thread holding
+        it, e.g. to compact a journal while appending to it: only the
+        outermost hold takes and releases it. The threads of a program
+        hold it one at a time.
+
+        :param path: The absolute path to the locked data file.
+        :type path: str
+        """
+        self.path = f"{path}.lock"
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.file = None
+        self.pid = None
+
+    @contextmanager
+    def hold(self, shared: bool = False):
+        """
+        Holds the lock for the duration of a `with` block.
+
+        :param shared: If True, other programs may hold the lock shared at
+            the same time, to read the file; otherwise the lock is
+            exclusive, to change it. A nested hold keeps the mode of the
+            outermost one.
+        :type shared: bool
+        """
+        with self.thread_lock:
+            if self.depth == 0:
+                self.acquire(shared)
+            self.depth += 1
+            try:
+                yield
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.release()
+
+    def acquire(self, shared: bool):
+        if fcntl is None:
+            return
+        # a child process shares the open lock file of its parent, and
+        # with it the lock, so it opens its own
+        if self.file is None or self.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.file = open(self.path, "a")
+            self.pid = os.getpid()
+        fcntl.flock(self.file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+
+    def release(self):
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+
+
+LOCKS = {}
+
+
+def file_lock(path: str) -> FileLock:
+    """
+    Returns the lock of a data file. A program uses a single lock per
+    file, as two locks on the same file would exclude each other.
+
+    :param path: The path to the data file, relative to the current
+        directory or absolute.
+    :type path: str
+    :rtype: FileLock
+    """
+    path = os.path.abspath(path)
+    lock = LOCKS.get(path)
+    if lock is None:
+        lock = LOCKS.setdefault(path, FileLock(path))
+    return lock
@@ -1,4 +1,115 @@
-from controllers import MainController
+import argparse
+import sys
+from typing import Union
+
+from controllers import CommandLineController, MainController
+from export import EXPORT_WRITERS, ReportExporter
+from settings import SERVER_HOST, SERVER_PORT
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the parser of the command line. Without a command, the
+    interactive menus are displayed; each command runs a single step of a
+    tournament without asking anything, so that events can be run from
+    scripts.
+
+    The name of the method of `CommandLineController` running a command is
+    stored in the "method" argument, and the other arguments are passed to
+    it by name.
+
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Gestion de tournois d'échecs. Sans commande, le menu "
+                    "interactif est affiché.")
+    commands = parser.add_subparsers(dest="command", metavar="commande",
+                                     required=True)
+
+    command = commands.add_parser("creer", help="créer un tournoi")
+    command.set_defaults(method="create_tournament")
+    command.add_argument("name", metavar="nom")
+    command.add_argument("place", metavar="lieu")
+    command.add_argument("-d", "--description", default="")
+    command.add_argument("-r", "--rondes", dest="max_round", type=int,
+                         default=4, help="nombre de rondes (4 par défaut)")
+
+    command = commands.add_parser(
+        "inscrire", help="inscrire des joueurs avant la première ronde")
+    command.set_defaults(method="register_players")
+    command.add_argument("name", metavar="tournoi")
+    command.add_argument("player_numbers", metavar="numéro", nargs="+",
+                         help="numéro national d'un joueur de la base")
+
+    command = commands.add_parser(
+        "ronde", help="commencer la ronde suivante et afficher ses matchs")
+    command.set_defaults(method="start_round")
+    command.add_argument("name", metavar="tournoi")
+
+    command = commands.add_parser(
+        "resultats",
+        help="enregistrer des résultats de la ronde en cours")
+    command.set_defaults(method="submit_results")
+    command.add_argument("name", metavar="tournoi")
+    command.add_argument("path", metavar="fichier",
+                         help="une ligne par match, par exemple « 3 1-0 », "
+                              "ou - pour l'entrée standard")
+
+    command = commands.add_parser(
+        "serveur",
+        help="recevoir les résultats de la ronde en cours de plusieurs "
+             "arbitres, en HTTP")
+    command.set_defaults(method="serve_results")
+    command.add_argument("name", metavar="tournoi")
+    command.add_argument("--hote", dest="host", default=SERVER_HOST,
+                         help=f"adresse d'écoute ({SERVER_HOST} par défaut, "
+                              f"0.0.0.0 pour le réseau local)")
+    command.add_argument("--port", type=int, default=SERVER_PORT,
+                         help=f"port d'écoute ({SERVER_PORT} par défaut)")
+
+    command = commands.add_parser("terminer", help="terminer un tournoi")
+    command.set_defaults(method="end_tournament")
+    command.add_argument("name", metavar="tournoi")
+
+    command = commands.add_parser("exporter", help="exporter un rapport")
+    command.set_defaults(method="export_report")
+    command.add_argument("report", choices=ReportExporter.REPORTS)
+    command.add_argument("export_format", choices=EXPORT_WRITERS)
+    command.add_argument("-o", "--fichier", dest="path",
+                         help="chemin du fichier exporté")
+    command.add_argument("-c", "--critere", dest="criterion",
+                         choices=["national_player_number", "name", "all",
+                                  "ended", "no_ended"],
+                         help="ordre des joueurs ou tournois des matchs")
+    return parser
+
+
+def main(arguments: Union[list[str], None] = None) -> int:
+    """
+    Runs the command given on the command line, or the interactive menus.
+
+    :param arguments: The arguments. Defaults to those of the command line.
+    :type arguments: list[str] or None
+    :return: The exit status: 0 on success, 1 on error.
+    :rtype: int
+    """
+    if arguments is None:
+        arguments = sys.argv[1:]
+    if not arguments:
+        MainController().run()
+        return 0
+
+    options = vars(build_parser().parse_args(arguments))
+    del options["command"]
+    controller = CommandLineController()
+    method = getattr(controller, options.pop("method"))
+    try:
+        method(**options)
+    except (ValueError, OSError) as error:
+        controller.command_line_view.display_error(str(error))
+        return 1
+    return 0
+
 
 if __name__ == "__main__":
-    MainController().run()
+    sys.exit(main())
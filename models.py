@@ -1,16 +1,304 @@
 import random
 import json
 import os
+import threading
+import weakref
 
+from array import array
+from bisect import bisect_left, insort
 from datetime import datetime
-from typing import List, Union
+from enum import IntEnum
+from typing import Iterator, List, NamedTuple, Union
+
+from locking import file_lock
+from pairing import pair_players
+from search import PlayerSearchIndex
+from settings import (TOURNAMENT_FILE_PATH,
+                      PLAYERS_FILE_PATH,
+                      PLAYERS_JOURNAL_FILE_PATH,
+                      PLAYERS_JOURNAL_MAX_SIZE,
+                      TOURNAMENT_JOURNAL_MAX_EVENTS,
+                      TOURNAMENT_CATALOG_FILE_PATH,
+                      PLAYER_HISTORY_FILE_PATH,
+                      SEARCH_LIMIT,
+                      STORAGE_BACKEND)
+
+TOURNAMENT_FORMAT_VERSION = 3
+LEGACY_TIMESTAMP_FORMAT = "%d-%m-%Y %H:%M"
+
+
+def encode_timestamp(timestamp: datetime) -> str:
+    """
+    Converts a date and time into the ISO-8601 string stored in tournament
+    files, e.g. "2024-09-06T09:00".
+
+    :param timestamp: The date and time to convert.
+    :type timestamp: datetime
+    :rtype: str
+    """
+    return timestamp.isoformat(timespec="minutes")
+
+
+def decode_timestamp(value: str) -> datetime:
+    """
+    Converts an ISO-8601 string read from a tournament file into a date
+    and time.
+
+    :param value: The string to convert.
+    :type value: str
+    :rtype: datetime
+    """
+    return datetime.fromisoformat(value)
+
+
+def upgrade_tournament_data(tournament_data: dict) -> dict:
+    """
+    Converts tournament data saved in an older format to the current
+    format, in place.
+
+    - Version 1 (without "version"): each match embeds the full data of
+      both players and stores its result as
+      `[["Payer1", score1], ["Player2", score2]]`.
+    - Version 2: a match stores the national player numbers of its players
+      in "players" and its result as `[score1, score2]`.
+    - Version 3: dates and times are ISO-8601 strings instead of
+      "dd-mm-yyyy HH:MM".
+
+    :param tournament_data: The tournament data read from a file.
+    :type tournament_data: dict
+    :return: The same tournament data, in the current format.
+    :rtype: dict
+    """
+    version = tournament_data.get("version", 1)
+
+    if version < 2:
+        for played_round in tournament_data["rounds"]:
+            for match in played_round["matches"]:
+                match["players"] = [
+                    match.pop("player1")["national_player_number"],
+                    match.pop("player2")["national_player_number"]
+                ]
+                match["result"] = [match["result"][0][1],
+                                   match["result"][1][1]]
+
+    if version < 3:
+        for data, keys in ([(tournament_data, ("start_date", "end_date"))] +
+                           [(played_round, ("start_time", "end_time"))
+                            for played_round in tournament_data["rounds"]]):
+            for key in keys:
+                if data[key]:
+                    data[key] = encode_timestamp(datetime.strptime(
+                        data[key], LEGACY_TIMESTAMP_FORMAT))
+
+    tournament_data["version"] = TOURNAMENT_FORMAT_VERSION
+    return tournament_data
+
+
+def half_points_to_score(half_points: int) -> Union[int, float]:
+    """
+    Converts a score counted in half-points into points, as an integer
+    when the score is whole, e.g. 5 -> 2.5 and 4 -> 2.
+
+    :param half_points: The score in half-points.
+    :type half_points: int
+    :rtype: int or float
+    """
+    if half_points % 2:
+        return half_points / 2
+    return half_points // 2
+
+
+class MatchResult(IntEnum):
+    """le résultat d'un match"""
+
+    PENDING = 0
+    PLAYER1 = 1
+    PLAYER2 = 2
+    DRAW = 3
+
+    @property
+    def half_points(self) -> tuple[int, int]:
+        """The half-points scored by both players."""
+        return RESULT_HALF_POINTS[self]
+
+    @property
+    def points(self) -> tuple:
+        """The points scored by both players, as stored in files."""
+        return RESULT_POINTS[self]
+
+    @classmethod
+    def from_points(cls, points1, points2) -> "MatchResult":
+        """
+        Returns the result matching the points scored by both players.
+        Unknown scores are read as a match not played yet.
+
+        :param points1: The points scored by the first player.
+        :type points1: int or float
+        :param points2: The points scored by the second player.
+        :type points2: int or float
+        :rtype: MatchResult
+        """
+        return RESULTS_BY_HALF_POINTS.get(
+            (round(2 * points1), round(2 * points2)), cls.PENDING)
+
+
+RESULT_HALF_POINTS = {MatchResult.PENDING: (0, 0),
+                      MatchResult.PLAYER1: (2, 0),
+                      MatchResult.PLAYER2: (0, 2),
+                      MatchResult.DRAW: (1, 1)}
+RESULT_POINTS = {result: tuple(map(half_points_to_score, half_points))
+                 for result, half_points in RESULT_HALF_POINTS.items()}
+RESULTS_BY_HALF_POINTS = {half_points: result
+                          for result, half_points
+                          in RESULT_HALF_POINTS.items()}
+# notations of a result entered by an arbiter, the first one of each result
+# being used to display it
+RESULT_NOTATIONS = {"1-0": MatchResult.PLAYER1,
+                    "0-1": MatchResult.PLAYER2,
+                    "1/2-1/2": MatchResult.DRAW,
+                    "½-½": MatchResult.DRAW,
+                    "0.5-0.5": MatchResult.DRAW}
+
+
+class OpponentHistory:
+    """les adversaires d'un joueur"""
+
+    __slots__ = ("order", "members")
+
+    def __init__(self, opponents=()):
+        """
+        Initializes the history with the national player numbers of the
+        opponents already met, in the order they were met.
+
+        Membership is checked against a set, and the order is kept in a
+        list, used to save the tournament.
+
+        :param opponents: The national player numbers of the opponents.
+        :type opponents: iterable of str
+        """
+        self.order = []
+        self.members = set()
+        for opponent in opponents:
+            self.push(opponent)
+
+    def push(self, national_player_number: str):
+        """
+        Records a new opponent.
+
+        :param national_player_number: The national player number of the
+            opponent.
+        :type national_player_number: str
+        """
+        self.order.append(national_player_number)
+        self.members.add(national_player_number)
+
+    def __contains__(self, national_player_number) -> bool:
+        return national_player_number in self.members
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __repr__(self) -> str:
+        return f"OpponentHistory({self.order!r})"
+
+
+class PlayerIdentity:
+    """l'identité d'un joueur"""
+
+    __slots__ = ("national_player_number", "name", "first_name", "birthday",
+                 "__weakref__")
+
+    def __init__(self,
+                 national_player_number: str,
+                 name: str,
+                 first_name: str,
+                 birthday: str):
+        """
+        Initializes the details of a player that do not depend on a
+        tournament.
+
+        :param national_player_number: The national player number.
+        :type national_player_number: str
+        :param name: The player's last name.
+        :type name: str
+        :param first_name: The player's first name.
+        :type first_name: str
+        :param birthday: The player's date of birth, 'dd/mm/yyyy'.
+        :type birthday: str
+        """
+        self.national_player_number = national_player_number
+        self.name = name
+        self.first_name = first_name
+        self.birthday = birthday
+
 
-from settings import TOURNAMENT_FILE_PATH, PLAYERS_FILE_PATH
+class PlayerIdentityMap:
+    """les identités des joueurs en mémoire"""
+
+    def __init__(self):
+        """
+        Initializes the map of the player identities in memory, keyed by
+        national player number.
+
+        Identities are held weakly: an identity is kept as long as a
+        player of a loaded tournament refers to it, so every tournament
+        loaded at the same time shares the same identity for a player.
+        """
+        self.identities = weakref.WeakValueDictionary()
+
+    def get(self,
+            national_player_number: str,
+            name: str,
+            first_name: str,
+            birthday: str) -> PlayerIdentity:
+        """
+        Returns the identity of a player, created on the first request and
+        shared by the later ones giving the same details.
+
+        When the details differ from those of the shared identity, e.g. a
+        player renamed between two tournaments, a separate identity is
+        returned, not shared, so that each tournament keeps and saves its
+        own details.
+
+        :param national_player_number: The national player number.
+        :type national_player_number: str
+        :param name: The player's last name.
+        :type name: str
+        :param first_name: The player's first name.
+        :type first_name: str
+        :param birthday: The player's date of birth.
+        :type birthday: str
+        :rtype: PlayerIdentity
+        """
+        identity = self.identities.get(national_player_number)
+        if identity is None:
+            identity = PlayerIdentity(national_player_number,
+                                      name,
+                                      first_name,
+                                      birthday)
+            self.identities[national_player_number] = identity
+        elif ((identity.name, identity.first_name, identity.birthday)
+              != (name, first_name, birthday)):
+            identity = PlayerIdentity(national_player_number,
+                                      name,
+                                      first_name,
+                                      birthday)
+        return identity
+
+    def __len__(self) -> int:
+        return len(self.identities)
 
 
 class Player:
     """un joueur"""
 
+    __slots__ = ("identity", "half_points", "opponents")
+
+    identities = PlayerIdentityMap()
+
     def __init__(self,
                  national_player_number: str,
                  name: str,
@@ -22,6 +310,11 @@ class Player:
         Initializes a player's attributes, including their national
          player number, name, first name, birthday and score.
 
+        A `Player` is the participation of a player in a tournament: it
+        holds the score and the opponents, while the details of the player
+        are held by a `PlayerIdentity` shared by every `Player` with the
+        same national player number.
+
         :param national_player_number: The unique national player
         number, validated to follow the format 'aa11111'.
         :type national_player_number: str
@@ -34,15 +327,45 @@ class Player:
         :param birthday: The player's date of birth, validated and
         formatted in the format 'dd/mm/yyyy'.
         :type birthday: str
-        :param score: The player's initial score, defaults to 0.
+        :param score: The player's initial score, defaults to 0. It is
+            kept as an integer number of half-points, see `score`.
         :type score: int, optional
         """
-        self.name = name
-        self.first_name = first_name
-        self.birthday = birthday
-        self.national_player_number = national_player_number
+        self.identity = self.identities.get(national_player_number,
+                                            name,
+                                            first_name,
+                                            birthday)
         self.score = score
-        self.opponents = []
+        self.opponents = OpponentHistory()
+
+    @property
+    def national_player_number(self) -> str:
+        """The player's national player number."""
+        return self.identity.national_player_number
+
+    @property
+    def name(self) -> str:
+        """The player's last name."""
+        return self.identity.name
+
+    @property
+    def first_name(self) -> str:
+        """The player's first name."""
+        return self.identity.first_name
+
+    @property
+    def birthday(self) -> str:
+        """The player's date of birth."""
+        return self.identity.birthday
+
+    @property
+    def score(self) -> Union[int, float]:
+        """The player's score in points, e.g. 2 or 2.5."""
+        return half_points_to_score(self.half_points)
+
+    @score.setter
+    def score(self, score: Union[int, float]):
+        self.half_points = round(2 * score)
 
     def __repr__(self) -> str:
         return (f"{self.national_player_number: <12}"
@@ -51,6 +374,72 @@ class Player:
                 f"{self.score: <6}")
 
 
+class Standings:
+    """le classement d'un tournoi"""
+
+    def __init__(self, players=()):
+        """
+        Initializes the standings of a tournament.
+
+        Players are grouped in buckets keyed by their score in
+        half-points, and the keys are kept sorted. A score change moves a
+        single player from one bucket to another, and the ranking is read
+        bucket by bucket, so the field is never sorted again. Inside a
+        bucket, players keep the order in which they reached the score.
+
+        :param players: The players to rank.
+        :type players: iterable of Player
+        """
+        self.buckets = {}
+        self.keys = []
+        self.half_points = {}
+        for player in players:
+            self.add(player)
+
+    def add(self, player: Player):
+        """
+        Adds a player to the standings, or moves them if their score has
+        changed since they were added.
+
+        :param player: The player to add.
+        :type player: Player
+        """
+        half_points = player.half_points
+        previous = self.half_points.get(player)
+        if previous == half_points:
+            return
+        if previous is not None:
+            bucket = self.buckets[previous]
+            del bucket[player]
+            if not bucket:
+                del self.buckets[previous]
+                del self.keys[bisect_left(self.keys, previous)]
+        if half_points not in self.buckets:
+            self.buckets[half_points] = {}
+            insort(self.keys, half_points)
+        self.buckets[half_points][player] = None
+        self.half_points[player] = half_points
+
+    update = add
+
+    def ranking(self) -> list[Player]:
+        """
+        Returns the players sorted by score, in descending order.
+
+        :rtype: list[Player]
+        """
+        ranking = []
+        for half_points in reversed(self.keys):
+            ranking.extend(self.buckets[half_points])
+        return ranking
+
+    def __contains__(self, player) -> bool:
+        return player in self.half_points
+
+    def __len__(self) -> int:
+        return len(self.half_points)
+
+
 class Tournament:
     """un tournoi"""
 
@@ -81,8 +470,19 @@ class Tournament:
         self.round_number = 0
         self.max_round = int(max_round)
         self.players = []
+        self.standings = Standings()
         self.rounds = []
         self.description = description
+        self.journal_events = 0
+        # revision of the saved tournament, None until it is saved or
+        # loaded, and signature of its files after the last write
+        self.revision = None
+        self.signature = None
+        # `autosave.TournamentSaver` saving the tournament in the
+        # background, if any, and the lock it holds while saving, also
+        # held while the tournament is changed and the change recorded
+        self.saver = None
+        self.lock = threading.RLock()
 
     def add_player(self,
                    player_number: str) \
@@ -97,10 +497,7 @@ class Tournament:
                  `False` if the player was not found in the JSON file.
         :rtype: Player or boolean
         """
-        json_file = PLAYERS_FILE_PATH
-        DataBase.check_existence_json_file(json_file)
-
-        found_player = DataBase().find_player_in_json(player_number)
+        found_player = open_data_base().find_player_in_json(player_number)
 
         if found_player:
             player = Player(found_player["national_player_number"],
@@ -110,6 +507,7 @@ class Tournament:
                             )
             if player not in self.players:
                 self.players.append(player)
+                self.standings.add(player)
                 return player
             else:
                 return player
@@ -118,90 +516,95 @@ class Tournament:
 
     def add_round(self):
         """Add a round to a tournament"""
+        if len(self.standings) != len(self.players):
+            self.standings = Standings(self.players)
         self.round_number += 1
-        self.rounds.append(Round(self.round_number, self.players))
+        self.rounds.append(Round(self.round_number,
+                                 self.players,
+                                 self.standings))
         return
 
     def ended(self):
         """
         Marks the current tournament as ended by setting the end date to the
-        current date and time.
+        current date and time, then saves it so that the tournament file and
+        the tournament catalog record its new status, without waiting for a
+        saver in the background.
         """
         self.end_date = datetime.now()
+        self.save()
+        self.flush()
 
-    def save(self):
+    @staticmethod
+    def serialize_player(player: Player) -> dict:
         """
-        Saves the tournament data to a JSON file.
+        Converts a player into the dictionary stored in tournament files.
 
-        The method serializes the tournament details,
-        including players, rounds, and matches,
-        into a JSON file.
-        The JSON file is saved in the directory `data/tournaments/`
-        with the tournament name as the filename.
+        :param player: The player to convert.
+        :type player: Player
+        :rtype: dict
         """
-        json_file = f"{TOURNAMENT_FILE_PATH}{self.name}.json"
-        DataBase.check_existence_json_file(json_file)
-
-        player_data = []
-        for player in self.players:
-            player_data.append(
-                {"national_player_number": player.national_player_number,
-                 "name": player.name,
-                 "first_name": player.first_name,
-                 "birthday": player.birthday,
-                 "score": player.score
-                 }
-            )
-
-        rounds_data = []
-        for played_round in self.rounds:
-            match_data = []
-            for match in played_round.matches:
-                data = {
-                    "match_number": match.number,
-                    "player1": {
-                        "national_player_number": match.player1.national_player_number,  # noqa: E501
-                        "name": match.player1.name,
-                        "first_name": match.player1.first_name,
-                        "birthday": match.player1.birthday,
-                        "score": match.player1.score
-                    },
-                    "player2": {
-                        "national_player_number": match.player2.national_player_number,  # noqa: E501
-                        "name": match.player2.name,
-                        "first_name": match.player2.first_name,
-                        "birthday": match.player2.birthday,
-                        "score": match.player2.score},
-                    "result":
-                        [("Payer1", match.result[0][1]),
-                         ("Player2", match.result[1][1])
-                         ]
+        return {"national_player_number": player.national_player_number,
+                "name": player.name,
+                "first_name": player.first_name,
+                "birthday": player.birthday,
+                "score": player.score
                 }
-                match_data.append(data)
 
-            if played_round.end_time:
-                end = played_round.end_time.strftime("%d-%m-%Y %H:%M")
-            else:
-                end = None
+    def serialize_round(self, played_round) -> dict:
+        """
+        Converts a round and its matches into the dictionary stored in
+        tournament files. Matches refer to their players by national
+        player number.
 
-            round_data = {
-                "name": played_round.name,
-                "round_number": played_round.round_number,
-                "start_time": played_round.start_time.strftime("%d-%m-%Y %H:%M"),  # noqa: E501
-                "end_time": end,
-                "matches": match_data
-            }
-            rounds_data.append(round_data)
+        :param played_round: The round to convert.
+        :type played_round: Round
+        :rtype: dict
+        """
+        match_data = []
+        for match in played_round.matches:
+            match_data.append({
+                "match_number": match.number,
+                "players": [match.player1.national_player_number,
+                            match.player2.national_player_number],
+                "result": list(match.outcome.points)
+            })
+
+        if played_round.end_time:
+            end = encode_timestamp(played_round.end_time)
+        else:
+            end = None
+
+        return {
+            "name": played_round.name,
+            "round_number": played_round.round_number,
+            "start_time": encode_timestamp(played_round.start_time),
+            "end_time": end,
+            "matches": match_data
+        }
+
+    def serialize(self) -> dict:
+        """
+        Converts the tournament, including players, rounds, and matches,
+        into the dictionary stored in tournament files.
+
+        :rtype: dict
+        """
+        player_data = [self.serialize_player(player)
+                       for player in self.players]
+        rounds_data = [self.serialize_round(played_round)
+                       for played_round in self.rounds]
 
         if self.end_date:
-            end = self.end_date.strftime("%d-%m-%Y %H:%M")
+            end = encode_timestamp(self.end_date)
         else:
             end = None
 
-        data = {"name": self.name,
+        return {"version": TOURNAMENT_FORMAT_VERSION,
+                "name": self.name,
                 "place": self.place,
                 "description": self.description,
-                "start_date": self.start_date.strftime("%d-%m-%Y %H:%M"),
+                "start_date": encode_timestamp(self.start_date),
                 "end_date": end,
                 "round_number": self.round_number,
                 "max_round": self.max_round,
@@ -209,16 +612,111 @@ class Tournament:
                 "rounds": rounds_data
                 }
 
-        if not os.path.exists(json_file):
-            with open(json_file, "w", encoding="utf-8") as file:
-                json.dump([], file)
+    def save(self):
+        """
+        Saves the tournament in the data base selected in the settings.
 
-        with open(json_file, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
+        With the JSON data base, the tournament details, including players,
+        rounds, and matches, are serialized into a JSON file saved in the
+        directory `data/tournaments/` with the tournament name as the
+        filename.
 
-        return
+        While an `autosave.TournamentSaver` is started, the tournament is
+        saved later by its thread instead, see `flush`. Otherwise it is
+        saved at once, holding `lock`.
+        """
+        if self.saver is not None:
+            self.saver.request()
+        else:
+            with self.lock:
+                open_data_base().save_tournament(self)
+
+    def flush(self):
+        """
+        Saves at once the changes that an `autosave.TournamentSaver` has
+        not saved yet, and waits until they are written.
+        """
+        if self.saver is not None:
+            self.saver.flush()
+
+    def record(self, event: dict):
+        """
+        Records an event (round start, result or round end) instead of
+        saving the whole tournament.
+
+        :param event: The event to record.
+        :type event: dict
+        """
+        open_data_base().record_tournament_event(self, event)
+
+    def record_events(self, events: list[dict]):
+        """
+        Records several events at once, see `record`.
 
-    def load(self, loaded_tournament):
+        :param events: The events to record, in order.
+        :type events: list[dict]
+        """
+        open_data_base().record_tournament_events(self, events)
+
+    def record_round_start(self):
+        """Records the start of the last round, with its pairings."""
+        self.record({"event": "round_start",
+                     "round_number": self.round_number,
+                     "round": self.serialize_round(self.rounds[-1])
+                     })
+
+    @staticmethod
+    def result_event(played_round, match) -> dict:
+        """
+        Returns the event recording the result of a match and the
+        resulting scores of both players.
+
+        :param played_round: The round the match belongs to.
+        :type played_round: Round
+        :param match: The match whose result has been assigned.
+        :type match: Match
+        :rtype: dict
+        """
+        return {"event": "result",
+                "round_number": played_round.round_number,
+                "match_number": match.number,
+                "result": list(match.outcome.points),
+                "scores": {
+                    match.player1.national_player_number:
+                        match.player1.score,
+                    match.player2.national_player_number:
+                        match.player2.score
+                }
+                }
+
+    def record_result(self, played_round, match):
+        """
+        Records the result of a match and the resulting scores of both
+        players.
+
+        :param played_round: The round the match belongs to.
+        :type played_round: Round
+        :param match: The match whose result has been assigned.
+        :type match: Match
+        """
+        self.record(self.result_event(played_round, match))
+
+    def round_end_event(self) -> dict:
+        """
+        Returns the event recording the end of the last round.
+
+        :rtype: dict
+        """
+        return {"event": "round_end",
+                "round_number": self.rounds[-1].round_number,
+                "end_time": encode_timestamp(self.rounds[-1].end_time)
+                }
+
+    def record_round_end(self):
+        """Records the end of the last round."""
+        self.record(self.round_end_event())
+
+    def load(self, loaded_tournament, packed: bool = False):
         """
         Loads a tournament's data into the current instance.
 
@@ -226,21 +724,28 @@ class Tournament:
         data loaded from a serialized source.
         It recreates the players, rounds, and matches.
 
-        :param loaded_tournament: The serialized tournament data to load.
+        :param loaded_tournament: The serialized tournament data to load,
+            in the current format or in the legacy format where matches
+            embed the players.
         :type loaded_tournament: dict
+        :param packed: If True, rounds are loaded as `PackedRound`, which
+            keep their matches in arrays. Meant for reading whole archives
+            of finished tournaments.
+        :type packed: bool
         """
+        upgrade_tournament_data(loaded_tournament)
 
-        self.start_date = datetime.strptime(
-            loaded_tournament["start_date"], "%d-%m-%Y %H:%M")
+        self.start_date = decode_timestamp(loaded_tournament["start_date"])
         if loaded_tournament["end_date"]:
-            self.end_date = datetime.strptime(
-                loaded_tournament["end_date"], "%d-%m-%Y %H:%M")
+            self.end_date = decode_timestamp(loaded_tournament["end_date"])
         else:
             self.end_date = False
         self.round_number = loaded_tournament["round_number"]
         self.max_round = loaded_tournament["max_round"]
         self.description = loaded_tournament["description"]
+        self.revision = loaded_tournament.get("revision", 0)
 
+        players = {}
         for player in loaded_tournament["players"]:
             self.players.append(
                 Player(player["national_player_number"],
@@ -250,57 +755,168 @@ class Tournament:
                        player["score"]
                        )
             )
+            players[player["national_player_number"]] = self.players[-1]
+        self.standings = Standings(self.players)
+
+        roster = None
+        positions = None
+        if packed:
+            roster = tuple(self.players)
+            positions = {number: position
+                         for position, number in enumerate(players)}
 
         for loaded_round in loaded_tournament["rounds"]:
+            self.load_round(loaded_round, players, roster, positions)
+
+    def load_round(self,
+                   loaded_round: dict,
+                   players: dict,
+                   roster: Union[tuple, None] = None,
+                   positions: Union[dict, None] = None,
+                   assign: bool = False):
+        """
+        Loads a round and its matches at the end of the rounds.
+
+        :param loaded_round: The serialized round data, in the current
+            format.
+        :type loaded_round: dict
+        :param players: The players of the tournament, keyed by national
+            player number.
+        :type players: dict
+        :param roster: For a `PackedRound`, the players of the tournament
+            in a fixed order; None to load a `Round`.
+        :type roster: tuple[Player] or None
+        :param positions: For a `PackedRound`, the position of each
+            national player number in `roster`.
+        :type positions: dict or None
+        :param assign: If True, the results are added to the scores of the
+            players, which were not read with them.
+        :type assign: bool
+        """
+        if roster is not None:
+            self.rounds.append(PackedRound(
+                loaded_round["round_number"],
+                roster
+            ))
+        else:
             self.rounds.append(Round(
                 loaded_round["round_number"],
-                self.players
+                self.players,
+                self.standings
             )
             )
-            self.rounds[-1].start_time = datetime.strptime(
-                loaded_round["start_time"], "%d-%m-%Y %H:%M")
+        self.rounds[-1].start_time = decode_timestamp(
+            loaded_round["start_time"])
 
-            if loaded_round["end_time"]:
-                self.rounds[-1].end_time = datetime.strptime(
-                    loaded_round["end_time"], "%d-%m-%Y %H:%M")
-            else:
-                self.rounds[-1].end_time = False
+        if loaded_round["end_time"]:
+            self.rounds[-1].end_time = decode_timestamp(
+                loaded_round["end_time"])
+        else:
+            self.rounds[-1].end_time = False
 
-            for played_match in loaded_round['matches']:
+        for played_match in loaded_round['matches']:
 
-                player1 = next(player for player in self.players if
-                               player.national_player_number ==
-                               played_match["player1"][
-                                   "national_player_number"])
-                player2 = next(player for player in self.players if
-                               player.national_player_number ==
-                               played_match["player2"][
-                                   "national_player_number"])
+            player1 = players[played_match["players"][0]]
+            player2 = players[played_match["players"][1]]
 
-                player1.opponents.append(player2.national_player_number)
-                player2.opponents.append(player1.national_player_number)
+            player1.opponents.push(player2.national_player_number)
+            player2.opponents.push(player1.national_player_number)
 
-                match = Match(
-                    played_match["match_number"],
-                    (player1, player2)
+            outcome = MatchResult.from_points(*played_match["result"])
+            if roster is not None:
+                self.rounds[-1].add(
+                    positions[player1.national_player_number],
+                    positions[player2.national_player_number],
+                    outcome
                 )
+                continue
 
-                if played_match["result"][0][1] == 1:
-                    match.result = [(player1, 1), (player2, 0)]
-                elif played_match["result"][1][1] == 1:
-                    match.result = [(player1, 0), (player2, 1)]
-                elif played_match["result"][1][1] == 0.5:
-                    match.result = [(player1, 0.5), (player2, 0.5)]
-                else:
-                    match.result = [(player1, 0), (player2, 0)]
+            match = Match(
+                played_match["match_number"],
+                (player1, player2),
+                self.standings
+            )
+            if assign and outcome is not MatchResult.PENDING:
+                match.assign_outcome(outcome)
+            else:
+                match.outcome = outcome
 
-                self.rounds[-1].matches.append(match)
+            self.rounds[-1].matches.append(match)
+
+    def merge(self, stored_tournament: dict) -> bool:
+        """
+        Adopts the changes saved by another program since this tournament
+        was loaded or last saved: players registered before the first
+        round, results of the matches still pending here, rounds ended or
+        started, and the end of the tournament. The objects of the
+        tournament are kept and updated in place. When both programs
+        assigned a result to the same match, the result assigned here is
+        kept.
+
+        :param stored_tournament: The tournament data read from the data
+            base, with its journal.
+        :type stored_tournament: dict
+        :return: True if a change was adopted.
+        :rtype: bool
+        """
+        upgrade_tournament_data(stored_tournament)
+        changed = False
+        players = {player.national_player_number: player
+                   for player in self.players}
+
+        if not self.rounds:
+            for player_data in stored_tournament["players"]:
+                if player_data["national_player_number"] in players:
+                    continue
+                player = Player(player_data["national_player_number"],
+                                player_data["name"],
+                                player_data["first_name"],
+                                player_data["birthday"])
+                self.players.append(player)
+                self.standings.add(player)
+                players[player.national_player_number] = player
+                changed = True
+
+        for stored_round in stored_tournament["rounds"]:
+            round_number = stored_round["round_number"]
+            if round_number > len(self.rounds):
+                self.load_round(stored_round, players, assign=True)
+                self.round_number = round_number
+                changed = True
+                continue
+
+            played_round = self.rounds[round_number - 1]
+            for match, stored_match in zip(played_round.matches,
+                                           stored_round["matches"]):
+                outcome = MatchResult.from_points(*stored_match["result"])
+                if (match.outcome is MatchResult.PENDING
+                        and outcome is not MatchResult.PENDING
+                        and stored_match["players"] ==
+                        [match.player1.national_player_number,
+                         match.player2.national_player_number]):
+                    match.assign_outcome(outcome)
+                    changed = True
+            if stored_round["end_time"] and not played_round.end_time:
+                played_round.end_time = decode_timestamp(
+                    stored_round["end_time"])
+                changed = True
+
+        if stored_tournament["end_date"] and not self.end_date:
+            self.end_date = decode_timestamp(stored_tournament["end_date"])
+            changed = True
+        return changed
 
 
 class Round:
     """un tour"""
 
-    def __init__(self, round_number: int, players: List[Player]):
+    __slots__ = ("name", "round_number", "start_time", "end_time",
+                 "standings", "players", "matches")
+
+    def __init__(self,
+                 round_number: int,
+                 players: List[Player],
+                 standings: Union[Standings, None] = None):
         """
         Initializes a tournament round.
 
@@ -311,14 +927,21 @@ class Round:
             - For the next rounds, players are sorted by
                 their scores in descending order.
         :type players: list[Player]
+        :param standings: The standings of the tournament. When given, the
+            ranking of the next rounds is read from it instead of sorting
+            the players, and the matches of the round keep it up to date.
+        :type standings: Standings or None
         """
         self.name = f"round {round_number}"
         self.round_number = round_number
         self.start_time = datetime.now()
         self.end_time = False
+        self.standings = standings
         if self.round_number == 1:
             random.shuffle(players)
             self.players = players
+        elif standings is not None:
+            self.players = standings.ranking()
         else:
             self.players = DataBase().sort_players(
                 players, "score", True
@@ -329,78 +952,21 @@ class Round:
         """
         Adds matches to the current round based on available players.
 
-        The method pairs players who have not yet played against each other in
-        previous rounds. Each match is assigned a unique match number.
-        :return: A list of `Match` objects representing the matches for
-            the round.
-        :rtype: list[Match]
+        The pairing is computed by `pairing.pair_players`: a maximum
+        weight matching over the players who have not yet played against
+        each other, favouring opponents with the same score and close in
+        the standings. Each match is assigned a unique match number.
+        If no pairing avoids a rematch, no match is added.
         """
-        attempt = 0
-        while True:
-            used_players = set()
-            match_number = 1
-
-            for i, player1 in enumerate(self.players):
-
-                if player1 in used_players:
-                    continue
-
-                for j in range(i + 1, len(self.players)):
-                    player2 = self.players[j]
-
-                    if (player2 in used_players or
-                            player2.national_player_number in
-                            player1.opponents):
-                        continue
-
-                    match = Match(match_number, (player1, player2))
-                    self.matches.append(match)
-                    match_number += 1
-
-                    player1.opponents.append(player2.national_player_number)
-                    player2.opponents.append(player1.national_player_number)
-                    used_players.add(player1)
-                    used_players.add(player2)
-
-                    break
-
-            if len(self.matches) != len(self.players) / 2:
-                attempt += 1
-                for match in self.matches:
-                    del match.player1.opponents[-1]
-                    del match.player2.opponents[-1]
-                self.matches = []
-                if attempt == 1:
-                    self.players = DataBase().sort_players(
-                        self.players,
-                        "score"
-                    )
-                    continue
-                elif attempt == 2:
-                    self.players = DataBase().sort_players(
-                        self.players,
-                        "name"
-                    )
-                elif attempt == 3:
-                    self.players = DataBase().sort_players(
-                        self.players,
-                        "name", True
-                    )
-                elif attempt == 4:
-                    self.players = DataBase().sort_players(
-                        self.players,
-                        "national_player_number"
-                    )
-                elif attempt == 5:
-                    self.players = DataBase().sort_players(
-                        self.players,
-                        "national_player_number", True
-                    )
-                else:
-                    break
-            else:
-                break
-        return
+        pairs = pair_players(self.players)
+        if pairs is None:
+            return
+        for match_number, (player1, player2) in enumerate(pairs, 1):
+            self.matches.append(Match(match_number,
+                                      (player1, player2),
+                                      self.standings))
+            player1.opponents.push(player2.national_player_number)
+            player2.opponents.push(player1.national_player_number)
 
     def ended(self):
         """
@@ -413,7 +979,9 @@ class Round:
 class Match:
     """un match"""
 
-    def __init__(self, match_number, players):
+    __slots__ = ("number", "player1", "player2", "outcome", "standings")
+
+    def __init__(self, match_number, players, standings=None):
         """
         Initializes a match with the given match number and players.
 
@@ -422,15 +990,33 @@ class Match:
         :param players: A tuple containing two players participating
         in the match.
         :type players: tuple[Player]
+        :param standings: The standings updated when a result is assigned.
+        :type standings: Standings or None
         """
         self.number = int(match_number)
         self.player1 = players[0]
         self.player2 = players[1]
-        self.result = [(self.player1, 0), (self.player2, 0)]
+        self.outcome = MatchResult.PENDING
+        self.standings = standings
+
+    @property
+    def result(self) -> list[tuple]:
+        """
+        The result of the match, as a list of (player, points) tuples,
+        e.g. `[(player1, 1), (player2, 0)]`. Both players have 0 points
+        while the match has not been played.
+        """
+        points1, points2 = self.outcome.points
+        return [(self.player1, points1), (self.player2, points2)]
+
+    @result.setter
+    def result(self, result: list[tuple]):
+        self.outcome = MatchResult.from_points(result[0][1], result[1][1])
 
     def assign_result(self, winner="match nul"):
         """
-        Assigns the result of a match by updating player scores.
+        Assigns the result of a match by updating player scores and the
+        standings of the tournament.
 
         :param winner: The winner of the match. Defaults to "match nul" (draw).
             - If it is "player1", player1.score is increased by 1 point.
@@ -443,21 +1029,919 @@ class Match:
         :rtype: list[tuple]
         """
         if winner == self.player1:
-            self.player1.score += 1
-            return [(self.player1, 1), (self.player2, 0)]
+            self.outcome = MatchResult.PLAYER1
 
         elif winner == self.player2:
-            self.player2.score += 1
-            return [(self.player1, 0), (self.player2, 1)]
+            self.outcome = MatchResult.PLAYER2
 
         else:
-            self.player1.score += .5
-            self.player2.score += .5
-            return [(self.player1, 0.5), (self.player2, 0.5)]
+            self.outcome = MatchResult.DRAW
+
+        for player, half_points in zip((self.player1, self.player2),
+                                       self.outcome.half_points):
+            player.half_points += half_points
+            if self.standings is not None:
+                self.standings.update(player)
+        return self.result
+
+    def assign_outcome(self, outcome: MatchResult) -> list[tuple]:
+        """
+        Assigns the result of a match given as a `MatchResult`, see
+        `assign_result`.
+
+        :param outcome: The result: `MatchResult.PLAYER1`,
+            `MatchResult.PLAYER2` or `MatchResult.DRAW`.
+        :type outcome: MatchResult
+        :rtype: list[tuple]
+        """
+        if outcome is MatchResult.PLAYER1:
+            return self.assign_result(self.player1)
+        if outcome is MatchResult.PLAYER2:
+            return self.assign_result(self.player2)
+        return self.assign_result()
+
+
+class PackedRound:
+    """un tour en lecture seule, stocké dans des tableaux"""
+
+    __slots__ = ("name", "round_number", "start_time", "end_time",
+                 "players", "pairings", "outcomes")
+
+    def __init__(self, round_number: int, players: tuple[Player, ...]):
+        """
+        Initializes a round whose matches are kept in two parallel arrays
+        instead of `Match` objects: the positions of both players in
+        `players`, and the result of each match as a `MatchResult` code.
+
+        A packed round takes a few bytes per match. Its `matches` are
+        rebuilt on demand, numbered in the order they were added, so it
+        can be displayed and saved like a `Round`, but results assigned to
+        them are not kept.
+
+        :param round_number: The round number.
+        :type round_number: int
+        :param players: The players of the tournament, in a fixed order.
+        :type players: tuple[Player]
+        """
+        self.name = f"round {round_number}"
+        self.round_number = round_number
+        self.start_time = datetime.now()
+        self.end_time = False
+        self.players = players
+        self.pairings = array("i")
+        self.outcomes = array("b")
+
+    def add(self, position1: int, position2: int, outcome: MatchResult):
+        """
+        Adds a match to the round.
+
+        :param position1: The position of the first player in `players`.
+        :type position1: int
+        :param position2: The position of the second player in `players`.
+        :type position2: int
+        :param outcome: The result of the match.
+        :type outcome: MatchResult
+        """
+        self.pairings.append(position1)
+        self.pairings.append(position2)
+        self.outcomes.append(outcome)
+
+    @property
+    def matches(self) -> list[Match]:
+        """The matches of the round, rebuilt from the arrays."""
+        matches = []
+        for number, outcome in enumerate(self.outcomes):
+            match = Match(number + 1,
+                          (self.players[self.pairings[2 * number]],
+                           self.players[self.pairings[2 * number + 1]]))
+            match.outcome = MatchResult(outcome)
+            matches.append(match)
+        return matches
+
+    def ended(self):
+        """
+        Marks the round as ended by setting the end date to the current
+        date and time.
+        """
+        self.end_time = datetime.now()
+
+
+class TournamentJournal:
+    """le journal des évènements d'un tournoi"""
+
+    def __init__(self, name: str):
+        """
+        Initializes the journal of a tournament.
+
+        The journal is a JSON Lines file stored next to the tournament file.
+        Each line is a small event (round start, match result, round end)
+        recorded since the last full save of the tournament.
+
+        :param name: The name of the tournament.
+        :type name: str
+        """
+        self.path = f"{TOURNAMENT_FILE_PATH}{name}.jsonl"
+
+    def append(self, event: dict):
+        """
+        Appends an event at the end of the journal.
+
+        :param event: The event to append.
+        :type event: dict
+        """
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def extend(self, events: list[dict]):
+        """
+        Appends events at the end of the journal, in a single write.
+
+        :param events: The events to append, in order.
+        :type events: list[dict]
+        """
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("".join(json.dumps(event, ensure_ascii=False) + "\n"
+                               for event in events))
+
+    def read(self) -> list[dict]:
+        """
+        Reads the events of the journal, in the order they were recorded.
+        An incomplete last line is ignored.
+
+        :return: The list of events.
+        :rtype: list[dict]
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        events = []
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print("Une ligne du journal du tournoi est mal formatée.")
+        return events
+
+    def clear(self):
+        """Removes the journal once its events are part of a snapshot."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def apply(self, tournament_data: dict) -> dict:
+        """
+        Replays the journal on the data of a saved tournament, to rebuild
+        the state expected by `Tournament.load`.
+
+        Replaying is idempotent: a round already present is replaced and
+        results carry the absolute scores of the players.
+
+        :param tournament_data: The tournament data read from its file.
+        :type tournament_data: dict
+        :return: The updated tournament data.
+        :rtype: dict
+        """
+        events = self.read()
+        if not events:
+            return tournament_data
+
+        players = {player["national_player_number"]: player
+                   for player in tournament_data["players"]}
+        rounds = tournament_data["rounds"]
+
+        for event in events:
+            if event["event"] == "round_start":
+                round_data = event["round"]
+                if len(rounds) >= round_data["round_number"]:
+                    rounds[round_data["round_number"] - 1] = round_data
+                else:
+                    rounds.append(round_data)
+                tournament_data["round_number"] = event["round_number"]
+
+            elif event["event"] == "result":
+                played_round = rounds[event["round_number"] - 1]
+                match = played_round["matches"][event["match_number"] - 1]
+                match["result"] = list(event["result"])
+                for player_number, score in event["scores"].items():
+                    players[player_number]["score"] = score
+
+            elif event["event"] == "round_end":
+                rounds[event["round_number"] - 1]["end_time"] = (
+                    event["end_time"])
+
+        return tournament_data
+
+
+class TournamentCatalog:
+    """le catalogue des tournois"""
+
+    FIELDS = ("name",
+              "place",
+              "description",
+              "start_date",
+              "end_date",
+              "round_number",
+              "max_round")
+
+    def __init__(self, path: str = TOURNAMENT_CATALOG_FILE_PATH):
+        """
+        Initializes the catalog of the saved tournaments.
+
+        The catalog holds the header of every tournament file (name, place,
+        dates, rounds and status) with the modification time and size of
+        the file and of its journal. An entry whose file has changed since
+        it was recorded is rebuilt from the file.
+
+        :param path: The path to the catalog JSON file.
+        :type path: str
+        """
+        self.path = path
+
+    @staticmethod
+    def file_signature(json_file: str) -> list:
+        """
+        Returns the modification time and size of a tournament file and
+        of its journal.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :rtype: list
+        """
+        signature = []
+        json_path = f"{TOURNAMENT_FILE_PATH}{json_file}"
+        for path in (json_path, f"{json_path}l"):
+            try:
+                stat = os.stat(path)
+                signature += [stat.st_mtime_ns, stat.st_size]
+            except FileNotFoundError:
+                signature += [0, 0]
+        return signature
+
+    def read(self) -> dict:
+        """
+        Reads the catalog entries, keyed by tournament file name.
+
+        :rtype: dict
+        """
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as file:
+            try:
+                return json.load(file)
+            except json.JSONDecodeError:
+                return {}
+
+    def write(self, catalog: dict):
+        """
+        Replaces the catalog file atomically.
+
+        :param catalog: The catalog entries, keyed by tournament file name.
+        :type catalog: dict
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary_file = f"{self.path}.tmp"
+        with file_lock(self.path).hold():
+            with open(temporary_file, "w", encoding="utf-8") as file:
+                json.dump(catalog, file, indent=4, ensure_ascii=False)
+            os.replace(temporary_file, self.path)
+
+    def entry(self, json_file: str, tournament_data: dict) -> dict:
+        """
+        Builds the catalog entry of a tournament.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :param tournament_data: The tournament data, or at least its header.
+        :type tournament_data: dict
+        :rtype: dict
+        """
+        entry = {field: tournament_data[field] for field in self.FIELDS}
+        entry["version"] = tournament_data["version"]
+        entry["file"] = json_file
+        entry["signature"] = self.file_signature(json_file)
+        return entry
+
+    def headers(self) -> list[dict]:
+        """
+        Returns the header of every saved tournament.
+
+        Only the tournament files that are missing from the catalog or have
+        changed since they were recorded, or that were recorded in an
+        older format, are parsed.
+
+        :return: A list of tournament headers.
+        :rtype: list[dict]
+        """
+        catalog = self.read()
+        updated_catalog = {}
+
+        for json_file in DataBase.find_tournaments_in_file():
+            entry = catalog.get(json_file)
+            if (entry is None or
+                    entry.get("version") != TOURNAMENT_FORMAT_VERSION or
+                    entry["signature"] != self.file_signature(json_file)):
+                tournament_data = DataBase.read_tournament(json_file)
+                if tournament_data is None:
+                    continue
+                entry = self.entry(json_file, tournament_data)
+            updated_catalog[json_file] = entry
+
+        if updated_catalog != catalog:
+            self.write(updated_catalog)
+
+        return list(updated_catalog.values())
+
+    def update(self, json_file: str, tournament_data: dict):
+        """
+        Records the header of a tournament that has just been saved.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :param tournament_data: The saved tournament data.
+        :type tournament_data: dict
+        """
+        with file_lock(self.path).hold():
+            catalog = self.read()
+            catalog[json_file] = self.entry(json_file, tournament_data)
+            self.write(catalog)
+
+
+class PlayerRegistry:
+    """le registre des joueurs"""
+
+    def __init__(self,
+                 path: str = PLAYERS_FILE_PATH,
+                 journal_path: str = PLAYERS_JOURNAL_FILE_PATH,
+                 journal_max_size: int = PLAYERS_JOURNAL_MAX_SIZE
+                 ):
+        """
+        Initializes an in-memory index of the players file.
+
+        The players are stored in a JSON snapshot and in an append-only
+        journal in JSON Lines format holding the players added since the
+        last compaction. Both are parsed once and kept in a dictionary keyed
+        by national player number. The snapshot is parsed again only when
+        its modification time or size changes, and only the new lines of
+        the journal are read when it grows.
+
+        :param path: The path to the players JSON snapshot.
+        :type path: str
+        :param journal_path: The path to the players journal.
+        :type journal_path: str
+        :param journal_max_size: The size in bytes above which the journal
+            is folded back into the snapshot.
+        :type journal_max_size: int
+        """
+        self.path = path
+        self.journal_path = journal_path
+        self.journal_max_size = journal_max_size
+        self.players = {}
+        self.signature = None
+        self.journal_offset = 0
+        self.orders = {}
+        self.search_index = None
+
+    def file_signature(self) -> tuple:
+        """
+        Returns the modification time and size of the players snapshot.
+
+        :return: A tuple (mtime in nanoseconds, size in bytes).
+        :rtype: tuple
+        """
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def journal_size(self) -> int:
+        """
+        Returns the size of the journal in bytes, 0 if it does not exist.
+
+        :rtype: int
+        """
+        try:
+            return os.path.getsize(self.journal_path)
+        except FileNotFoundError:
+            return 0
+
+    def refresh(self):
+        """
+        Reloads the snapshot if it has changed since the last parse, then
+        reads the lines appended to the journal since the last read.
+
+        Once a change is seen, the players file is locked shared, so that
+        another program cannot compact the journal between both reads.
+        """
+        DataBase.check_existence_json_file(self.path)
+        if (self.file_signature() == self.signature
+                and self.journal_size() == self.journal_offset):
+            return
+
+        with file_lock(self.path).hold(shared=True):
+            signature = self.file_signature()
+            journal_size = self.journal_size()
+
+            if (signature != self.signature
+                    or journal_size < self.journal_offset):
+                players = {}
+                with open(self.path, "r", encoding="utf-8") as file:
+                    try:
+                        for data in json.load(file):
+                            players.setdefault(
+                                data["national_player_number"], data)
+                    except json.JSONDecodeError:
+                        print("Le fichier JSON est mal formaté.")
+                self.players = players
+                self.signature = signature
+                self.journal_offset = 0
+                self.orders = {}
+                self.search_index = None
+
+            if journal_size > self.journal_offset:
+                self.read_journal()
+
+    def read_journal(self):
+        """
+        Reads the complete lines appended to the journal since the last
+        read. A line still being written is left for the next read.
+        """
+        with open(self.journal_path, "rb") as file:
+            file.seek(self.journal_offset)
+            content = file.read()
+
+        end = content.rfind(b"\n") + 1
+        for line in content[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                print("Une ligne du journal des joueurs est mal formatée.")
+                continue
+            if data["national_player_number"] in self.players:
+                continue
+            self.players[data["national_player_number"]] = data
+            self.orders = {}
+            if self.search_index is not None:
+                self.search_index.add(data)
+        self.journal_offset += end
+
+    def get(self, player_number: str) -> Union[dict, None]:
+        """
+        Returns the data of a player in constant time.
+
+        :param player_number: The national player number to search for.
+        :type player_number: str
+        :return: The player's data if found, otherwise `None`.
+        :rtype: dict or None
+        """
+        self.refresh()
+        return self.players.get(player_number)
+
+    def all(self) -> list[dict]:
+        """
+        Returns the data of every registered player.
+
+        :return: A list of player data dictionaries.
+        :rtype: list[dict]
+        """
+        self.refresh()
+        return list(self.players.values())
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> list[dict]:
+        """
+        Searches for players by the beginning of their name or first name,
+        or by similar names, with `search.PlayerSearchIndex`. The index is
+        built on the first search, then players read from the journal are
+        added to it; it is built again only if the snapshot is replaced by
+        another program.
+
+        :param text: The searched text.
+        :type text: str
+        :param limit: The maximum number of players returned.
+        :type limit: int
+        :return: A list of player data dictionaries, best matches first.
+        :rtype: list[dict]
+        """
+        self.refresh()
+        if self.search_index is None:
+            self.search_index = PlayerSearchIndex()
+            self.search_index.build(self.players.values())
+        return [self.players[number]
+                for number in self.search_index.search(text, limit)]
+
+    def order(self, criterion="national_player_number") -> list:
+        """
+        Returns the sort keys of the players, sorted. The list is kept
+        until the players change.
+
+        :param criterion: The sort order: "national_player_number", whose
+            keys are the national player numbers, or "name", whose keys
+            are (name, first name, national player number) tuples.
+        :type criterion: str
+        :rtype: list
+        """
+        self.refresh()
+        if criterion not in self.orders:
+            if criterion == "name":
+                self.orders[criterion] = sorted(
+                    (data["name"], data["first_name"], number)
+                    for number, data in self.players.items())
+            else:
+                self.orders[criterion] = sorted(self.players)
+        return self.orders[criterion]
+
+    def append(self, data: dict):
+        """
+        Appends a player to the journal, then compacts the journal if it
+        has grown past its maximum size.
+
+        The players file is locked meanwhile, so that players registered
+        at the same time by several programs are all kept. A player
+        already recorded, e.g. by another program, is not recorded again:
+        the first record is kept.
+
+        :param data: The data of the player to record.
+        :type data: dict
+        """
+        with file_lock(self.path).hold():
+            self.refresh()
+            if data["national_player_number"] in self.players:
+                return
+            with open(self.journal_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(data, ensure_ascii=False) + "\n")
+            self.refresh()
+
+            if self.journal_size() >= self.journal_max_size:
+                self.compact()
+
+    def compact(self):
+        """
+        Folds the journal back into the snapshot.
+
+        The snapshot is replaced atomically before the journal is removed,
+        so an interruption never loses a player: at worst, players already
+        in the snapshot are read again from the journal and ignored. The
+        players file is locked meanwhile, so that no player is appended
+        to the journal between both steps.
+        """
+        with file_lock(self.path).hold():
+            self.refresh()
+            temporary_file = f"{self.path}.tmp"
+            with open(temporary_file, "w", encoding="utf-8") as file:
+                json.dump(list(self.players.values()), file,
+                          indent=4, ensure_ascii=False)
+            os.replace(temporary_file, self.path)
+
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self.signature = self.file_signature()
+            self.journal_offset = 0
+
+
+class PlayedGame(NamedTuple):
+    """une partie jouée par un joueur"""
+
+    date: str
+    tournament: str
+    round_number: int
+    match_number: int
+    colour: str
+    opponent: str
+    result: Union[int, float, None]
+
+
+class PlayerHistory:
+    """l'historique des parties des joueurs"""
+
+    VERSION = 1
+    # the first player of a match is considered to play white
+    COLOURS = ("white", "black")
+    # number of tournament saves and journal events in the program, so
+    # that each index notices the changes made through another data base
+    changes = 0
+    changes_lock = threading.Lock()
+
+    def __init__(self, path: str = PLAYER_HISTORY_FILE_PATH):
+        """
+        Initializes the index of the games played by each player, across
+        all the saved tournaments.
+
+        The index maps each national player number to the list of its
+        games, sorted by tournament start date, round and match. Each game
+        is a `PlayedGame` holding the tournament file, the colour, the
+        opponent and the points scored, or `None` while the match has not
+        been played.
+
+        The lifetime score of each player and its record against each
+        opponent are computed with its sorted history, on the first query
+        following a change.
+
+        The index file holds, for each tournament, the modification time
+        and size of its file and of its journal, like the tournament
+        catalog, and its matches as compact rows
+        `[round_number, match_number, player1, player2, score1, score2]`.
+        It is read on the first query, and only the tournaments that
+        changed since they were indexed are read again. It is then kept up
+        to date by the saves and the journal events of the tournaments,
+        and the tournament files are checked again on the next query when
+        a tournament was saved through another data base.
+
+        :param path: The path to the index JSON file.
+        :type path: str
+        """
+        self.path = path
+        self.tournaments = {}
+        self.games = None
+        self.unprepared = set()
+        self.summaries = {}
+        self.changes_seen = None
+
+    @classmethod
+    def changed(cls):
+        """Notes that a tournament has been saved or has recorded events."""
+        with cls.changes_lock:
+            cls.changes += 1
+
+    def read(self):
+        """
+        Reads the index file and builds the histories in memory. A missing
+        or malformed file, or a file written in another version, gives an
+        empty index.
+        """
+        index = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as file:
+                try:
+                    index = json.load(file)
+                except json.JSONDecodeError:
+                    pass
+        if index.get("version") != self.VERSION:
+            index = {}
+        self.tournaments = index.get("tournaments", {})
+        self.games = {}
+        self.unprepared = set()
+        self.summaries = {}
+        for json_file in self.tournaments:
+            self.index(json_file, self.tournaments[json_file]["matches"])
+
+    def write(self):
+        """Replaces the index file atomically."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary_file = f"{self.path}.tmp"
+        with file_lock(self.path).hold():
+            with open(temporary_file, "w", encoding="utf-8") as file:
+                file.write(json.dumps({"version": self.VERSION,
+                                       "tournaments": self.tournaments},
+                                      ensure_ascii=False))
+            os.replace(temporary_file, self.path)
+
+    def load(self):
+        """
+        Reads the index if it is not in memory, then indexes the
+        tournament files that are missing from it or have changed, and
+        forgets the deleted ones. Once the index is in memory, the files
+        are only checked again when a tournament has changed since, see
+        `changed`.
+        """
+        if self.games is None:
+            self.read()
+        elif self.changes_seen == self.changes:
+            return
+        self.changes_seen = self.changes
+
+        changed = False
+        tournament_files = DataBase.find_tournaments_in_file()
+        for json_file in set(self.tournaments) - set(tournament_files):
+            self.remove(json_file)
+            changed = True
+        for json_file in tournament_files:
+            entry = self.tournaments.get(json_file)
+            if (entry is None or entry["signature"] !=
+                    TournamentCatalog.file_signature(json_file)):
+                tournament_data = DataBase.read_tournament(json_file)
+                if tournament_data is not None:
+                    self.add(json_file, tournament_data)
+                    changed = True
+        if changed:
+            self.write()
+
+    def index(self, json_file: str, rows: list[list]):
+        """
+        Adds the games of some matches of a tournament to the histories of
+        their players. Games are added as plain tuples, and the histories
+        are sorted and converted to `PlayedGame` on their next query.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :param rows: The matches, as rows of the index file.
+        :type rows: list[list]
+        """
+        date = self.tournaments[json_file]["start_date"]
+        for round_number, match_number, *players, score1, score2 in rows:
+            played = score1 or score2
+            scores = (score1, score2)
+            for side in (0, 1):
+                self.games.setdefault(players[side], []).append((
+                    date,
+                    json_file,
+                    round_number,
+                    match_number,
+                    self.COLOURS[side],
+                    players[1 - side],
+                    scores[side] if played else None
+                ))
+            self.unprepared.update(players)
+
+    def forget(self, json_file: str, rows: list[list]):
+        """
+        Removes the games of some matches of a tournament from the
+        histories of their players.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :param rows: The matches, as rows of the index file.
+        :type rows: list[list]
+        """
+        matches = {(row[0], row[1]) for row in rows}
+        for player_number in {player_number
+                              for row in rows
+                              for player_number in row[2:4]}:
+            # games are compared as tuples: they may not be prepared yet
+            games = [game for game in self.games.get(player_number, [])
+                     if game[1] != json_file or
+                     (game[2], game[3]) not in matches]
+            if games:
+                self.games[player_number] = games
+            else:
+                self.games.pop(player_number, None)
+            self.unprepared.add(player_number)
+
+    def remove(self, json_file: str):
+        """
+        Forgets the games of a tournament.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        """
+        entry = self.tournaments.pop(json_file, None)
+        if entry is not None:
+            self.forget(json_file, entry["matches"])
+
+    def add(self, json_file: str, tournament_data: dict):
+        """
+        Indexes the games of a tournament, replacing those already indexed.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :param tournament_data: The tournament data, in the current format.
+        :type tournament_data: dict
+        """
+        self.remove(json_file)
+        self.tournaments[json_file] = {
+            "signature": TournamentCatalog.file_signature(json_file),
+            "start_date": tournament_data["start_date"],
+            "matches": [self.row(played_round["round_number"], match)
+                        for played_round in tournament_data["rounds"]
+                        for match in played_round["matches"]]
+        }
+        self.index(json_file, self.tournaments[json_file]["matches"])
+
+    @staticmethod
+    def row(round_number: int, match: dict) -> list:
+        """
+        Converts a match into a row of the index file.
+
+        :param round_number: The number of the round of the match.
+        :type round_number: int
+        :param match: The match data, in the current format.
+        :type match: dict
+        :rtype: list
+        """
+        return [round_number, match["match_number"],
+                *match["players"], *match["result"]]
+
+    def update(self, json_file: str, tournament_data: dict):
+        """
+        Indexes a tournament that has just been saved, and saves the index.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :param tournament_data: The saved tournament data.
+        :type tournament_data: dict
+        """
+        self.changed()
+        if self.games is None:
+            # not read yet: the tournament file has changed, so it will be
+            # indexed again when the index is read.
+            return
+        self.add(json_file, tournament_data)
+        self.write()
+
+    def apply(self, json_file: str, start_date: str, event: dict):
+        """
+        Applies a journal event of a tournament to the index in memory.
+
+        The index file is not written: the journal has grown, so the
+        tournament will be indexed again from its file if the index is
+        read before the next save.
+
+        :param json_file: The name of the tournament file.
+        :type json_file: str
+        :param start_date: The start date of the tournament, ISO-8601.
+        :type start_date: str
+        :param event: The event recorded in the journal.
+        :type event: dict
+        """
+        self.changed()
+        if self.games is None:
+            return
+        entry = self.tournaments.setdefault(
+            json_file, {"signature": [], "start_date": start_date,
+                        "matches": []})
+
+        if event["event"] == "round_start":
+            round_number = event["round"]["round_number"]
+            replaced = [row for row in entry["matches"]
+                        if row[0] == round_number]
+            self.forget(json_file, replaced)
+            rows = [self.row(round_number, match)
+                    for match in event["round"]["matches"]]
+            entry["matches"] = [row for row in entry["matches"]
+                                if row[0] != round_number] + rows
+            self.index(json_file, rows)
+
+        elif event["event"] == "result":
+            for row in reversed(entry["matches"]):
+                if row[:2] == [event["round_number"],
+                               event["match_number"]]:
+                    self.forget(json_file, [row])
+                    row[4:] = event["result"]
+                    self.index(json_file, [row])
+                    break
+
+    def history(self, player_number: str) -> list[PlayedGame]:
+        """
+        Returns the games of a player, oldest first.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :rtype: list[PlayedGame]
+        """
+        self.load()
+        if player_number in self.unprepared:
+            self.prepare(player_number)
+        return list(self.games.get(player_number, []))
+
+    def prepare(self, player_number: str):
+        """
+        Sorts the history of a player, converts its games to `PlayedGame`
+        and computes its lifetime score and its head-to-head records.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        """
+        self.unprepared.discard(player_number)
+        if player_number not in self.games:
+            self.summaries.pop(player_number, None)
+            return
+        games = sorted(map(PlayedGame._make, self.games[player_number]),
+                       key=lambda game: game[:4])
+        self.games[player_number] = games
+
+        half_points = 0
+        records = {}
+        for game in games:
+            if game.result is not None:
+                points = round(2 * game.result)
+                half_points += points
+                records.setdefault(game.opponent, [0, 0, 0])[2 - points] += 1
+        self.summaries[player_number] = (half_points, records)
+
+    def summary(self, player_number: str) -> tuple[int, dict]:
+        """
+        Returns the lifetime score of a player, in half-points, and its
+        wins, draws and losses against each opponent.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :rtype: tuple[int, dict[str, list[int]]]
+        """
+        self.history(player_number)
+        return self.summaries.get(player_number, (0, {}))
 
 
 class DataBase:
 
+    player_registry = PlayerRegistry()
+
+    def __init__(self):
+        # index of the games of the players, read on its first query, and
+        # the lock held while it is queried or changed, as the data base
+        # may be used by several threads
+        self.player_history = PlayerHistory()
+        self.lock = threading.RLock()
+
     @staticmethod
     def check_existence_json_file(path: str):
         """
@@ -489,23 +1973,113 @@ class DataBase:
         :rtype: dict or None
         """
 
-        self.check_existence_json_file(PLAYERS_FILE_PATH)
+        return self.player_registry.get(player_number)
 
-        found_player = None
-        with open(PLAYERS_FILE_PATH, "r", encoding="utf-8") as file:
-            try:
-                players_data = json.load(file)
-                for data in players_data:
-                    if data["national_player_number"] == player_number:
-                        found_player = data
-                        break
-            except json.JSONDecodeError:
-                print("Le fichier JSON est mal formaté.")
-        return found_player
+    def find_players_in_json(self) -> list[dict]:
+        """
+        Retrieves the data of every registered player, from the players
+        file and its journal.
+
+        :return: A list of player data dictionaries.
+        :rtype: list[dict]
+        """
+        return self.player_registry.all()
+
+    def iter_players(self,
+                     criterion="national_player_number") -> Iterator[dict]:
+        """
+        Yields the data of every registered player one at a time, without
+        copying the player list.
+
+        :param criterion: The sort order: "national_player_number" or
+            "name".
+        :type criterion: str
+        :return: The player data dictionaries.
+        :rtype: Iterator[dict]
+        """
+        order = self.player_registry.order(criterion)
+        players = self.player_registry.players
+        for key in order:
+            yield players[key[-1] if criterion == "name" else key]
+
+    def search_players(self,
+                       text: str,
+                       limit: int = SEARCH_LIMIT) -> list[dict]:
+        """
+        Searches for players by the beginning of their name or first name,
+        accents and case being ignored, then by similar names.
+
+        :param text: The searched text, e.g. "dup" or "Dupond Jean".
+        :type text: str
+        :param limit: The maximum number of players returned.
+        :type limit: int
+        :return: A list of player data dictionaries, best matches first.
+        :rtype: list[dict]
+        """
+        return self.player_registry.search(text, limit)
+
+    def count_players(self) -> int:
+        """
+        Returns the number of registered players.
+
+        :rtype: int
+        """
+        self.player_registry.refresh()
+        return len(self.player_registry.players)
+
+    def find_players_page(self,
+                          criterion: str,
+                          offset: int,
+                          limit: int) -> list[dict]:
+        """
+        Retrieves a page of the registered players.
+
+        :param criterion: The sort order: "national_player_number" or
+            "name".
+        :type criterion: str
+        :param offset: The position of the first player of the page.
+        :type offset: int
+        :param limit: The number of players of the page.
+        :type limit: int
+        :return: A list of player data dictionaries.
+        :rtype: list[dict]
+        """
+        keys = self.player_registry.order(criterion)[offset:offset + limit]
+        players = self.player_registry.players
+        return [players[key[-1] if criterion == "name" else key]
+                for key in keys]
+
+    def find_player_position(self,
+                             criterion: str,
+                             prefix: str) -> Union[int, None]:
+        """
+        Searches for the first player, in a sort order, whose national
+        player number or name starts with a prefix.
+
+        :param criterion: The sort order, which is also the field searched:
+            "national_player_number" or "name".
+        :type criterion: str
+        :param prefix: The beginning of the national player number or of
+            the name.
+        :type prefix: str
+        :return: The position of the player in the sort order, or `None`
+            if no player matches.
+        :rtype: int or None
+        """
+        order = self.player_registry.order(criterion)
+        if criterion == "name":
+            position = bisect_left(order, (prefix,))
+            found = position < len(order) and order[position][0]
+        else:
+            position = bisect_left(order, prefix)
+            found = position < len(order) and order[position]
+        if found and found.startswith(prefix):
+            return position
+        return None
 
     @staticmethod
     def write_new_player_in_json(player):
-        """Write a new player in the Json file
+        """Write a new player in the players journal
 
         :param player: instances de Player.
         """
@@ -516,18 +2090,7 @@ class DataBase:
             "birthday": player.birthday,
             "score": player.score
         }
-        if not os.path.exists(PLAYERS_FILE_PATH):
-            with open(PLAYERS_FILE_PATH, "w", encoding="utf-8") as file:
-                json.dump([], file)
-
-        with open(PLAYERS_FILE_PATH, "r", encoding="utf-8") as file:
-            players_data = json.load(file)
-
-        players_data.append(data)
-
-        with open(PLAYERS_FILE_PATH, "w", encoding="utf-8") as file:
-            json.dump(players_data, file, indent=4, ensure_ascii=False)
-
+        DataBase.player_registry.append(data)
         return
 
     @staticmethod
@@ -548,10 +2111,147 @@ class DataBase:
 
         return tournaments_files
 
+    def save_tournament(self, tournament: Tournament):
+        """
+        Saves the tournament data to a JSON file.
+
+        The method serializes the tournament details,
+        including players, rounds, and matches,
+        into a JSON file.
+        The JSON file is saved in the directory `data/tournaments/`
+        with the tournament name as the filename.
+        The events recorded in the journal since the previous save are
+        part of this snapshot, so the journal is cleared.
+
+        Several programs may save the same tournament, e.g. two
+        registration desks. The tournament file is locked meanwhile and
+        replaced atomically, so that it is never read half-written, and
+        each save increments the "revision" stored in it. If the file or
+        its journal has changed since this program last wrote them, the
+        stored tournament is read and its changes are merged into
+        `tournament` first, see `Tournament.merge`, instead of being
+        overwritten.
+
+        :param tournament: The tournament to save.
+        :type tournament: Tournament
+        """
+        json_file = f"{tournament.name}.json"
+        json_path = f"{TOURNAMENT_FILE_PATH}{json_file}"
+        os.makedirs(TOURNAMENT_FILE_PATH, exist_ok=True)
+
+        # the lock of the data base is taken first, as by the queries of
+        # the player history, which read the tournament files
+        with self.lock, file_lock(json_path).hold():
+            revision = tournament.revision or 0
+            if (tournament.revision is not None
+                    and os.path.exists(json_path)
+                    and TournamentCatalog.file_signature(json_file)
+                    != tournament.signature):
+                stored_tournament = self.read_tournament(json_file)
+                if stored_tournament is not None:
+                    tournament.merge(stored_tournament)
+                    revision = max(revision,
+                                   stored_tournament.get("revision", 0))
+
+            data = tournament.serialize()
+            data["revision"] = revision + 1
+
+            temporary_file = f"{json_path}.tmp"
+            with open(temporary_file, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=4, ensure_ascii=False)
+            os.replace(temporary_file, json_path)
+
+            TournamentJournal(tournament.name).clear()
+            tournament.journal_events = 0
+            tournament.revision = data["revision"]
+            tournament.signature = TournamentCatalog.file_signature(
+                json_file)
+            TournamentCatalog().update(json_file, data)
+            self.player_history.update(json_file, data)
+
+    def record_tournament_event(self, tournament: Tournament, event: dict):
+        """
+        Appends an event to the tournament journal instead of rewriting the
+        whole tournament file, see `record_tournament_events`.
+
+        :param tournament: The tournament the event belongs to.
+        :type tournament: Tournament
+        :param event: The event to record.
+        :type event: dict
+        """
+        self.record_tournament_events(tournament, [event])
+
+    def record_tournament_events(self,
+                                 tournament: Tournament,
+                                 events: list[dict]):
+        """
+        Appends events to the tournament journal in a single write. A full
+        snapshot is saved, with `Tournament.save`, once the journal holds
+        `TOURNAMENT_JOURNAL_MAX_EVENTS` events.
+
+        The tournament file is locked meanwhile, so that a snapshot saved
+        by another program does not clear the journal before the events
+        are read.
+
+        :param tournament: The tournament the events belong to.
+        :type tournament: Tournament
+        :param events: The events to record, in order.
+        :type events: list[dict]
+        """
+        json_file = f"{tournament.name}.json"
+        with self.lock, file_lock(
+                f"{TOURNAMENT_FILE_PATH}{json_file}").hold():
+            unchanged = (TournamentCatalog.file_signature(json_file)
+                         == tournament.signature)
+            TournamentJournal(tournament.name).extend(events)
+            # events of other programs are still to be merged
+            if unchanged:
+                tournament.signature = TournamentCatalog.file_signature(
+                    json_file)
+
+            start_date = encode_timestamp(tournament.start_date)
+            for event in events:
+                self.player_history.apply(json_file, start_date, event)
+            tournament.journal_events += len(events)
+        # saved once the file is unlocked, as `Tournament.lock` is taken
+        # before the lock of the file
+        if tournament.journal_events >= TOURNAMENT_JOURNAL_MAX_EVENTS:
+            tournament.save()
+
+    @staticmethod
+    def read_tournament(json_file: str) -> Union[dict, None]:
+        """
+        Reads the full data of a tournament, including the events of its
+        journal. The tournament file is locked shared meanwhile, so that
+        both are read as saved by the same program.
+
+        :param json_file: The name of the tournament file in the
+            "data/tournaments/" directory.
+        :type json_file: str
+        :return: The tournament data, or `None` if the file is malformed.
+        :rtype: dict or None
+        """
+        json_path = f"{TOURNAMENT_FILE_PATH}{json_file}"
+
+        with file_lock(json_path).hold(shared=True):
+            with open(json_path, "r", encoding="utf-8") as file:
+                try:
+                    tournament_data = json.load(file)
+                except json.JSONDecodeError:
+                    print("Le fichier JSON est mal formaté.")
+                    return None
+
+            return TournamentJournal(tournament_data["name"]).apply(
+                upgrade_tournament_data(tournament_data))
+
     def find_tournaments(self, criterion="all") -> list[dict]:
         """
         Searches for tournaments based on the specified criterion and
-        retrieves their data.
+        retrieves their header from the tournament catalog.
+
+        The headers hold the fields listed in `TournamentCatalog.FIELDS`
+        and the name of the tournament file in the "file" key; the full
+        data of a tournament is read with `read_tournament`.
 
         :param criterion: Filter for tournaments. Options are:
             - "all": Retrieves all tournaments.
@@ -559,32 +2259,69 @@ class DataBase:
             - "ended": Retrieves tournaments that have ended.
             Defaults to "all".
         :type criterion: str, optional
-        :return: A list of tournament data dictionaries matching the
+        :return: A list of tournament headers matching the
                     specified criterion.
         :rtype: list[dict]
         """
-        tournaments_json_files = self.find_tournaments_in_file()
         find_tournament = []
 
-        for json_file in tournaments_json_files:
-            json_path = f"{TOURNAMENT_FILE_PATH}{json_file}"
-
-            with (open(json_path, "r", encoding="utf-8") as file):
-                try:
-                    tournament_data = json.load(file)
-                    if criterion == "no_ended":
-                        if tournament_data["end_date"] is None:
-                            find_tournament.append(tournament_data)
-                    elif criterion == "ended":
-                        if tournament_data["end_date"] is not None:
-                            find_tournament.append(tournament_data)
-                    else:
-                        find_tournament.append(tournament_data)
+        for tournament_header in TournamentCatalog().headers():
+            if criterion == "no_ended":
+                if tournament_header["end_date"] is None:
+                    find_tournament.append(tournament_header)
+            elif criterion == "ended":
+                if tournament_header["end_date"] is not None:
+                    find_tournament.append(tournament_header)
+            else:
+                find_tournament.append(tournament_header)
 
-                except json.JSONDecodeError:
-                    print("Le fichier JSON est mal formaté.")
         return find_tournament
 
+    def find_player_history(self, player_number: str) -> list[PlayedGame]:
+        """
+        Returns every game played by a player in the saved tournaments,
+        oldest first.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :rtype: list[PlayedGame]
+        """
+        with self.lock:
+            return self.player_history.history(player_number)
+
+    def find_head_to_head(self,
+                          player_number: str,
+                          opponent_number: str) -> tuple[int, int, int]:
+        """
+        Returns the record of a player against an opponent, counting only
+        the matches already played.
+
+        :param player_number: The national player number of the player.
+        :type player_number: str
+        :param opponent_number: The national player number of the
+            opponent.
+        :type opponent_number: str
+        :return: The number of wins, draws and losses of the player.
+        :rtype: tuple[int, int, int]
+        """
+        with self.lock:
+            wins, draws, losses = self.player_history.summary(
+                player_number)[1].get(opponent_number, (0, 0, 0))
+        return wins, draws, losses
+
+    def find_lifetime_score(self, player_number: str) -> Union[int, float]:
+        """
+        Returns the total of the points scored by a player in the saved
+        tournaments.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :rtype: int or float
+        """
+        with self.lock:
+            half_points = self.player_history.summary(player_number)[0]
+        return half_points_to_score(half_points)
+
     @staticmethod
     def sort_players(players: List[Player],
                      criterion="name",
@@ -621,3 +2358,17 @@ class DataBase:
                 "'national_player_number' ou 'score'.")
 
         return sorted(players, key=sort_keys[criterion], reverse=reverse)
+
+
+def open_data_base() -> DataBase:
+    """
+    Returns the data base selected by `STORAGE_BACKEND` in the settings.
+
+    :return: A `DataBase` storing data in JSON files, or a `SQLiteDataBase`
+        storing data in a SQLite file.
+    :rtype: DataBase
+    """
+    if STORAGE_BACKEND == "sqlite":
+        from sqlite_database import SQLiteDataBase
+        return SQLiteDataBase()
+    return DataBase()
@@ -0,0 +1,523 @@
+from operator import add
+from typing import TYPE_CHECKING, List, Union
+
+from settings import PAIRING_WINDOW
+
+if TYPE_CHECKING:
+    from models import Player
+
+
+def max_weight_matching(edges: list[tuple[int, int, int]],
+                        max_cardinality: bool = False) -> list[int]:
+    """
+    Computes a maximum-weight matching of a general graph with Edmonds'
+    blossom algorithm, in O(n³) time.
+
+    The implementation follows the primal-dual method described by Galil
+    ("Efficient algorithms for finding maximum matching in graphs", 1986).
+    With integer weights, every computation is done on integers.
+
+    :param edges: The edges of the graph, as (vertex, vertex, weight)
+        tuples. Vertices are integers from 0 to n - 1.
+    :type edges: list[tuple[int, int, int]]
+    :param max_cardinality: If True, only maximum-cardinality matchings are
+        considered, and the one with the largest weight among them is
+        returned.
+    :type max_cardinality: bool
+    :return: A list `mate` such that `mate[v]` is the vertex matched to `v`,
+        or -1 if `v` is single.
+    :rtype: list[int]
+    """
+    if not edges:
+        return []
+
+    edges_number = len(edges)
+    vertices_number = 1 + max(max(i, j) for i, j, _ in edges)
+    max_weight = max(0, max(weight for _, _, weight in edges))
+
+    # endpoint[p] is the vertex at endpoint p; edge k has endpoints 2k, 2k+1
+    endpoint = [edges[p // 2][p % 2] for p in range(2 * edges_number)]
+    # neighbour_ends[v] lists the remote endpoints of the edges of v
+    neighbour_ends = [[] for _ in range(vertices_number)]
+    for k, (i, j, _) in enumerate(edges):
+        neighbour_ends[i].append(2 * k + 1)
+        neighbour_ends[j].append(2 * k)
+
+    # mate[v] is the remote endpoint of the matched edge of v, or -1
+    mate = vertices_number * [-1]
+    # label of a top-level blossom: 0 free, 1 S-vertex, 2 T-vertex
+    label = (2 * vertices_number) * [0]
+    label_end = (2 * vertices_number) * [-1]
+    in_blossom = list(range(vertices_number))
+    blossom_parent = (2 * vertices_number) * [-1]
+    blossom_children = (2 * vertices_number) * [None]
+    blossom_base = list(range(vertices_number)) + vertices_number * [-1]
+    blossom_endpoints = (2 * vertices_number) * [None]
+    best_edge = (2 * vertices_number) * [-1]
+    blossom_best_edges = (2 * vertices_number) * [None]
+    unused_blossoms = list(range(vertices_number, 2 * vertices_number))
+    top_blossoms = set()
+    dual = vertices_number * [max_weight] + vertices_number * [0]
+    allowed_edge = edges_number * [False]
+    queue = []
+    # vertices and blossoms whose best edge was set during the stage
+    free_candidates = []
+    s_candidates = []
+
+    # Start from a greedy matching of the edges that are already tight.
+    for k, (i, j, weight) in enumerate(edges):
+        if weight == max_weight and mate[i] == -1 and mate[j] == -1:
+            mate[i] = 2 * k + 1
+            mate[j] = 2 * k
+
+    def slack(k):
+        i, j, weight = edges[k]
+        return dual[i] + dual[j] - 2 * weight
+
+    def blossom_leaves(b):
+        if b < vertices_number:
+            return [b]
+        leaves = []
+        stack = [b]
+        while stack:
+            for child in blossom_children[stack.pop()]:
+                if child < vertices_number:
+                    leaves.append(child)
+                else:
+                    stack.append(child)
+        return leaves
+
+    def assign_label(w, t, p):
+        b = in_blossom[w]
+        label[w] = label[b] = t
+        label_end[w] = label_end[b] = p
+        best_edge[w] = best_edge[b] = -1
+        if t == 1:
+            queue.extend(blossom_leaves(b))
+        elif t == 2:
+            base = blossom_base[b]
+            assign_label(endpoint[mate[base]], 1, mate[base] ^ 1)
+
+    def scan_blossom(v, w):
+        # Trace back from v and w to find a new blossom or an augmenting
+        # path; return the base of the blossom, or -1.
+        path = []
+        base = -1
+        while v != -1 or w != -1:
+            b = in_blossom[v]
+            if label[b] & 4:
+                base = blossom_base[b]
+                break
+            path.append(b)
+            label[b] = 5
+            if label_end[b] == -1:
+                v = -1
+            else:
+                v = endpoint[label_end[b]]
+                b = in_blossom[v]
+                v = endpoint[label_end[b]]
+            if w != -1:
+                v, w = w, v
+        for b in path:
+            label[b] = 1
+        return base
+
+    def add_blossom(base, k):
+        v, w, _ = edges[k]
+        base_blossom = in_blossom[base]
+        blossom_v = in_blossom[v]
+        blossom_w = in_blossom[w]
+        b = unused_blossoms.pop()
+        blossom_base[b] = base
+        blossom_parent[b] = -1
+        blossom_parent[base_blossom] = b
+        blossom_children[b] = path = []
+        blossom_endpoints[b] = endpoints = []
+        while blossom_v != base_blossom:
+            blossom_parent[blossom_v] = b
+            path.append(blossom_v)
+            endpoints.append(label_end[blossom_v])
+            v = endpoint[label_end[blossom_v]]
+            blossom_v = in_blossom[v]
+        path.append(base_blossom)
+        path.reverse()
+        endpoints.reverse()
+        endpoints.append(2 * k)
+        while blossom_w != base_blossom:
+            blossom_parent[blossom_w] = b
+            path.append(blossom_w)
+            endpoints.append(label_end[blossom_w] ^ 1)
+            w = endpoint[label_end[blossom_w]]
+            blossom_w = in_blossom[w]
+        label[b] = 1
+        label_end[b] = label_end[base_blossom]
+        dual[b] = 0
+        top_blossoms.difference_update(path)
+        top_blossoms.add(b)
+        for v in blossom_leaves(b):
+            if label[in_blossom[v]] == 2:
+                queue.append(v)
+            in_blossom[v] = b
+
+        best_edge_to = {}
+        for child in path:
+            if blossom_best_edges[child] is None:
+                edge_lists = [[p // 2 for p in neighbour_ends[v]]
+                              for v in blossom_leaves(child)]
+            else:
+                edge_lists = [blossom_best_edges[child]]
+            for edge_list in edge_lists:
+                for k in edge_list:
+                    i, j, _ = edges[k]
+                    if in_blossom[j] == b:
+                        i, j = j, i
+                    other = in_blossom[j]
+                    if (other != b and label[other] == 1 and
+                            (other not in best_edge_to or
+                             slack(k) < slack(best_edge_to[other]))):
+                        best_edge_to[other] = k
+            blossom_best_edges[child] = None
+            best_edge[child] = -1
+        blossom_best_edges[b] = list(best_edge_to.values())
+        best_edge[b] = -1
+        for k in blossom_best_edges[b]:
+            if best_edge[b] == -1 or slack(k) < slack(best_edge[b]):
+                best_edge[b] = k
+        s_candidates.append(b)
+
+    def run_nested(steps):
+        # Blossoms may be nested thousands of levels deep, deeper than the
+        # recursion limit: the recursive steps are generators that yield
+        # the arguments of their nested calls, run here with an explicit
+        # stack, in the same order as a recursion would.
+        stack = [steps]
+        while stack:
+            for nested_steps in stack[-1]:
+                stack.append(nested_steps)
+                break
+            else:
+                stack.pop()
+
+    def expand_blossom(b, end_stage):
+        run_nested(expand_blossom_steps(b, end_stage))
+
+    def expand_blossom_steps(b, end_stage):
+        for child in blossom_children[b]:
+            blossom_parent[child] = -1
+            if child < vertices_number:
+                in_blossom[child] = child
+            elif end_stage and dual[child] == 0:
+                yield expand_blossom_steps(child, end_stage)
+            else:
+                top_blossoms.add(child)
+                for v in blossom_leaves(child):
+                    in_blossom[v] = child
+
+        if not end_stage and label[b] == 2:
+            # Relabel the sub-blossoms on the path from the entry child to
+            # the base, which become T- and S-blossoms.
+            entry_child = in_blossom[endpoint[label_end[b] ^ 1]]
+            j = blossom_children[b].index(entry_child)
+            if j & 1:
+                j -= len(blossom_children[b])
+                step = 1
+                trick = 0
+            else:
+                step = -1
+                trick = 1
+            p = label_end[b]
+            while j != 0:
+                label[endpoint[p ^ 1]] = 0
+                label[endpoint[
+                    blossom_endpoints[b][j - trick] ^ trick ^ 1]] = 0
+                assign_label(endpoint[p ^ 1], 2, p)
+                allowed_edge[blossom_endpoints[b][j - trick] // 2] = True
+                j += step
+                p = blossom_endpoints[b][j - trick] ^ trick
+                allowed_edge[p // 2] = True
+                j += step
+            child = blossom_children[b][j]
+            label[endpoint[p ^ 1]] = label[child] = 2
+            label_end[endpoint[p ^ 1]] = label_end[child] = p
+            best_edge[child] = -1
+            j += step
+            while blossom_children[b][j] != entry_child:
+                child = blossom_children[b][j]
+                if label[child] == 1:
+                    j += step
+                    continue
+                for v in blossom_leaves(child):
+                    if label[v] != 0:
+                        break
+                if label[v] != 0:
+                    label[v] = 0
+                    label[endpoint[mate[blossom_base[child]]]] = 0
+                    assign_label(v, 2, label_end[v])
+                j += step
+
+        label[b] = label_end[b] = -1
+        blossom_children[b] = blossom_endpoints[b] = None
+        blossom_base[b] = -1
+        blossom_best_edges[b] = None
+        best_edge[b] = -1
+        unused_blossoms.append(b)
+        top_blossoms.discard(b)
+
+    def augment_blossom(b, v):
+        run_nested(augment_blossom_steps(b, v))
+
+    def augment_blossom_steps(b, v):
+        # Swap matched and unmatched edges inside blossom b so that v
+        # becomes its base.
+        t = v
+        while blossom_parent[t] != b:
+            t = blossom_parent[t]
+        if t >= vertices_number:
+            yield augment_blossom_steps(t, v)
+        i = j = blossom_children[b].index(t)
+        if i & 1:
+            j -= len(blossom_children[b])
+            step = 1
+            trick = 0
+        else:
+            step = -1
+            trick = 1
+        while j != 0:
+            j += step
+            t = blossom_children[b][j]
+            p = blossom_endpoints[b][j - trick] ^ trick
+            if t >= vertices_number:
+                yield augment_blossom_steps(t, endpoint[p])
+            j += step
+            t = blossom_children[b][j]
+            if t >= vertices_number:
+                yield augment_blossom_steps(t, endpoint[p ^ 1])
+            mate[endpoint[p]] = p ^ 1
+            mate[endpoint[p ^ 1]] = p
+        blossom_children[b] = (blossom_children[b][i:]
+                               + blossom_children[b][:i])
+        blossom_endpoints[b] = (blossom_endpoints[b][i:]
+                                + blossom_endpoints[b][:i])
+        blossom_base[b] = blossom_base[blossom_children[b][0]]
+
+    def augment_matching(k):
+        v, w, _ = edges[k]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                blossom_s = in_blossom[s]
+                if blossom_s >= vertices_number:
+                    augment_blossom(blossom_s, s)
+                mate[s] = p
+                if label_end[blossom_s] == -1:
+                    break
+                t = endpoint[label_end[blossom_s]]
+                blossom_t = in_blossom[t]
+                s = endpoint[label_end[blossom_t]]
+                j = endpoint[label_end[blossom_t] ^ 1]
+                if blossom_t >= vertices_number:
+                    augment_blossom(blossom_t, j)
+                mate[j] = label_end[blossom_t]
+                p = label_end[blossom_t] ^ 1
+
+    for _ in range(vertices_number):
+        # Each stage looks for one augmenting path.
+        label[:] = (2 * vertices_number) * [0]
+        best_edge[:] = (2 * vertices_number) * [-1]
+        blossom_best_edges[vertices_number:] = vertices_number * [None]
+        allowed_edge[:] = edges_number * [False]
+        queue[:] = []
+        free_candidates[:] = []
+        s_candidates[:] = []
+
+        for v in range(vertices_number):
+            if mate[v] == -1 and label[in_blossom[v]] == 0:
+                assign_label(v, 1, -1)
+
+        augmented = False
+        while True:
+            while queue and not augmented:
+                v = queue.pop()
+                for p in neighbour_ends[v]:
+                    k = p // 2
+                    w = endpoint[p]
+                    if in_blossom[v] == in_blossom[w]:
+                        continue
+                    if not allowed_edge[k]:
+                        k_slack = slack(k)
+                        if k_slack <= 0:
+                            allowed_edge[k] = True
+                    if allowed_edge[k]:
+                        if label[in_blossom[w]] == 0:
+                            assign_label(w, 2, p ^ 1)
+                        elif label[in_blossom[w]] == 1:
+                            base = scan_blossom(v, w)
+                            if base >= 0:
+                                add_blossom(base, k)
+                            else:
+                                augment_matching(k)
+                                augmented = True
+                                break
+                        elif label[w] == 0:
+                            label[w] = 2
+                            label_end[w] = p ^ 1
+                    elif label[in_blossom[w]] == 1:
+                        b = in_blossom[v]
+                        if best_edge[b] == -1:
+                            s_candidates.append(b)
+                            best_edge[b] = k
+                        elif k_slack < slack(best_edge[b]):
+                            best_edge[b] = k
+                    elif label[w] == 0:
+                        if best_edge[w] == -1:
+                            free_candidates.append(w)
+                            best_edge[w] = k
+                        elif k_slack < slack(best_edge[w]):
+                            best_edge[w] = k
+
+            if augmented:
+                break
+
+            # No augmenting path with the current duals: update them.
+            delta_type = -1
+            delta = delta_edge = delta_blossom = None
+            if not max_cardinality:
+                delta_type = 1
+                delta = min(dual[:vertices_number])
+            vertex_labels = list(map(label.__getitem__, in_blossom))
+            for v in free_candidates:
+                if vertex_labels[v] == 0 and best_edge[v] != -1:
+                    d = slack(best_edge[v])
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 2
+                        delta_edge = best_edge[v]
+            for b in s_candidates:
+                if (blossom_parent[b] == -1 and label[b] == 1 and
+                        best_edge[b] != -1):
+                    d = slack(best_edge[b]) // 2
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 3
+                        delta_edge = best_edge[b]
+            for b in top_blossoms:
+                if (label[b] == 2 and
+                        (delta_type == -1 or dual[b] < delta)):
+                    delta = dual[b]
+                    delta_type = 4
+                    delta_blossom = b
+            if delta_type == -1:
+                # Maximum cardinality reached.
+                delta_type = 1
+                delta = max(0, min(dual[:vertices_number]))
+
+            shift = (0, -delta, delta)
+            dual[:vertices_number] = list(map(
+                add,
+                dual[:vertices_number],
+                map(shift.__getitem__, vertex_labels)))
+            for b in top_blossoms:
+                if label[b] == 1:
+                    dual[b] += delta
+                elif label[b] == 2:
+                    dual[b] -= delta
+
+            if delta_type == 1:
+                break
+            elif delta_type == 2:
+                allowed_edge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                if label[in_blossom[i]] == 0:
+                    i, j = j, i
+                queue.append(i)
+            elif delta_type == 3:
+                allowed_edge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                queue.append(i)
+            elif delta_type == 4:
+                expand_blossom(delta_blossom, False)
+
+        if not augmented:
+            break
+
+        for b in list(top_blossoms):
+            if label[b] == 1 and dual[b] == 0:
+                expand_blossom(b, True)
+
+    return [endpoint[p] if p >= 0 else -1 for p in mate]
+
+
+def pair_players(players: List["Player"],
+                 window: int = PAIRING_WINDOW) \
+        -> Union[list[tuple["Player", "Player"]], None]:
+    """
+    Pairs the players of a round so that nobody meets the same opponent
+    twice, with a maximum-weight matching of the compatibility graph.
+
+    Two players are linked when they have not played each other yet. The
+    weight of the link decreases with the square of the difference of
+    their scores, then with the distance between them in the list, so
+    players are paired inside their score group first, and with their
+    neighbours in the standings.
+
+    The graph first links each player to the `window` next compatible
+    players only. If no complete pairing exists in that graph, the full
+    graph is used, so a complete pairing is always found when one exists.
+
+    :param players: The players of the round, in the order used to pair
+        them (ranking or random draw).
+    :type players: list[Player]
+    :param window: The number of compatible players linked to each player
+        in the first attempt.
+    :type window: int
+    :return: The pairs of players, best ranked first, or `None` if no
+        complete pairing exists.
+    :rtype: list[tuple[Player, Player]] or None
+    """
+    players_number = len(players)
+    if players_number % 2 != 0:
+        return None
+
+    half_points = [round(2 * player.score) for player in players]
+    max_difference = max(half_points, default=0) - min(half_points,
+                                                       default=0)
+    base_weight = players_number * (max_difference ** 2 + 2)
+
+    numbers = [player.national_player_number for player in players]
+
+    for limit in (window, players_number):
+        edges = []
+        best_weight = players_number * [0]
+        for i, player1 in enumerate(players):
+            opponents = player1.opponents
+            linked = 0
+            for j in range(i + 1, players_number):
+                if linked == limit:
+                    break
+                if numbers[j] in opponents:
+                    continue
+                difference = half_points[i] - half_points[j]
+                weight = (base_weight - players_number * difference ** 2
+                          - (j - i))
+                edges.append((i, j, weight))
+                best_weight[i] = max(best_weight[i], weight)
+                best_weight[j] = max(best_weight[j], weight)
+                linked += 1
+
+        # Every complete pairing holds exactly one edge per player, so
+        # subtracting the best weight of both players from each edge keeps
+        # the same best pairing. The edges that are the best choice of both
+        # of their players then have the maximum weight, 0, and are paired
+        # before the search starts.
+        edges = [(i, j, 2 * weight - best_weight[i] - best_weight[j])
+                 for i, j, weight in edges]
+
+        mate = max_weight_matching(edges, max_cardinality=True)
+        if (len(mate) == players_number and
+                all(partner != -1 for partner in mate)):
+            return [(players[i], players[mate[i]])
+                    for i in range(players_number) if i < mate[i]]
+
+        if limit >= players_number:
+            break
+
+    return None
@@ -0,0 +1,298 @@
+import json
+import os
+from typing import Iterable, Union
+
+import numpy as np
+
+from models import DataBase, open_data_base
+from settings import (RATINGS_FILE_PATH,
+                      ELO_INITIAL_RATING,
+                      ELO_K_NEW_PLAYER,
+                      ELO_NEW_PLAYER_GAMES,
+                      ELO_K,
+                      ELO_K_TOP_PLAYER,
+                      ELO_TOP_RATING)
+
+
+class RatingEngine:
+    """le classement Elo des joueurs"""
+
+    VERSION = 1
+
+    def __init__(self,
+                 path: str = RATINGS_FILE_PATH,
+                 initial_rating: float = ELO_INITIAL_RATING,
+                 k_new_player: float = ELO_K_NEW_PLAYER,
+                 new_player_games: int = ELO_NEW_PLAYER_GAMES,
+                 k: float = ELO_K,
+                 k_top_player: float = ELO_K_TOP_PLAYER,
+                 top_rating: float = ELO_TOP_RATING):
+        """
+        Initializes the Elo ratings computed from the finished tournaments.
+
+        Tournaments are rated in the order of their start date, round by
+        round: the expected scores and the rating changes of all the
+        matches of a round are computed at once on arrays, as a player
+        plays at most one match per round.
+
+        The K-factor of a player is `k_new_player` until they have played
+        `new_player_games` games, then `k`, and `k_top_player` once their
+        rating reaches `top_rating`.
+
+        The ratings, the number of games of each player and the rated
+        tournaments are stored in a JSON file, so that rating a new
+        tournament only updates them.
+
+        :param path: The path to the ratings JSON file.
+        :type path: str
+        :param initial_rating: The rating of a player's first game.
+        :type initial_rating: float
+        :param k_new_player: The K-factor of new players.
+        :type k_new_player: float
+        :param new_player_games: The number of games a player remains new.
+        :type new_player_games: int
+        :param k: The K-factor of the other players.
+        :type k: float
+        :param k_top_player: The K-factor of the top rated players.
+        :type k_top_player: float
+        :param top_rating: The rating from which `k_top_player` applies.
+        :type top_rating: float
+        """
+        self.path = path
+        self.initial_rating = initial_rating
+        self.k_new_player = k_new_player
+        self.new_player_games = new_player_games
+        self.k = k
+        self.k_top_player = k_top_player
+        self.top_rating = top_rating
+        self.reset()
+
+    def reset(self):
+        """Forgets every rating and rated tournament."""
+        self.positions = {}
+        self.ratings = np.empty(0)
+        self.games = np.empty(0, dtype=np.int64)
+        self.rated = []
+
+    def read(self):
+        """
+        Reads the ratings file. A missing or malformed file, or a file
+        written in another version, gives empty ratings.
+        """
+        self.reset()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            try:
+                data = json.load(file)
+            except json.JSONDecodeError:
+                return
+        if data.get("version") != self.VERSION:
+            return
+        self.rated = data["rated"]
+        self.positions = {player_number: position
+                          for position, player_number
+                          in enumerate(data["players"])}
+        self.ratings = np.array([player["rating"]
+                                 for player in data["players"].values()],
+                                dtype=float)
+        self.games = np.array([player["games"]
+                               for player in data["players"].values()],
+                              dtype=np.int64)
+
+    def write(self):
+        """Replaces the ratings file atomically."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary_file = f"{self.path}.tmp"
+        with open(temporary_file, "w", encoding="utf-8") as file:
+            json.dump({"version": self.VERSION,
+                       "rated": self.rated,
+                       "players": {
+                           player_number: {
+                               "rating": float(self.ratings[position]),
+                               "games": int(self.games[position])}
+                           for player_number, position
+                           in self.positions.items()}},
+                      file,
+                      indent=4,
+                      ensure_ascii=False)
+        os.replace(temporary_file, self.path)
+
+    def position(self, player_number: str) -> int:
+        """
+        Returns the position of a player in the rating arrays, adding the
+        player with the initial rating on their first game.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :rtype: int
+        """
+        position = self.positions.get(player_number)
+        if position is None:
+            position = len(self.positions)
+            self.positions[player_number] = position
+            if position == len(self.ratings):
+                size = max(64, 2 * len(self.ratings))
+                self.ratings = np.resize(self.ratings, size)
+                self.games = np.resize(self.games, size)
+            self.ratings[position] = self.initial_rating
+            self.games[position] = 0
+        return position
+
+    def k_factors(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Returns the K-factor of some players.
+
+        :param positions: The positions of the players.
+        :type positions: numpy.ndarray
+        :rtype: numpy.ndarray
+        """
+        return np.where(self.games[positions] < self.new_player_games,
+                        self.k_new_player,
+                        np.where(self.ratings[positions] >= self.top_rating,
+                                 self.k_top_player,
+                                 self.k))
+
+    def rate_round(self,
+                   positions1: np.ndarray,
+                   positions2: np.ndarray,
+                   scores1: np.ndarray):
+        """
+        Updates the ratings with the results of a round.
+
+        :param positions1: The positions of the first players.
+        :type positions1: numpy.ndarray
+        :param positions2: The positions of the second players.
+        :type positions2: numpy.ndarray
+        :param scores1: The points scored by the first players: 1, 0.5 or
+            0.
+        :type scores1: numpy.ndarray
+        """
+        expected1 = 1 / (1 + 10 ** ((self.ratings[positions2]
+                                     - self.ratings[positions1]) / 400))
+        change1 = self.k_factors(positions1) * (scores1 - expected1)
+        change2 = self.k_factors(positions2) * (expected1 - scores1)
+        self.ratings[positions1] += change1
+        self.ratings[positions2] += change2
+        self.games[positions1] += 1
+        self.games[positions2] += 1
+
+    def rate_tournament(self, tournament_data: dict):
+        """
+        Updates the ratings with the played matches of a tournament.
+
+        :param tournament_data: The tournament data, in the current format.
+        :type tournament_data: dict
+        """
+        for played_round in sorted(tournament_data["rounds"],
+                                   key=lambda data: data["round_number"]):
+            rows = [(self.position(match["players"][0]),
+                     self.position(match["players"][1]),
+                     match["result"][0])
+                    for match in played_round["matches"]
+                    if any(match["result"])]
+            if rows:
+                positions1, positions2, scores1 = zip(*rows)
+                self.rate_round(np.array(positions1),
+                                np.array(positions2),
+                                np.array(scores1, dtype=float))
+
+    def recompute(self, tournaments: Iterable[tuple[str, dict]]):
+        """
+        Forgets every rating and rates tournaments again.
+
+        :param tournaments: The tournament file names and data, in
+            chronological order.
+        :type tournaments: iterable of tuple[str, dict]
+        """
+        self.reset()
+        for json_file, tournament_data in tournaments:
+            self.rate_tournament(tournament_data)
+            self.rated.append({"file": json_file,
+                               "start_date": tournament_data["start_date"]})
+
+    def update(self, data_base: Union[DataBase, None] = None) -> int:
+        """
+        Rates the tournaments that have ended since the last update, then
+        saves the ratings.
+
+        New tournaments that started after the last rated one only update
+        the ratings. If a new tournament started earlier, or if a rated
+        tournament was deleted, every tournament is rated again so the
+        chronological order is kept.
+
+        :param data_base: The data base to read the tournaments from.
+            Defaults to the one selected in the settings.
+        :type data_base: DataBase or None
+        :return: The number of tournaments rated.
+        :rtype: int
+        """
+        data_base = data_base or open_data_base()
+        self.read()
+        headers = sorted(data_base.find_tournaments("ended"),
+                         key=lambda header: (header["start_date"],
+                                             header["file"]))
+        files = {header["file"] for header in headers}
+        rated_files = {entry["file"] for entry in self.rated}
+        new_headers = [header for header in headers
+                       if header["file"] not in rated_files]
+
+        if not new_headers and rated_files <= files:
+            return 0
+
+        if self.rated and (
+                not rated_files <= files or
+                (new_headers[0]["start_date"], new_headers[0]["file"]) <
+                (self.rated[-1]["start_date"], self.rated[-1]["file"])):
+            new_headers = headers
+            self.reset()
+
+        rated = 0
+        for header in new_headers:
+            tournament_data = data_base.read_tournament(header["file"])
+            if tournament_data is None:
+                continue
+            self.rate_tournament(tournament_data)
+            self.rated.append({"file": header["file"],
+                               "start_date": header["start_date"]})
+            rated += 1
+        self.write()
+        return rated
+
+    def rating(self, player_number: str) -> Union[float, None]:
+        """
+        Returns the rating of a player.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :return: The rating, or `None` if the player has not been rated.
+        :rtype: float or None
+        """
+        position = self.positions.get(player_number)
+        if position is None:
+            return None
+        return float(self.ratings[position])
+
+    def ranking(self) -> list[tuple[str, float, int]]:
+        """
+        Returns the rated players, best rated first.
+
+        :return: The national player number, rating and number of games of
+            each player.
+        :rtype: list[tuple[str, float, int]]
+        """
+        players = list(self.positions)
+        order = np.argsort(-self.ratings[:len(players)], kind="stable")
+        return [(players[position],
+                 float(self.ratings[position]),
+                 int(self.games[position]))
+                for position in order]
+
+
+if __name__ == "__main__":
+    engine = RatingEngine()
+    engine.update()
+    print(f"{len(engine.rated)} tournois classés, "
+          f"{len(engine.positions)} joueurs.")
+    for player_number, rating, games in engine.ranking()[:10]:
+        print(f"{player_number: <12}{rating: >8.1f}{games: >6} parties")
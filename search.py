@@ -0,0 +1,226 @@
+import heapq
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable
+
+from settings import SEARCH_LIMIT, SEARCH_SIMILARITY_THRESHOLD
+
+# letters that Unicode decomposition does not split
+LIGATURES = str.maketrans({"œ": "oe", "æ": "ae", "ø": "o", "ł": "l",
+                           "đ": "d", "ð": "d", "þ": "th"})
+
+
+# names are shared by many players, so each one is normalized once
+@lru_cache(maxsize=65536)
+def normalize(text: str) -> str:
+    """
+    Returns a text in lower case, without accents and with its words
+    separated by single spaces, e.g. "  Lefèvre-Dupré " -> "lefevre dupre".
+
+    :param text: The text to normalize.
+    :type text: str
+    :rtype: str
+    """
+    text = unicodedata.normalize("NFKD", text.casefold().translate(
+        LIGATURES))
+    text = "".join(character for character in text
+                   if not unicodedata.combining(character))
+    return " ".join(re.sub(r"[\W_]+", " ", text).split())
+
+
+def trigrams(term: str) -> set[str]:
+    """
+    Returns the trigrams of a term, padded so that its beginning counts
+    more than its end, e.g. "dupont" -> {"  d", " du", "dup", ...,
+    "nt "}.
+
+    :param term: A normalized word.
+    :type term: str
+    :rtype: set[str]
+    """
+    padded = f"  {term} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class PlayerSearchIndex:
+    """l'index de recherche des joueurs par nom"""
+
+    END = ""
+
+    def __init__(self):
+        """
+        Initializes an empty index of the names and first names of the
+        players.
+
+        Names are normalized (lower case, accents removed) and split into
+        words, the terms. Each term is stored once, with the national
+        player numbers of the players whose name or first name holds it:
+        - in a trie, a tree of dictionaries keyed by character, for the
+            prefix search. The players of a term are stored under the
+            `END` key of its last node.
+        - in an inverted index of trigrams, for the fuzzy search: the
+            terms sharing trigrams with a searched word are counted, and
+            their Jaccard similarity computed from the counts.
+
+        Adding a player only inserts its new terms, so the index is built
+        once and kept up to date player by player.
+        """
+        self.root = {}
+        self.players = {}
+        self.terms = {}
+        self.trigrams = {}
+        self.sort_keys = {}
+
+    def __len__(self) -> int:
+        return len(self.sort_keys)
+
+    def build(self, players: Iterable[dict]):
+        """
+        Adds players to the index.
+
+        :param players: The player data dictionaries.
+        :type players: Iterable[dict]
+        """
+        for player in players:
+            self.add(player)
+
+    def add(self, player: dict):
+        """
+        Adds a player to the index.
+
+        :param player: The player data, holding at least
+            "national_player_number", "name" and "first_name".
+        :type player: dict
+        """
+        number = player["national_player_number"]
+        if number in self.sort_keys:
+            return
+        name = normalize(player["name"])
+        first_name = normalize(player["first_name"])
+        self.sort_keys[number] = (name, first_name, number)
+
+        words = set(name.split()) | set(first_name.split())
+        # compound names can also be searched without their spaces
+        words.update(text.replace(" ", "") for text in (name, first_name)
+                     if " " in text)
+        for word in words:
+            if word not in self.players:
+                self.insert_term(word)
+            self.players[word].add(number)
+
+    def insert_term(self, term: str):
+        """
+        Inserts a new term in the trie and in the trigram index.
+
+        :param term: A normalized word.
+        :type term: str
+        """
+        node = self.root
+        for character in term:
+            node = node.setdefault(character, {})
+        node[self.END] = self.players[term] = set()
+
+        term_trigrams = trigrams(term)
+        self.terms[term] = len(term_trigrams)
+        for trigram in term_trigrams:
+            self.trigrams.setdefault(trigram, []).append(term)
+
+    def prefix_players(self, prefix: str) -> set[str]:
+        """
+        Returns the players having a term that starts with a prefix.
+
+        :param prefix: A normalized word.
+        :type prefix: str
+        :return: The national player numbers.
+        :rtype: set[str]
+        """
+        node = self.root
+        for character in prefix:
+            node = node.get(character)
+            if node is None:
+                return set()
+
+        players = set()
+        nodes = [node]
+        while nodes:
+            node = nodes.pop()
+            for key, child in node.items():
+                if key == self.END:
+                    players |= child
+                else:
+                    nodes.append(child)
+        return players
+
+    def similar_terms(self, word: str) -> dict[str, float]:
+        """
+        Returns the terms whose trigram similarity with a word reaches
+        `SEARCH_SIMILARITY_THRESHOLD`.
+
+        :param word: A normalized word.
+        :type word: str
+        :return: The similarity of each term, from 0 to 1.
+        :rtype: dict[str, float]
+        """
+        word_trigrams = trigrams(word)
+        shared = Counter()
+        for trigram in word_trigrams:
+            shared.update(self.trigrams.get(trigram, ()))
+
+        similarities = {}
+        for term, count in shared.items():
+            similarity = count / (len(word_trigrams) + self.terms[term]
+                                  - count)
+            if similarity >= SEARCH_SIMILARITY_THRESHOLD:
+                similarities[term] = similarity
+        return similarities
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> list[str]:
+        """
+        Searches for players by the beginning of their name or first name,
+        then by similar names when there are too few of them.
+
+        Every word of the text must start a term of a player found by
+        prefix; these players come first, in alphabetical order. The
+        players found by similarity follow, the closest first: their
+        score is the mean, over the words of the text, of the best
+        similarity of one of their terms.
+
+        :param text: The searched text, e.g. "dup" or "Dupond Jean".
+        :type text: str
+        :param limit: The maximum number of players returned.
+        :type limit: int
+        :return: The national player numbers.
+        :rtype: list[str]
+        """
+        words = normalize(text).split()
+        if not words:
+            return []
+
+        found = None
+        for word in sorted(words, key=len, reverse=True):
+            players = self.prefix_players(word)
+            found = players if found is None else found & players
+            if not found:
+                break
+        results = [key[2] for key in heapq.nsmallest(
+            limit, (self.sort_keys[number] for number in found))]
+        if len(results) == limit:
+            return results
+
+        scores = Counter()
+        for word in words:
+            best = {}
+            for term, similarity in self.similar_terms(word).items():
+                for number in self.players[term]:
+                    if similarity > best.get(number, 0):
+                        best[number] = similarity
+            scores.update(best)
+        for number in results:
+            scores.pop(number, None)
+        results += [number for number, _ in heapq.nsmallest(
+            limit - len(results),
+            scores.items(),
+            key=lambda item: (-item[1], self.sort_keys[item[0]]))]
+        return results
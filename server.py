@@ -0,0 +1,286 @@
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Union
+
+from autosave import DeferredWriter
+from models import MatchResult, RESULT_NOTATIONS, Round, Tournament
+from settings import (SERVER_HOST,
+                      SERVER_PORT,
+                      SERVER_WRITE_DELAY,
+                      SERVER_MAX_WRITE_DELAY)
+
+# notation used to display each result: the first one of RESULT_NOTATIONS
+NOTATIONS = {outcome: notation
+             for notation, outcome in reversed(RESULT_NOTATIONS.items())}
+
+
+class RequestError(Exception):
+    """une requête refusée"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ResultWriter(DeferredWriter):
+    """l'écriture différée des évènements d'un tournoi"""
+
+    def __init__(self,
+                 tournament: Tournament,
+                 delay: float = SERVER_WRITE_DELAY,
+                 max_delay: float = SERVER_MAX_WRITE_DELAY):
+        """
+        Initializes the thread writing the events of a tournament in
+        batches, see `DeferredWriter`.
+
+        A batch is recorded by `Tournament.record_events`: a single write
+        to the journal, or a single SQLite transaction. The events are
+        built while holding `Tournament.lock` and are not changed
+        afterwards, so they are written without holding it, and the
+        requests are not held up by the writes. Only a snapshot of the
+        tournament, saved once the journal is full, holds it, see
+        `Tournament.save`.
+
+        :param tournament: The tournament the events belong to.
+        :type tournament: Tournament
+        :param delay: The time without new event before writing, in
+            seconds.
+        :type delay: float
+        :param max_delay: The maximum time an event waits, in seconds.
+        :type max_delay: float
+        """
+        super().__init__(delay, max_delay)
+        self.tournament = tournament
+        self.batches = 0
+        self.events = 0
+
+    def write(self, events: list[dict]):
+        """
+        Records a batch of events.
+
+        :param events: The events, in the order they were queued.
+        :type events: list[dict]
+        """
+        self.tournament.record_events(events)
+        self.batches += 1
+        self.events += len(events)
+
+
+class ResultServer(ThreadingHTTPServer):
+    """le serveur de saisie des résultats d'une ronde"""
+
+    daemon_threads = True
+    # connections waiting to be accepted, for arbiters submitting at once
+    request_queue_size = 128
+
+    def __init__(self,
+                 tournament: Tournament,
+                 address: tuple[str, int] = (SERVER_HOST, SERVER_PORT),
+                 delay: float = SERVER_WRITE_DELAY,
+                 max_delay: float = SERVER_MAX_WRITE_DELAY):
+        """
+        Initializes a HTTP server receiving the results of the current
+        round of a tournament from several arbiters at once.
+
+        Each request is handled by its own thread. The tournament is only
+        read or changed while holding `Tournament.lock`, so results are
+        assigned one at a time, and not while the tournament is changed
+        or saved by another thread. The events recording them are written
+        by a `ResultWriter`, in batches, instead of one write per result.
+
+        Requests and responses are JSON:
+        - GET /ronde: the matches of the round and their results.
+        - POST /resultats: a result, e.g. {"match_number": 3,
+            "result": "1-0"}, or a list of results, assigned together or
+            not at all. The notations are those of `RESULT_NOTATIONS`.
+            Sending a result already assigned again is accepted, so that
+            an arbiter can retry a request.
+        The round ends once every match has a result.
+
+        :param tournament: The tournament, whose last round is in progress.
+        :type tournament: Tournament
+        :param address: The host and port to listen on. Port 0 picks a free
+            port.
+        :type address: tuple[str, int]
+        :param delay: See `ResultWriter`.
+        :type delay: float
+        :param max_delay: See `ResultWriter`.
+        :type max_delay: float
+        """
+        super().__init__(address, ResultRequestHandler)
+        self.tournament = tournament
+        self.lock = tournament.lock
+        self.writer = ResultWriter(tournament, delay, max_delay)
+        self.results = 0
+
+    @property
+    def current_round(self) -> Round:
+        return self.tournament.rounds[-1]
+
+    def round_state(self) -> dict:
+        """
+        Returns the matches of the current round and their results.
+
+        :rtype: dict
+        """
+        with self.lock:
+            matches = [{"match_number": match.number,
+                        "players": [{"national_player_number":
+                                     player.national_player_number,
+                                     "name": player.name,
+                                     "first_name": player.first_name,
+                                     "score": player.score}
+                                    for player in (match.player1,
+                                                   match.player2)],
+                        "result": NOTATIONS.get(match.outcome)}
+                       for match in self.current_round.matches]
+            return {"tournament": self.tournament.name,
+                    "round_number": self.current_round.round_number,
+                    "ended": bool(self.current_round.end_time),
+                    "pending": sum(match["result"] is None
+                                   for match in matches),
+                    "matches": matches}
+
+    def submit(self, data: Union[dict, list]) -> dict:
+        """
+        Assigns results to the matches of the current round. Every result
+        is checked before any is assigned.
+
+        :param data: A result {"match_number": int, "result": str}, or a
+            list of them.
+        :type data: dict or list[dict]
+        :return: The round number, the number of results assigned, the
+            number of matches without result and whether the round ended.
+        :rtype: dict
+        :raises RequestError: If a result is malformed, if a match does
+            not exist, or if it already has another result.
+        """
+        entries = data if isinstance(data, list) else [data]
+        with self.lock:
+            matches = self.current_round.matches
+            to_assign = {}
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    raise RequestError(HTTPStatus.BAD_REQUEST,
+                                       "Résultat mal formé.")
+                match_number = entry.get("match_number")
+                notation = entry.get("result")
+                # true and false are integers for isinstance
+                if (isinstance(match_number, bool)
+                        or not isinstance(match_number, int)
+                        or notation not in RESULT_NOTATIONS):
+                    raise RequestError(HTTPStatus.BAD_REQUEST,
+                                       "Résultat mal formé : "
+                                       f"{json.dumps(entry)}.")
+                if not 1 <= match_number <= len(matches):
+                    raise RequestError(HTTPStatus.NOT_FOUND,
+                                       f"Le match {match_number} "
+                                       "n'existe pas.")
+                outcome = RESULT_NOTATIONS[notation]
+                match = matches[match_number - 1]
+                if (match.outcome not in (MatchResult.PENDING, outcome)
+                        or to_assign.get(match_number, outcome)
+                        is not outcome):
+                    raise RequestError(HTTPStatus.CONFLICT,
+                                       f"Le match {match_number} a déjà "
+                                       "un autre résultat.")
+                if match.outcome is MatchResult.PENDING:
+                    to_assign[match_number] = outcome
+
+            for match_number, outcome in to_assign.items():
+                match = matches[match_number - 1]
+                match.assign_outcome(outcome)
+                self.writer.add(self.tournament.result_event(
+                    self.current_round, match))
+            self.results += len(to_assign)
+
+            pending = sum(match.outcome is MatchResult.PENDING
+                          for match in matches)
+            if not pending and not self.current_round.end_time:
+                self.current_round.ended()
+                self.writer.add(self.tournament.round_end_event())
+            return {"round_number": self.current_round.round_number,
+                    "assigned": len(to_assign),
+                    "pending": pending,
+                    "ended": bool(self.current_round.end_time)}
+
+    def serve(self):
+        """
+        Handles requests until interrupted with Ctrl+C, then writes the
+        results not written yet.
+        """
+        self.writer.start()
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server_close()
+            self.writer.close()
+
+
+class ResultRequestHandler(BaseHTTPRequestHandler):
+    """une requête d'un arbitre"""
+
+    # keeps the connection open between the requests of an arbiter
+    protocol_version = "HTTP/1.1"
+    # sends the body of a response without waiting for the acknowledgement
+    # of its headers
+    disable_nagle_algorithm = True
+    server: ResultServer
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("", "/ronde"):
+            self.send_json(HTTPStatus.OK, self.server.round_state())
+        else:
+            self.send_json(HTTPStatus.NOT_FOUND,
+                           {"error": "Adresse inconnue."})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/resultats":
+            # the body is not read, so the connection cannot be reused
+            self.close_connection = True
+            self.send_json(HTTPStatus.NOT_FOUND,
+                           {"error": "Adresse inconnue."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self.close_connection = True
+            self.send_json(HTTPStatus.BAD_REQUEST,
+                           {"error": "La longueur de la requête est "
+                                     "invalide."})
+            return
+        try:
+            data = json.loads(self.rfile.read(length))
+        except ValueError:
+            self.send_json(HTTPStatus.BAD_REQUEST,
+                           {"error": "Le corps de la requête n'est pas du "
+                                     "JSON."})
+            return
+        try:
+            self.send_json(HTTPStatus.OK, self.server.submit(data))
+        except RequestError as error:
+            self.send_json(error.status, {"error": str(error)})
+
+    def send_json(self, status: HTTPStatus, data: dict):
+        """
+        Sends a JSON response.
+
+        :param status: The status of the response.
+        :type status: HTTPStatus
+        :param data: The content of the response.
+        :type data: dict
+        """
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_request(self, code="-", size="-"):
+        """Requests are not logged, only the errors of the server."""
@@ -1,5 +1,58 @@
+# stockage des données : "json" ou "sqlite"
+STORAGE_BACKEND = "json"
+SQLITE_FILE_PATH = "data/chess.sqlite3"
+
 PLAYERS_FILE_PATH = "data/players.json"
+PLAYERS_JOURNAL_FILE_PATH = "data/players.jsonl"
+# taille du journal (en octets) au-delà de laquelle il est fusionné
+PLAYERS_JOURNAL_MAX_SIZE = 256 * 1024
 TOURNAMENT_FILE_PATH = "data/Tournaments/"
+# nombre d'évènements journalisés avant une sauvegarde complète du tournoi
+TOURNAMENT_JOURNAL_MAX_EVENTS = 50
+TOURNAMENT_CATALOG_FILE_PATH = "data/tournaments_catalog.json"
+PLAYER_HISTORY_FILE_PATH = "data/players_history.json"
+EXPORT_DIRECTORY = "data/exports/"
+
+# nombre maximal de joueurs proposés par la recherche par nom
+SEARCH_LIMIT = 20
+# similarité (de 0 à 1) à partir de laquelle un nom mal orthographié est
+# proposé : à 0,2, deux lettres inversées dans un nom de cinq lettres ou
+# plus sont encore retrouvées
+SEARCH_SIMILARITY_THRESHOLD = 0.2
+
+# nombre d'adversaires possibles reliés à chaque joueur lors de l'appariement
+PAIRING_WINDOW = 16
+
+# classement Elo calculé sur les tournois terminés
+RATINGS_FILE_PATH = "data/ratings.json"
+ELO_INITIAL_RATING = 1500
+# coefficient K des joueurs ayant joué moins de ELO_NEW_PLAYER_GAMES parties,
+# des autres joueurs, puis des joueurs classés au moins ELO_TOP_RATING
+ELO_K_NEW_PLAYER = 40
+ELO_NEW_PLAYER_GAMES = 30
+ELO_K = 20
+ELO_K_TOP_PLAYER = 10
+ELO_TOP_RATING = 2400
+
+# simulations de la fin d'un tournoi en cours
+SIMULATION_COUNT = 2000
+# probabilité de match nul entre deux joueurs de même classement
+SIMULATION_DRAW_RATE = 0.3
+
+# serveur de saisie des résultats ; "0.0.0.0" l'ouvre aux autres postes du
+# réseau local
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8080
+# délai (en secondes) sans nouveau résultat avant d'écrire les résultats reçus
+SERVER_WRITE_DELAY = 0.2
+# délai maximal (en secondes) entre la réception d'un résultat et son écriture
+SERVER_MAX_WRITE_DELAY = 1.0
+
+# délai (en secondes) sans modification avant la sauvegarde en arrière-plan
+# du tournoi ouvert dans les menus
+AUTOSAVE_DELAY = 0.5
+# délai maximal (en secondes) entre une modification et sa sauvegarde
+AUTOSAVE_MAX_DELAY = 5.0
 
 TITLE_STYLE = "bold blue"
 LINE_STYLE = "blue"
@@ -8,5 +61,7 @@ SUCCESS_STYLE = "green"
 TEXT_STYLE = "#77DFFE"
 REQUEST_STYLE = "yellow"
 INFORMATION_STYLE = "magenta"
+# nombre de lignes par page des tableaux affichés page par page
+TABLE_PAGE_SIZE = 20
 
 ACTUAL_YEAR = 25
@@ -0,0 +1,408 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+
+import numpy as np
+
+from models import DataBase, MatchResult, Player, Tournament
+from pairing import pair_players
+from ratings import RatingEngine
+from settings import (ELO_INITIAL_RATING,
+                      SIMULATION_COUNT,
+                      SIMULATION_DRAW_RATE)
+
+
+class SimulatedPlayer:
+    """un joueur d'une simulation"""
+
+    __slots__ = ("national_player_number", "score", "opponents")
+
+    def __init__(self, position: int, half_points: int, opponents: set):
+        """
+        Initializes the lightweight player given to `pair_players` during
+        a simulation. The position of the player in the tournament stands
+        for its national player number.
+
+        :param position: The position of the player in the tournament.
+        :type position: int
+        :param half_points: The score of the player, in half-points.
+        :type half_points: int
+        :param opponents: The positions of the players already met.
+        :type opponents: set[int]
+        """
+        self.national_player_number = position
+        self.score = half_points / 2
+        self.opponents = opponents
+
+
+class SimulationResult:
+    """les résultats d'une simulation de tournoi"""
+
+    def __init__(self,
+                 players: list[Player],
+                 positions: np.ndarray,
+                 seconds: float):
+        """
+        Initializes the results of the simulations of a tournament.
+
+        :param players: The players of the tournament.
+        :type players: list[Player]
+        :param positions: The number of simulations in which each player
+            finished at each position: row i, column j counts the
+            simulations where the player i finished at position j + 1.
+        :type positions: numpy.ndarray
+        :param seconds: The wall-clock time taken by the simulations.
+        :type seconds: float
+        """
+        self.players = players
+        self.rows = {player: row for row, player in enumerate(players)}
+        self.positions = positions
+        self.simulations = int(positions[0].sum()) if len(players) else 0
+        self.seconds = seconds
+
+    @property
+    def simulations_per_second(self) -> float:
+        return self.simulations / self.seconds if self.seconds else 0.0
+
+    def distribution(self, player: Player) -> np.ndarray:
+        """
+        Returns the probability of each finishing position of a player.
+
+        :param player: A player of the tournament.
+        :type player: Player
+        :return: The probability of finishing first, second, and so on.
+        :rtype: numpy.ndarray
+        """
+        return self.positions[self.rows[player]] / max(self.simulations, 1)
+
+    def chances(self, player: Player, best: int = 3) -> float:
+        """
+        Returns the probability that a player finishes among the best.
+
+        :param player: A player of the tournament.
+        :type player: Player
+        :param best: The number of places counted.
+        :type best: int
+        :rtype: float
+        """
+        return float(self.distribution(player)[:best].sum())
+
+    def mean_position(self, player: Player) -> float:
+        """
+        Returns the mean finishing position of a player.
+
+        :param player: A player of the tournament.
+        :type player: Player
+        :rtype: float
+        """
+        distribution = self.distribution(player)
+        return float(distribution @ np.arange(1, len(distribution) + 1))
+
+    def ranking(self) -> list[Player]:
+        """
+        Returns the players sorted by chances to finish first, then among
+        the best three, then by mean position.
+
+        :rtype: list[Player]
+        """
+        return sorted(self.players,
+                      key=lambda player: (-self.chances(player, 1),
+                                          -self.chances(player, 3),
+                                          self.mean_position(player)))
+
+
+def tournament_state(tournament: Tournament,
+                     ratings: Union[RatingEngine, None] = None) -> dict:
+    """
+    Extracts the state of a tournament needed to simulate its end, as
+    plain data that can be sent to other processes.
+
+    The rounds are counted from the tournament: a round without matches
+    is still to be paired, and the matches of the current round without
+    a result are still to be played.
+
+    :param tournament: The tournament to simulate.
+    :type tournament: Tournament
+    :param ratings: The Elo ratings of the players, read from the ratings
+        file when not given.
+    :type ratings: RatingEngine or None
+    :rtype: dict
+    """
+    if ratings is None:
+        ratings = RatingEngine()
+        ratings.read()
+    players = tournament.players
+    positions = {player: position for position, player in enumerate(players)}
+
+    games = []
+    pending = []
+    for played_round in tournament.rounds:
+        for match in played_round.matches:
+            pair = (positions[match.player1], positions[match.player2])
+            if match.outcome is MatchResult.PENDING:
+                pending.append(pair)
+            else:
+                games.append(pair)
+    games.extend(pending)
+
+    rounds_left = tournament.max_round - tournament.round_number
+    if tournament.rounds and not tournament.rounds[-1].matches:
+        rounds_left += 1
+
+    if len(tournament.standings) == len(players):
+        order = [positions[player]
+                 for player in tournament.standings.ranking()]
+    else:
+        order = sorted(range(len(players)),
+                       key=lambda position: -players[position].half_points)
+
+    player_ratings = []
+    for player in players:
+        rating = ratings.rating(player.national_player_number)
+        player_ratings.append(ELO_INITIAL_RATING if rating is None
+                              else rating)
+
+    return {"half_points": [player.half_points for player in players],
+            "ratings": player_ratings,
+            "games": games,
+            "pending": pending,
+            "order": order,
+            "started": bool(tournament.rounds),
+            "rounds_left": max(rounds_left, 0),
+            "draw_rate": SIMULATION_DRAW_RATE}
+
+
+def play_games(generator: np.random.Generator,
+               ratings: np.ndarray,
+               positions1: np.ndarray,
+               positions2: np.ndarray,
+               draw_rate: float) -> np.ndarray:
+    """
+    Draws the results of games from the Elo expected scores of their
+    players. Two players of the same rating draw with the probability
+    `draw_rate`, draws becoming rarer as the rating difference grows.
+
+    :return: The half-points scored by the first players: 2, 1 or 0.
+    :rtype: numpy.ndarray
+    """
+    expected1 = 1 / (1 + 10 ** ((ratings[positions2]
+                                 - ratings[positions1]) / 400))
+    draw = draw_rate * 2 * np.minimum(expected1, 1 - expected1)
+    win1 = expected1 - draw / 2
+    draws = generator.random(len(positions1))
+    return np.where(draws < win1, 2, np.where(draws < win1 + draw, 1, 0))
+
+
+def pair_round(order: np.ndarray,
+               half_points: np.ndarray,
+               opponents: list[set]) \
+        -> Union[tuple[np.ndarray, np.ndarray], None]:
+    """
+    Pairs a simulated round with `pairing.pair_players`.
+
+    :param order: The positions of the players, in the order used to pair
+        them.
+    :type order: numpy.ndarray
+    :param half_points: The scores of the players, in half-points.
+    :type half_points: numpy.ndarray
+    :param opponents: The positions of the players met by each player.
+    :type opponents: list[set[int]]
+    :return: The positions of the first and of the second players of the
+        matches, or `None` if no complete pairing exists.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray] or None
+    """
+    pairs = pair_players([SimulatedPlayer(position,
+                                          int(half_points[position]),
+                                          opponents[position])
+                          for position in order.tolist()])
+    if pairs is None:
+        return None
+    return (np.array([player1.national_player_number
+                      for player1, _ in pairs], dtype=np.int64),
+            np.array([player2.national_player_number
+                      for _, player2 in pairs], dtype=np.int64))
+
+
+def simulate_chunk(state: dict, simulations: int, seed) -> np.ndarray:
+    """
+    Plays the end of a tournament several times.
+
+    The remaining rounds are paired with `pairing.pair_players`, the
+    pairing used by `Round.add_match`, on lightweight players. The scores
+    and the games of a simulation are kept in arrays, and the results of
+    a round are drawn at once. If a round cannot be paired, the
+    simulation stops there, as the tournament would. When the current
+    round has no result left to draw, the next round is paired once for
+    all the simulations.
+
+    The players are ranked by score, then by Buchholz, then at random.
+
+    :param state: The state of the tournament, from `tournament_state`.
+    :type state: dict
+    :param simulations: The number of simulations.
+    :type simulations: int
+    :param seed: The seed of the random generator.
+    :type seed: numpy.random.SeedSequence
+    :return: The number of simulations in which each player finished at
+        each position.
+    :rtype: numpy.ndarray
+    """
+    generator = np.random.default_rng(seed)
+    ratings = np.array(state["ratings"], dtype=float)
+    players_number = len(ratings)
+    initial_half_points = np.array(state["half_points"], dtype=np.int64)
+    played = np.array(state["games"], dtype=np.int64).reshape(-1, 2)
+    pending = np.array(state["pending"], dtype=np.int64).reshape(-1, 2)
+    initial_order = np.array(state["order"], dtype=np.int64)
+    draw_rate = state["draw_rate"]
+
+    initial_opponents = [set() for _ in range(players_number)]
+    for position1, position2 in played:
+        initial_opponents[position1].add(int(position2))
+        initial_opponents[position2].add(int(position1))
+
+    # without results left to draw in the current round, the next round
+    # is paired the same way in every simulation
+    deterministic = state["started"] and not len(pending)
+    first_round = None
+    counts = np.zeros((players_number, players_number), dtype=np.int64)
+    everyone = np.arange(players_number)
+    for _ in range(simulations):
+        half_points = initial_half_points.copy()
+        opponents = [set(met) for met in initial_opponents]
+        games = [played]
+
+        if len(pending):
+            scores1 = play_games(generator, ratings,
+                                 pending[:, 0], pending[:, 1], draw_rate)
+            np.add.at(half_points, pending[:, 0], scores1)
+            np.add.at(half_points, pending[:, 1], 2 - scores1)
+
+        order = (initial_order if state["started"]
+                 else generator.permutation(players_number))
+        for round_index in range(state["rounds_left"]):
+            if round_index or state["started"]:
+                order = order[np.argsort(-half_points[order], kind="stable")]
+            if round_index == 0 and deterministic:
+                if first_round is None:
+                    first_round = pair_round(order, half_points, opponents)
+                pairs = first_round
+            else:
+                pairs = pair_round(order, half_points, opponents)
+            if pairs is None:
+                break
+            positions1, positions2 = pairs
+            scores1 = play_games(generator, ratings,
+                                 positions1, positions2, draw_rate)
+            half_points[positions1] += scores1
+            half_points[positions2] += 2 - scores1
+            for position1, position2 in zip(positions1.tolist(),
+                                            positions2.tolist()):
+                opponents[position1].add(position2)
+                opponents[position2].add(position1)
+            games.append(np.column_stack((positions1, positions2)))
+
+        games = np.concatenate(games)
+        buchholz = (np.bincount(games[:, 0], weights=half_points[games[:, 1]],
+                                minlength=players_number)
+                    + np.bincount(games[:, 1],
+                                  weights=half_points[games[:, 0]],
+                                  minlength=players_number))
+        ranking = np.lexsort((generator.random(players_number),
+                              -buchholz,
+                              -half_points))
+        counts[ranking, everyone] += 1
+    return counts
+
+
+def simulate_tournament(tournament: Tournament,
+                        simulations: int = SIMULATION_COUNT,
+                        workers: Union[int, None] = None,
+                        seed: Union[int, None] = None,
+                        ratings: Union[RatingEngine, None] = None) \
+        -> SimulationResult:
+    """
+    Simulates the end of a tournament many times from its current state,
+    to estimate the chances of each player to finish at each position.
+
+    The games are won, drawn or lost with the probabilities given by the
+    Elo ratings of the players. The simulations are split into chunks
+    played by a pool of processes, one per CPU core by default.
+
+    :param tournament: The tournament to simulate.
+    :type tournament: Tournament
+    :param simulations: The number of simulations.
+    :type simulations: int
+    :param workers: The number of processes. Defaults to the number of
+        CPU cores.
+    :type workers: int or None
+    :param seed: The seed of the random generators, for repeatable
+        results.
+    :type seed: int or None
+    :param ratings: The Elo ratings of the players, read from the ratings
+        file when not given.
+    :type ratings: RatingEngine or None
+    :rtype: SimulationResult
+    """
+    start = time.perf_counter()
+    state = tournament_state(tournament, ratings)
+    players_number = len(tournament.players)
+    workers = max(1, min(workers or os.cpu_count() or 1, simulations))
+    # a few chunks per process balance the load between them
+    chunks_number = min(simulations, 4 * workers)
+    sizes = [simulations // chunks_number
+             + (index < simulations % chunks_number)
+             for index in range(chunks_number)]
+    seeds = np.random.SeedSequence(seed).spawn(chunks_number)
+
+    positions = np.zeros((players_number, players_number), dtype=np.int64)
+    if workers == 1:
+        for size, chunk_seed in zip(sizes, seeds):
+            positions += simulate_chunk(state, size, chunk_seed)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for counts in executor.map(simulate_chunk,
+                                       [state] * chunks_number,
+                                       sizes,
+                                       seeds):
+                positions += counts
+    return SimulationResult(tournament.players,
+                            positions,
+                            time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Chances des joueurs d'un tournoi en cours.")
+    parser.add_argument("name", help="nom du tournoi")
+    parser.add_argument("--simulations", type=int, default=SIMULATION_COUNT)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    arguments = parser.parse_args()
+
+    data_base = DataBase()
+    tournament_data = data_base.read_tournament(f"{arguments.name}.json")
+    if tournament_data is None:
+        print(f"Le tournoi {arguments.name} est introuvable.")
+    else:
+        tournament = Tournament(tournament_data["name"],
+                                tournament_data["place"])
+        tournament.load(tournament_data)
+        result = simulate_tournament(tournament,
+                                     arguments.simulations,
+                                     arguments.workers,
+                                     arguments.seed)
+        print(f"{result.simulations} simulations en "
+              f"{result.seconds:.2f} s "
+              f"({result.simulations_per_second:.0f} simulations/s).")
+        print(f"{'N.P.N.': <10}{'Nom': <25}{'Score': >6}{'1er': >8}"
+              f"{'Top 3': >8}{'Place moy.': >11}")
+        for player in result.ranking():
+            print(f"{player.national_player_number: <10}"
+                  f"{player.name + ' ' + player.first_name: <25.24}"
+                  f"{player.score: >6g}"
+                  f"{result.chances(player, 1): >8.1%}"
+                  f"{result.chances(player, 3): >8.1%}"
+                  f"{result.mean_position(player): >11.1f}")
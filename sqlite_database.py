@@ -0,0 +1,656 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+from models import (DataBase,
+                    PlayedGame,
+                    PlayerHistory,
+                    PlayerRegistry,
+                    Tournament,
+                    TOURNAMENT_FORMAT_VERSION,
+                    half_points_to_score)
+from search import PlayerSearchIndex
+from settings import SEARCH_LIMIT, SQLITE_FILE_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    national_player_number TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birthday TEXT NOT NULL,
+    score REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS players_name ON players (name, first_name);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    place TEXT NOT NULL,
+    description TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT,
+    round_number INTEGER NOT NULL,
+    max_round INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tournaments_end_date ON tournaments (end_date);
+
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    position INTEGER NOT NULL,
+    national_player_number TEXT NOT NULL,
+    name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birthday TEXT NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (tournament_id, national_player_number)
+);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    round_number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    PRIMARY KEY (tournament_id, round_number)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    round_number INTEGER NOT NULL,
+    match_number INTEGER NOT NULL,
+    player1 TEXT NOT NULL,
+    player2 TEXT NOT NULL,
+    score1 REAL NOT NULL,
+    score2 REAL NOT NULL,
+    PRIMARY KEY (tournament_id, round_number, match_number)
+);
+CREATE INDEX IF NOT EXISTS matches_player1 ON matches (player1);
+CREATE INDEX IF NOT EXISTS matches_player2 ON matches (player2);
+"""
+
+# number of rows read at a time by the generators of the data base
+FETCH_SIZE = 1000
+
+
+class SQLiteDataBase(DataBase):
+    """la base de données SQLite"""
+
+    connections = {}
+    locks = {}
+    search_indexes = {}
+
+    def __init__(self, path: str = SQLITE_FILE_PATH):
+        """
+        Opens the SQLite data base, creating its tables if needed.
+
+        The connection is shared by every instance using the same file, and
+        by the threads of the program, such as the writer of the result
+        server or the saver of the tournament: a thread holds the lock of
+        the connection for each transaction and each read, so that the
+        statements of two threads are never mixed in a single transaction,
+        and that a read never sees a transaction halfway through.
+
+        :param path: The path to the SQLite file.
+        :type path: str
+        """
+        super().__init__()
+        self.path = path
+        if path not in self.connections:
+            self.check_existence_directory(path)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.executescript(SCHEMA)
+            self.connections[path] = connection
+            self.locks[path] = threading.RLock()
+        self.connection = self.connections[path]
+        self.lock = self.locks[path]
+
+    @contextmanager
+    def transaction(self):
+        """
+        Holds the lock of the connection for the duration of a `with`
+        block, committed at its end, or rolled back if it raises.
+        """
+        with self.lock, self.connection:
+            yield
+
+    @staticmethod
+    def check_existence_directory(path: str):
+        """
+        Creates the directory of the SQLite file if it's not found.
+
+        :param path: path to the file
+        :type path: str
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def find_player_in_json(self, player_number: str) -> Union[dict, None]:
+        """
+        Searches for a player by their national number.
+
+        :param player_number: The national player number to search for.
+        :type player_number: str
+        :return: A dictionary containing the player's data if found,
+                otherwise `None`.
+        :rtype: dict or None
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT * FROM players WHERE national_player_number = ?",
+                (player_number,)).fetchone()
+        return dict(row) if row else None
+
+    def find_players_in_json(self) -> list[dict]:
+        """
+        Retrieves the data of every registered player.
+
+        :return: A list of player data dictionaries.
+        :rtype: list[dict]
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT * FROM players")
+            return [dict(row) for row in rows]
+
+    def iter_players(self,
+                     criterion="national_player_number") -> Iterator[dict]:
+        """
+        Yields the data of every registered player one at a time, as the
+        rows are read from the data base.
+
+        The rows are fetched by batches under the lock of the connection,
+        which is released between them, so that the other threads are not
+        blocked while the players are consumed.
+
+        :param criterion: The sort order: "national_player_number" or
+            "name".
+        :type criterion: str
+        :return: The player data dictionaries.
+        :rtype: Iterator[dict]
+        """
+        order = ("name, first_name"
+                 if criterion == "name" else "national_player_number")
+        with self.lock:
+            cursor = self.connection.execute(
+                f"SELECT * FROM players ORDER BY {order}")
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+
+    def search_players(self,
+                       text: str,
+                       limit: int = SEARCH_LIMIT) -> list[dict]:
+        """
+        Searches for players by the beginning of their name or first name,
+        accents and case being ignored, then by similar names.
+
+        The search index is built from the players table on the first
+        search, then kept up to date by `write_new_player_in_json`.
+
+        :param text: The searched text, e.g. "dup" or "Dupond Jean".
+        :type text: str
+        :param limit: The maximum number of players returned.
+        :type limit: int
+        :return: A list of player data dictionaries, best matches first.
+        :rtype: list[dict]
+        """
+        with self.lock:
+            if self.path not in self.search_indexes:
+                search_index = PlayerSearchIndex()
+                search_index.build(self.connection.execute(
+                    "SELECT national_player_number, name, first_name "
+                    "FROM players"))
+                self.search_indexes[self.path] = search_index
+        return [self.find_player_in_json(number) for number
+                in self.search_indexes[self.path].search(text, limit)]
+
+    def count_players(self) -> int:
+        """
+        Returns the number of registered players.
+
+        :rtype: int
+        """
+        with self.lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def find_players_page(self,
+                          criterion: str,
+                          offset: int,
+                          limit: int) -> list[dict]:
+        """
+        Retrieves a page of the registered players.
+
+        :param criterion: The sort order: "national_player_number" or
+            "name".
+        :type criterion: str
+        :param offset: The position of the first player of the page.
+        :type offset: int
+        :param limit: The number of players of the page.
+        :type limit: int
+        :return: A list of player data dictionaries.
+        :rtype: list[dict]
+        """
+        # both orders are read from an index, so a page is not sorted
+        order = ("name, first_name"
+                 if criterion == "name" else "national_player_number")
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT * FROM players ORDER BY {order} LIMIT ? OFFSET ?",
+                (limit, offset))
+            return [dict(row) for row in rows]
+
+    def find_player_position(self,
+                             criterion: str,
+                             prefix: str) -> Union[int, None]:
+        """
+        Searches for the first player, in a sort order, whose national
+        player number or name starts with a prefix.
+
+        :param criterion: The sort order, which is also the field searched:
+            "national_player_number" or "name".
+        :type criterion: str
+        :param prefix: The beginning of the national player number or of
+            the name.
+        :type prefix: str
+        :return: The position of the player in the sort order, or `None`
+            if no player matches.
+        :rtype: int or None
+        """
+        column = "name" if criterion == "name" else "national_player_number"
+        with self.lock:
+            found = self.connection.execute(
+                f"SELECT {column} FROM players WHERE {column} >= ? "
+                f"ORDER BY {column} LIMIT 1", (prefix,)).fetchone()
+            if found is None or not found[0].startswith(prefix):
+                return None
+            return self.connection.execute(
+                f"SELECT COUNT(*) FROM players WHERE {column} < ?",
+                (prefix,)).fetchone()[0]
+
+    def write_new_player_in_json(self, player):
+        """Write a new player in the data base
+
+        :param player: instances de Player.
+        """
+        with self.transaction():
+            self.connection.execute(
+                "INSERT OR IGNORE INTO players VALUES (?, ?, ?, ?, ?)",
+                (player.national_player_number,
+                 player.name,
+                 player.first_name,
+                 player.birthday,
+                 player.score))
+        search_index = self.search_indexes.get(self.path)
+        if search_index is not None:
+            search_index.add({"national_player_number":
+                              player.national_player_number,
+                              "name": player.name,
+                              "first_name": player.first_name})
+
+    def tournament_id(self, name: str) -> Union[int, None]:
+        """
+        Returns the identifier of a tournament from its name.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :rtype: int or None
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT id FROM tournaments WHERE name = ?",
+                (name,)).fetchone()
+        return row["id"] if row else None
+
+    def save_tournament(self, tournament: Tournament):
+        """
+        Saves the tournament, its players, rounds and matches.
+
+        :param tournament: The tournament to save.
+        :type tournament: Tournament
+        """
+        self.insert_tournament(tournament.serialize())
+
+    def insert_tournament(self, tournament_data: dict):
+        """
+        Replaces the rows of a tournament with the given data, in the
+        format of the tournament JSON files.
+
+        :param tournament_data: The tournament data.
+        :type tournament_data: dict
+        """
+        with self.transaction():
+            self.connection.execute(
+                "INSERT INTO tournaments (name, place, description, "
+                "start_date, end_date, round_number, max_round) "
+                "VALUES (:name, :place, :description, :start_date, "
+                ":end_date, :round_number, :max_round) "
+                "ON CONFLICT (name) DO UPDATE SET "
+                "place = excluded.place, "
+                "description = excluded.description, "
+                "start_date = excluded.start_date, "
+                "end_date = excluded.end_date, "
+                "round_number = excluded.round_number, "
+                "max_round = excluded.max_round",
+                tournament_data)
+            tournament_id = self.tournament_id(tournament_data["name"])
+
+            for table in ("tournament_players", "rounds", "matches"):
+                self.connection.execute(
+                    f"DELETE FROM {table} WHERE tournament_id = ?",
+                    (tournament_id,))
+
+            self.connection.executemany(
+                "INSERT INTO tournament_players VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(tournament_id,
+                  position,
+                  player["national_player_number"],
+                  player["name"],
+                  player["first_name"],
+                  player["birthday"],
+                  player["score"])
+                 for position, player in enumerate(
+                    tournament_data["players"])])
+
+            for round_data in tournament_data["rounds"]:
+                self.insert_round(tournament_id, round_data)
+
+    def insert_round(self, tournament_id: int, round_data: dict):
+        """
+        Replaces a round and its matches.
+
+        :param tournament_id: The identifier of the tournament.
+        :type tournament_id: int
+        :param round_data: The round data, in the format of the tournament
+            JSON files.
+        :type round_data: dict
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO rounds VALUES (?, ?, ?, ?, ?)",
+            (tournament_id,
+             round_data["round_number"],
+             round_data["name"],
+             round_data["start_time"],
+             round_data["end_time"]))
+        self.connection.execute(
+            "DELETE FROM matches WHERE tournament_id = ? "
+            "AND round_number = ?",
+            (tournament_id, round_data["round_number"]))
+        self.connection.executemany(
+            "INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(tournament_id,
+              round_data["round_number"],
+              match["match_number"],
+              match["players"][0],
+              match["players"][1],
+              match["result"][0],
+              match["result"][1])
+             for match in round_data["matches"]])
+
+    def record_tournament_events(self,
+                                 tournament: Tournament,
+                                 events: list[dict]):
+        """
+        Applies events (round start, result or round end) to the rows of
+        the tournament, in a single transaction.
+
+        :param tournament: The tournament the events belong to.
+        :type tournament: Tournament
+        :param events: The events to record, in order.
+        :type events: list[dict]
+        """
+        with self.lock:
+            tournament_id = self.tournament_id(tournament.name)
+            if tournament_id is not None:
+                self.apply_tournament_events(tournament_id, events)
+                return
+        # saved once the connection is unlocked, as `Tournament.lock` is
+        # taken before the lock of the connection
+        tournament.save()
+
+    def apply_tournament_events(self, tournament_id: int, events: list[dict]):
+        """
+        Applies events to the rows of a tournament, in a single
+        transaction.
+
+        :param tournament_id: The identifier of the tournament.
+        :type tournament_id: int
+        :param events: The events to record, in order.
+        :type events: list[dict]
+        """
+        with self.transaction():
+            for event in events:
+                if event["event"] == "round_start":
+                    self.insert_round(tournament_id, event["round"])
+                    self.connection.execute(
+                        "UPDATE tournaments SET round_number = ? WHERE id = ?",
+                        (event["round_number"], tournament_id))
+
+                elif event["event"] == "result":
+                    self.connection.execute(
+                        "UPDATE matches SET score1 = ?, score2 = ? "
+                        "WHERE tournament_id = ? AND round_number = ? "
+                        "AND match_number = ?",
+                        (event["result"][0],
+                         event["result"][1],
+                         tournament_id,
+                         event["round_number"],
+                         event["match_number"]))
+                    self.connection.executemany(
+                        "UPDATE tournament_players SET score = ? "
+                        "WHERE tournament_id = ? "
+                        "AND national_player_number = ?",
+                        [(score, tournament_id, player_number)
+                         for player_number, score
+                         in event["scores"].items()])
+
+                elif event["event"] == "round_end":
+                    self.connection.execute(
+                        "UPDATE rounds SET end_time = ? "
+                        "WHERE tournament_id = ? AND round_number = ?",
+                        (event["end_time"],
+                         tournament_id,
+                         event["round_number"]))
+
+    def find_tournaments(self, criterion="all") -> list[dict]:
+        """
+        Searches for tournaments based on the specified criterion and
+        retrieves their header.
+
+        The name of the tournament is stored in the "file" key, to be passed
+        to `read_tournament`.
+
+        :param criterion: Filter for tournaments. Options are:
+            - "all": Retrieves all tournaments.
+            - "no_ended": Retrieves tournaments that have not ended.
+            - "ended": Retrieves tournaments that have ended.
+            Defaults to "all".
+        :type criterion: str, optional
+        :return: A list of tournament headers matching the
+                    specified criterion.
+        :rtype: list[dict]
+        """
+        query = ("SELECT name, place, description, start_date, end_date, "
+                 "round_number, max_round, name AS file FROM tournaments")
+        if criterion == "no_ended":
+            query += " WHERE end_date IS NULL"
+        elif criterion == "ended":
+            query += " WHERE end_date IS NOT NULL"
+
+        with self.lock:
+            return [dict(row) for row in self.connection.execute(query)]
+
+    def read_tournament(self, name: str) -> Union[dict, None]:
+        """
+        Reads the full data of a tournament, in the format expected by
+        `Tournament.load`.
+
+        :param name: The name of the tournament.
+        :type name: str
+        :return: The tournament data, or `None` if it does not exist.
+        :rtype: dict or None
+        """
+        # the rows are read under the lock, so that they are not read
+        # halfway through the save of the tournament by another thread
+        with self.lock:
+            return self.select_tournament(name)
+
+    def select_tournament(self, name: str) -> Union[dict, None]:
+        row = self.connection.execute(
+            "SELECT * FROM tournaments WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+
+        tournament_data = {"version": TOURNAMENT_FORMAT_VERSION}
+        tournament_data.update(row)
+        tournament_id = tournament_data.pop("id")
+
+        tournament_data["players"] = [dict(player) for player in
+                                      self.connection.execute(
+            "SELECT national_player_number, name, first_name, birthday, "
+            "score FROM tournament_players WHERE tournament_id = ? "
+            "ORDER BY position", (tournament_id,))]
+
+        rounds = {}
+        for round_row in self.connection.execute(
+                "SELECT * FROM rounds WHERE tournament_id = ? "
+                "ORDER BY round_number", (tournament_id,)):
+            rounds[round_row["round_number"]] = {
+                "name": round_row["name"],
+                "round_number": round_row["round_number"],
+                "start_time": round_row["start_time"],
+                "end_time": round_row["end_time"],
+                "matches": []
+            }
+
+        for match in self.connection.execute(
+                "SELECT * FROM matches WHERE tournament_id = ? "
+                "ORDER BY round_number, match_number", (tournament_id,)):
+            rounds[match["round_number"]]["matches"].append({
+                "match_number": match["match_number"],
+                "players": [match["player1"], match["player2"]],
+                "result": [match["score1"], match["score2"]]
+            })
+        tournament_data["rounds"] = list(rounds.values())
+
+        return tournament_data
+
+    def find_player_history(self, player_number: str) -> list[PlayedGame]:
+        """
+        Returns every game played by a player, oldest first, read through
+        the indexes of the matches on both players.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :rtype: list[PlayedGame]
+        """
+        games = []
+        with self.lock:
+            for row in self.connection.execute(
+                    "SELECT t.start_date, t.name, m.round_number, "
+                    "m.match_number, 0 AS side, m.player2 AS opponent, "
+                    "m.score1 AS score, m.score1 + m.score2 AS played "
+                    "FROM matches m "
+                    "JOIN tournaments t ON t.id = m.tournament_id "
+                    "WHERE m.player1 = :player "
+                    "UNION ALL "
+                    "SELECT t.start_date, t.name, m.round_number, "
+                    "m.match_number, 1, m.player1, m.score2, "
+                    "m.score1 + m.score2 "
+                    "FROM matches m "
+                    "JOIN tournaments t ON t.id = m.tournament_id "
+                    "WHERE m.player2 = :player "
+                    "ORDER BY 1, 2, 3, 4",
+                    {"player": player_number}):
+                games.append(PlayedGame(
+                    row[0], row[1], row[2], row[3],
+                    PlayerHistory.COLOURS[row["side"]],
+                    row["opponent"],
+                    half_points_to_score(round(2 * row["score"]))
+                    if row["played"] else None
+                ))
+        return games
+
+    def find_head_to_head(self,
+                          player_number: str,
+                          opponent_number: str) -> tuple[int, int, int]:
+        """
+        Returns the record of a player against an opponent, counting only
+        the matches already played.
+
+        :param player_number: The national player number of the player.
+        :type player_number: str
+        :param opponent_number: The national player number of the
+            opponent.
+        :type opponent_number: str
+        :return: The number of wins, draws and losses of the player.
+        :rtype: tuple[int, int, int]
+        """
+        record = [0, 0, 0]
+        with self.lock:
+            for row in self.connection.execute(
+                    "SELECT score1 FROM matches "
+                    "WHERE player1 = :player AND player2 = :opponent "
+                    "AND score1 + score2 > 0 "
+                    "UNION ALL "
+                    "SELECT score2 FROM matches "
+                    "WHERE player2 = :player AND player1 = :opponent "
+                    "AND score1 + score2 > 0",
+                    {"player": player_number, "opponent": opponent_number}):
+                record[2 - round(2 * row[0])] += 1
+        return record[0], record[1], record[2]
+
+    def find_lifetime_score(self, player_number: str) -> Union[int, float]:
+        """
+        Returns the total of the points scored by a player.
+
+        :param player_number: The national player number.
+        :type player_number: str
+        :rtype: int or float
+        """
+        with self.lock:
+            total = self.connection.execute(
+                "SELECT (SELECT COALESCE(SUM(score1), 0) FROM matches "
+                "WHERE player1 = :player) + "
+                "(SELECT COALESCE(SUM(score2), 0) FROM matches "
+                "WHERE player2 = :player)",
+                {"player": player_number}).fetchone()[0]
+        return half_points_to_score(round(2 * total))
+
+    def migrate_from_json(self) -> tuple[int, int]:
+        """
+        Copies the players and tournaments stored in the JSON files into
+        the SQLite data base. Existing rows with the same keys are replaced.
+
+        :return: The number of players and of tournaments copied.
+        :rtype: tuple[int, int]
+        """
+        players_data = PlayerRegistry().all()
+        with self.transaction():
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO players VALUES "
+                "(:national_player_number, :name, :first_name, :birthday, "
+                ":score)",
+                players_data)
+
+        tournaments_number = 0
+        for json_file in DataBase.find_tournaments_in_file():
+            tournament_data = DataBase.read_tournament(json_file)
+            if tournament_data is not None:
+                self.insert_tournament(tournament_data)
+                tournaments_number += 1
+
+        return len(players_data), tournaments_number
+
+
+if __name__ == "__main__":
+    players_number, tournaments_number = SQLiteDataBase().migrate_from_json()
+    print(f"{players_number} joueurs et {tournaments_number} tournois ont "
+          f"été copiés dans {SQLITE_FILE_PATH}.")
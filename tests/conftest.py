@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pytest
+
+# the modules of the project are at the root of the repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from models import (DataBase,  # noqa: E402
+                    Player,
+                    PlayerIdentityMap,
+                    PlayerRegistry,
+                    Tournament)
+
+
+@pytest.fixture
+def data_directory(tmp_path, monkeypatch):
+    """
+    Runs a test in an empty directory, where the "data" directory of the
+    settings is created, with empty in-memory indexes of the data files.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(DataBase, "player_registry", PlayerRegistry())
+    monkeypatch.setattr(Player, "identities", PlayerIdentityMap())
+    return tmp_path
+
+
+def player_number(index: int) -> str:
+    return f"ab{index:05d}"
+
+
+@pytest.fixture
+def player_numbers(data_directory) -> list[str]:
+    """Adds 8 players to the JSON data base and returns their numbers."""
+    numbers = [player_number(index) for index in range(8)]
+    for index, number in enumerate(numbers):
+        DataBase.write_new_player_in_json(Player(
+            number, f"Nom{index}", f"Prénom{index}", "01/01/2000"))
+    return numbers
+
+
+@pytest.fixture
+def tournament(player_numbers) -> Tournament:
+    """
+    Returns a saved tournament of 8 players whose first round has been
+    paired, without result yet.
+    """
+    tournament = Tournament("Open", "Paris", max_round=3)
+    for number in player_numbers:
+        tournament.add_player(number)
+    tournament.add_round()
+    tournament.rounds[-1].add_match()
+    tournament.save()
+    return tournament
@@ -0,0 +1,26 @@
+import time
+
+from autosave import TournamentSaver
+from models import DataBase, MatchResult
+
+
+def test_changes_are_saved_together_outside_the_lock(tournament):
+    saver = TournamentSaver(tournament, 0.01, 0.05)
+    saver.start()
+    try:
+        with tournament.lock:
+            for match in tournament.rounds[0].matches:
+                match.assign_outcome(MatchResult.DRAW)
+                tournament.save()
+            time.sleep(0.1)
+            # the saver waits for the change to be complete
+            assert saver.saves == 0
+        tournament.flush()
+    finally:
+        saver.close()
+
+    assert (saver.requests, saver.saves) == (4, 1)
+    assert tournament.saver is None
+    stored = DataBase.read_tournament("Open.json")
+    assert all(match["result"] == [0.5, 0.5]
+               for match in stored["rounds"][0]["matches"])
@@ -0,0 +1,85 @@
+import csv
+import json
+import os
+
+import pytest
+
+from export import ReportExporter
+from models import DataBase, MatchResult, Player
+
+
+def test_players_are_exported_in_every_format(player_numbers):
+    exporter = ReportExporter(DataBase())
+
+    result = exporter.export("joueurs", "csv", "joueurs.csv", "name")
+    assert result.rows == 8
+    with open("joueurs.csv", encoding="utf-8-sig", newline="") as file:
+        rows = list(csv.reader(file, delimiter=";"))
+    assert rows[0] == ["N.P.N.", "Nom", "Prénom", "Date de naissance"]
+    assert rows[1] == ["ab00000", "Nom0", "Prénom0", "01/01/2000"]
+
+    exporter.export("joueurs", "jsonl", "joueurs.jsonl")
+    with open("joueurs.jsonl", encoding="utf-8") as file:
+        players = [json.loads(line) for line in file]
+    assert [player["national_player_number"] for player in players] \
+        == player_numbers
+    assert players[3]["first_name"] == "Prénom3"
+
+    DataBase.write_new_player_in_json(
+        Player("ab00009", "<Nom>", "&", "01/01/2000"))
+    assert exporter.export("joueurs", "html", "joueurs.html").rows == 9
+    with open("joueurs.html", encoding="utf-8") as file:
+        page = file.read()
+    assert "<title>Liste des joueurs</title>" in page
+    assert page.count("<tr>") == 10
+    assert "<td>&lt;Nom&gt;</td><td>&amp;</td>" in page
+
+
+def test_matches_are_exported_with_their_players(tournament):
+    played_round = tournament.rounds[-1]
+    match = played_round.matches[0]
+    match.assign_outcome(MatchResult.DRAW)
+    tournament.save()
+
+    path = os.path.join("exports", "matchs.jsonl")
+    result = ReportExporter(DataBase()).export("matchs", "jsonl", path)
+    assert result.rows == 4
+    with open(path, encoding="utf-8") as file:
+        first = json.loads(file.readline())
+    assert first["tournament"] == "Open"
+    assert (first["round_number"], first["match_number"]) == (1, 1)
+    assert (first["player1"], first["name1"], first["score1"]) \
+        == (match.player1.national_player_number, match.player1.name, 0.5)
+    assert (first["player2"], first["score2"]) \
+        == (match.player2.national_player_number, 0.5)
+
+
+def test_unknown_reports_and_formats_are_refused(data_directory):
+    exporter = ReportExporter(DataBase())
+    with pytest.raises(ValueError):
+        exporter.export("arbitres", "csv")
+    with pytest.raises(ValueError):
+        exporter.export("joueurs", "xlsx")
+
+
+@pytest.mark.parametrize("error", [OSError, KeyboardInterrupt])
+def test_an_interrupted_export_leaves_no_file(player_numbers, monkeypatch,
+                                              error):
+    exporter = ReportExporter(DataBase())
+    path = os.path.join("exports", "joueurs.csv")
+    assert exporter.export("joueurs", "csv", path).rows == 8
+
+    player_rows = exporter.player_rows
+
+    def failing_rows(criterion):
+        yield from player_rows(criterion)
+        raise error
+
+    monkeypatch.setattr(exporter, "player_rows", failing_rows)
+    with pytest.raises(error):
+        exporter.export("joueurs", "csv", path)
+
+    # the previous export is kept, and the temporary file is removed
+    with open(path, encoding="utf-8-sig") as file:
+        assert len(file.readlines()) == 9
+    assert not os.path.exists(f"{path}.tmp")
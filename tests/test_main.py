@@ -0,0 +1,100 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from main import main
+from models import DataBase, MatchResult
+
+
+def read_open() -> dict:
+    return DataBase.read_tournament("Open.json")
+
+
+def test_a_tournament_is_run_from_the_command_line(player_numbers,
+                                                   tmp_path,
+                                                   monkeypatch):
+    assert main(["creer", "Open", "Paris", "-r", "2"]) == 0
+    assert main(["inscrire", "Open", *[number.upper()
+                                       for number in player_numbers]]) == 0
+    assert len(read_open()["players"]) == 8
+
+    for round_number in (1, 2):
+        assert main(["ronde", "Open"]) == 0
+        assert read_open()["round_number"] == round_number
+        results = tmp_path / "resultats.txt"
+        results.write_text("# ronde\n1 1-0\n2 0-1\n\n3 1/2-1/2\n",
+                           encoding="utf-8")
+        assert main(["resultats", "Open", str(results)]) == 0
+        assert not read_open()["rounds"][-1]["end_time"]
+        monkeypatch.setattr("sys.stdin", io.StringIO("4 1-0\n"))
+        assert main(["resultats", "Open", "-"]) == 0
+        played_round = read_open()["rounds"][-1]
+        assert played_round["end_time"]
+        assert [MatchResult.from_points(*match["result"])
+                for match in played_round["matches"]] \
+            == [MatchResult.PLAYER1, MatchResult.PLAYER2,
+                MatchResult.DRAW, MatchResult.PLAYER1]
+
+    assert main(["terminer", "Open"]) == 0
+    assert read_open()["end_date"]
+    assert sum(player["score"] for player in read_open()["players"]) == 8
+
+    export_path = tmp_path / "matchs.jsonl"
+    assert main(["exporter", "matchs", "jsonl", "-o", str(export_path)]) == 0
+    with open(export_path, encoding="utf-8") as file:
+        assert len([json.loads(line) for line in file]) == 8
+
+
+@pytest.mark.parametrize("arguments", [
+    ["inscrire", "Inconnu", "ab00001"],
+    ["inscrire", "Open", "ab00001", "zz99999"],
+    ["inscrire", "Open", "a1"],
+    ["ronde", "Open"],
+    ["terminer", "Open"],
+    ["creer", "Open", "Lyon"],
+    ["creer", "Printemps", "Lyon", "-r", "0"],
+])
+def test_invalid_commands_fail_without_changes(player_numbers, arguments):
+    assert main(["creer", "Open", "Paris", "-r", "2"]) == 0
+    assert main(["inscrire", "Open", "ab00000", "ab00001"]) == 0
+    before = read_open()
+
+    assert main(arguments) == 1
+    assert read_open() == before
+    assert [header["name"] for header in DataBase().find_tournaments()] \
+        == ["Open"]
+
+
+def test_results_are_checked_before_any_is_assigned(player_numbers,
+                                                    tmp_path):
+    assert main(["creer", "Open", "Paris", "-r", "2"]) == 0
+    assert main(["inscrire", "Open", *player_numbers]) == 0
+    assert main(["ronde", "Open"]) == 0
+    before = read_open()
+
+    results = tmp_path / "resultats.txt"
+    for lines in ("1 1-0\n9 1-0\n", "1 1-0\n1 0-1\n", "1 2-0\n"):
+        results.write_text(lines, encoding="utf-8")
+        assert main(["resultats", "Open", str(results)]) == 1
+    assert read_open() == before
+
+    results.write_text("1 1-0\n", encoding="utf-8")
+    assert main(["resultats", "Open", str(results)]) == 0
+    assert main(["resultats", "Open", str(results)]) == 1
+
+
+def test_the_menus_start_without_the_heavy_modules():
+    # a new interpreter, as the other tests have already imported them
+    modules = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, main, controllers, views; "
+         "print(' '.join(sorted(sys.modules)))"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True, text=True, check=True).stdout.split()
+    for module in ("numpy", "concurrent.futures", "rich.table",
+                   "rich.markup", "ratings", "simulation", "tie_breaks"):
+        assert module not in modules
@@ -0,0 +1,390 @@
+import copy
+import json
+import os
+
+from conftest import player_number
+from models import (LEGACY_TIMESTAMP_FORMAT,
+                    TOURNAMENT_FORMAT_VERSION,
+                    DataBase,
+                    Match,
+                    MatchResult,
+                    OpponentHistory,
+                    PackedRound,
+                    Player,
+                    PlayerIdentityMap,
+                    PlayerRegistry,
+                    Standings,
+                    Tournament,
+                    TournamentCatalog,
+                    TournamentJournal)
+from settings import (PLAYERS_FILE_PATH,
+                      PLAYERS_JOURNAL_FILE_PATH,
+                      TOURNAMENT_FILE_PATH)
+
+
+def load(tournament_data: dict) -> Tournament:
+    tournament = Tournament(tournament_data["name"],
+                            tournament_data["place"])
+    tournament.load(tournament_data)
+    return tournament
+
+
+def player_data(index: int) -> dict:
+    return {"national_player_number": player_number(index),
+            "name": f"Nom{index}", "first_name": f"Prénom{index}",
+            "birthday": "01/01/2000", "score": 0}
+
+
+def test_results_are_journaled_then_replayed(tournament):
+    played_round = tournament.rounds[-1]
+    match = played_round.matches[0]
+    match.assign_outcome(MatchResult.PLAYER1)
+    tournament.record_result(played_round, match)
+    played_round.ended()
+    tournament.record_round_end()
+
+    with open(f"{TOURNAMENT_FILE_PATH}Open.json", encoding="utf-8") as file:
+        snapshot = json.load(file)
+    assert snapshot["rounds"][0]["matches"][0]["result"] == [0, 0]
+    assert [event["event"] for event in TournamentJournal("Open").read()] \
+        == ["result", "round_end"]
+
+    loaded = load(DataBase.read_tournament("Open.json"))
+    loaded_match = loaded.rounds[0].matches[0]
+    assert loaded_match.outcome is MatchResult.PLAYER1
+    assert loaded_match.player1.score == 1
+    assert loaded_match.player2.score == 0
+    assert loaded.rounds[0].end_time
+
+
+def test_save_folds_the_journal_into_the_snapshot(tournament):
+    played_round = tournament.rounds[-1]
+    for match in played_round.matches:
+        match.assign_outcome(MatchResult.DRAW)
+        tournament.record_result(played_round, match)
+    tournament.save()
+
+    assert TournamentJournal("Open").read() == []
+    with open(f"{TOURNAMENT_FILE_PATH}Open.json", encoding="utf-8") as file:
+        snapshot = json.load(file)
+    assert all(match["result"] == [0.5, 0.5]
+               for match in snapshot["rounds"][0]["matches"])
+    assert all(player["score"] == 0.5 for player in snapshot["players"])
+
+
+def test_an_incomplete_journal_line_is_ignored(tournament):
+    played_round = tournament.rounds[-1]
+    match = played_round.matches[0]
+    match.assign_outcome(MatchResult.PLAYER2)
+    tournament.record_result(played_round, match)
+    with open(f"{TOURNAMENT_FILE_PATH}Open.jsonl", "a",
+              encoding="utf-8") as file:
+        file.write('{"event": "result", "round_')
+
+    loaded = load(DataBase.read_tournament("Open.json"))
+    assert [match.outcome for match in loaded.rounds[0].matches] \
+        == [MatchResult.PLAYER2] + 3 * [MatchResult.PENDING]
+
+
+def test_the_catalog_lists_tournaments_by_status(tournament):
+    ended = Tournament("Printemps", "Lyon")
+    ended.save()
+    ended.ended()
+
+    assert {header["name"] for header in DataBase().find_tournaments()} \
+        == {"Open", "Printemps"}
+    assert [header["name"]
+            for header in DataBase().find_tournaments("ended")] \
+        == ["Printemps"]
+    [header] = DataBase().find_tournaments("no_ended")
+    assert header["file"] == "Open.json"
+    assert header["round_number"] == 1
+
+
+def test_the_catalog_rebuilds_entries_of_changed_files(tournament):
+    DataBase().find_tournaments()
+    with open(f"{TOURNAMENT_FILE_PATH}Open.json", encoding="utf-8") as file:
+        tournament_data = json.load(file)
+    tournament_data["place"] = "Nantes"
+    with open(f"{TOURNAMENT_FILE_PATH}Open.json", "w",
+              encoding="utf-8") as file:
+        json.dump(tournament_data, file, indent=4)
+
+    [header] = DataBase().find_tournaments()
+    assert header["place"] == "Nantes"
+    entry = TournamentCatalog().read()["Open.json"]
+    assert entry["place"] == "Nantes"
+    assert entry["signature"] == TournamentCatalog.file_signature("Open.json")
+
+
+def test_concurrent_saves_are_merged(tournament):
+    first = load(DataBase.read_tournament("Open.json"))
+    second = load(DataBase.read_tournament("Open.json"))
+
+    first.rounds[0].matches[0].assign_outcome(MatchResult.PLAYER1)
+    first.save()
+    second.rounds[0].matches[1].assign_outcome(MatchResult.PLAYER2)
+    second.save()
+
+    stored = load(DataBase.read_tournament("Open.json"))
+    assert [match.outcome for match in stored.rounds[0].matches] \
+        == [MatchResult.PLAYER1, MatchResult.PLAYER2,
+            MatchResult.PENDING, MatchResult.PENDING]
+    assert sorted(player.score for player in stored.players) \
+        == 6 * [0] + 2 * [1]
+    # the second program adopted the result of the first in place
+    assert second.rounds[0].matches[0].outcome is MatchResult.PLAYER1
+    assert second.revision == 3
+
+
+def test_concurrent_registrations_are_merged(player_numbers):
+    Tournament("Printemps", "Lyon").save()
+    first = load(DataBase.read_tournament("Printemps.json"))
+    second = load(DataBase.read_tournament("Printemps.json"))
+
+    first.add_player(player_numbers[0])
+    first.save()
+    second.add_player(player_numbers[1])
+    second.add_player(player_numbers[0])
+    second.save()
+
+    stored = DataBase.read_tournament("Printemps.json")
+    assert [player["national_player_number"]
+            for player in stored["players"]] == player_numbers[1::-1]
+
+
+def test_merge_keeps_the_results_assigned_here(tournament):
+    other = load(DataBase.read_tournament("Open.json"))
+    other.rounds[0].matches[0].assign_outcome(MatchResult.PLAYER2)
+    other.rounds[0].ended()
+    other.save()
+
+    tournament.rounds[0].matches[0].assign_outcome(MatchResult.PLAYER1)
+    assert tournament.merge(DataBase.read_tournament("Open.json"))
+    assert tournament.rounds[0].matches[0].outcome is MatchResult.PLAYER1
+    assert tournament.rounds[0].end_time
+    assert not tournament.merge(DataBase.read_tournament("Open.json"))
+
+
+def test_players_share_their_identity(data_directory):
+    identities = PlayerIdentityMap()
+    identity = identities.get("ab00001", "Durand", "Marie", "01/01/2000")
+    assert identities.get("ab00001", "Durand", "Marie", "01/01/2000") \
+        is identity
+    assert len(identities) == 1
+
+    player = Player("ab00001", "Durand", "Marie", "01/01/2000")
+    del player
+    assert len(Player.identities) == 0
+
+
+def test_different_details_get_their_own_identity():
+    identities = PlayerIdentityMap()
+    identity = identities.get("ab00001", "Durand", "Marie", "01/01/2000")
+    renamed = identities.get("ab00001", "Martin", "Marie", "01/01/2000")
+
+    assert renamed is not identity
+    assert (identity.name, renamed.name) == ("Durand", "Martin")
+    assert identities.get("ab00001", "Durand", "Marie", "01/01/2000") \
+        is identity
+
+
+def test_each_tournament_saves_its_own_player_details(player_numbers):
+    winter = Tournament("Hiver", "Lyon")
+    winter.add_player(player_numbers[0])
+    winter.save()
+    # the player was renamed in the file of another tournament
+    data = winter.serialize()
+    data["name"] = "Printemps"
+    data["players"][0]["name"] = "Autre"
+    with open(f"{TOURNAMENT_FILE_PATH}Printemps.json", "w",
+              encoding="utf-8") as file:
+        json.dump(data, file)
+
+    winter = load(DataBase.read_tournament("Hiver.json"))
+    spring = load(DataBase.read_tournament("Printemps.json"))
+    assert (winter.players[0].name, spring.players[0].name) \
+        == ("Nom0", "Autre")
+    spring.save()
+    winter.save()
+    assert DataBase.read_tournament("Printemps.json")["players"][0][
+        "name"] == "Autre"
+    assert DataBase.read_tournament("Hiver.json")["players"][0][
+        "name"] == "Nom0"
+
+
+def test_the_registry_parses_the_players_file_once(data_directory,
+                                                   monkeypatch):
+    registry = PlayerRegistry()
+    assert registry.get("ab00001") is None
+    # another program replaces the players file
+    with open(PLAYERS_FILE_PATH, "w", encoding="utf-8") as file:
+        json.dump([{"national_player_number": "ab00001", "name": "Durand",
+                    "first_name": "Marie", "birthday": "01/01/2000",
+                    "score": 0}], file)
+    assert registry.get("ab00001")["name"] == "Durand"
+
+    # while the file is unchanged, lookups are answered from memory
+    monkeypatch.setattr(json, "load", None)
+    assert registry.get("ab00001")["first_name"] == "Marie"
+    assert registry.get("ab00002") is None
+    assert len(registry.all()) == 1
+
+
+def test_new_players_are_journaled_then_compacted(data_directory):
+    registry = PlayerRegistry()
+    registry.append(player_data(0))
+    registry.append(player_data(1))
+    registry.append(player_data(0))
+
+    with open(PLAYERS_FILE_PATH, encoding="utf-8") as file:
+        assert json.load(file) == []
+    with open(PLAYERS_JOURNAL_FILE_PATH, encoding="utf-8") as file:
+        assert len(file.readlines()) == 2
+
+    registry.journal_max_size = 1
+    registry.append(player_data(2))
+    assert not os.path.exists(PLAYERS_JOURNAL_FILE_PATH)
+    with open(PLAYERS_FILE_PATH, encoding="utf-8") as file:
+        assert json.load(file) == [player_data(index) for index in range(3)]
+    assert PlayerRegistry().all() == registry.all()
+
+
+def test_a_player_being_journaled_is_read_once_complete(data_directory):
+    registry = PlayerRegistry()
+    registry.append(player_data(0))
+    line = json.dumps(player_data(1)) + "\n"
+    with open(PLAYERS_JOURNAL_FILE_PATH, "a", encoding="utf-8") as file:
+        file.write(line[:20])
+    assert registry.get(player_number(1)) is None
+
+    with open(PLAYERS_JOURNAL_FILE_PATH, "a", encoding="utf-8") as file:
+        file.write(line[20:])
+    assert registry.get(player_number(1)) == player_data(1)
+    assert len(registry.all()) == 2
+
+
+def test_legacy_tournament_files_are_upgraded(tournament):
+    played_round = tournament.rounds[-1]
+    played_round.matches[0].assign_outcome(MatchResult.PLAYER1)
+    played_round.matches[1].assign_outcome(MatchResult.DRAW)
+    current = tournament.serialize()
+
+    # the first format embedded the players in the matches, and wrote the
+    # dates as "dd-mm-yyyy HH:MM"
+    legacy = copy.deepcopy(current)
+    del legacy["version"]
+    legacy["start_date"] = tournament.start_date.strftime(
+        LEGACY_TIMESTAMP_FORMAT)
+    legacy_round = legacy["rounds"][0]
+    legacy_round["start_time"] = played_round.start_time.strftime(
+        LEGACY_TIMESTAMP_FORMAT)
+    players = {player["national_player_number"]: player
+               for player in legacy["players"]}
+    for match in legacy_round["matches"]:
+        number1, number2 = match.pop("players")
+        match["player1"] = players[number1]
+        match["player2"] = players[number2]
+        match["result"] = [["Payer1", match["result"][0]],
+                           ["Player2", match["result"][1]]]
+
+    upgraded = load(legacy).serialize()
+    assert legacy["version"] == TOURNAMENT_FORMAT_VERSION
+    assert upgraded["rounds"] == current["rounds"]
+    assert sorted(upgraded.pop("players"), key=str) \
+        == sorted(current.pop("players"), key=str)
+    assert upgraded == current
+
+
+def test_loaded_matches_refer_to_the_tournament_players(tournament):
+    tournament.rounds[-1].ended()
+    data = tournament.serialize()
+    assert data["start_date"] == tournament.start_date.strftime(
+        "%Y-%m-%dT%H:%M")
+
+    loaded = load(data)
+    players = {player.national_player_number: player
+               for player in loaded.players}
+    for match, stored in zip(loaded.rounds[0].matches,
+                             data["rounds"][0]["matches"]):
+        assert (match.player1, match.player2) \
+            == tuple(players[number] for number in stored["players"])
+        assert match.player2.national_player_number in match.player1.opponents
+    assert loaded.start_date == tournament.start_date.replace(
+        second=0, microsecond=0)
+    assert loaded.rounds[0].end_time == tournament.rounds[0].end_time.replace(
+        second=0, microsecond=0)
+
+
+def test_the_opponent_history_keeps_the_order_of_the_games():
+    opponents = OpponentHistory(["ab00002", "ab00001"])
+    opponents.push("ab00002")
+
+    assert "ab00001" in opponents
+    assert "ab00003" not in opponents
+    assert list(opponents) == ["ab00002", "ab00001", "ab00002"]
+    assert len(opponents) == 3
+
+
+def test_the_standings_move_players_between_score_buckets(data_directory):
+    players = [Player(player_number(index), f"Nom{index}",
+                      f"Prénom{index}", "01/01/2000")
+               for index in range(4)]
+    standings = Standings(players)
+    assert standings.ranking() == players
+    assert standings.keys == [0]
+
+    players[2].score = 1
+    standings.update(players[2])
+    players[1].score = 0.5
+    standings.update(players[1])
+    players[3].score = 1
+    standings.update(players[3])
+    assert standings.ranking() == [players[2], players[3], players[1],
+                                   players[0]]
+    assert standings.keys == [0, 1, 2]
+
+    players[0].score = 1.5
+    standings.update(players[0])
+    players[1].score = 1.5
+    standings.update(players[1])
+    # the buckets left empty are removed
+    assert standings.keys == [2, 3]
+    assert standings.ranking() == [players[0], players[1], players[2],
+                                   players[3]]
+    assert len(standings) == 4 and players[0] in standings
+
+
+def test_results_update_the_standings(tournament):
+    played_round = tournament.rounds[-1]
+    match = played_round.matches[0]
+    match.assign_outcome(MatchResult.PLAYER2)
+    assert tournament.standings.ranking()[0] is match.player2
+
+
+def test_scores_are_kept_in_half_points(data_directory):
+    player = Player("ab00001", "Durand", "Marie", "01/01/2000", 2.5)
+    assert (player.half_points, player.score) == (5, 2.5)
+    player.score += 0.5
+    assert player.score == 3 and isinstance(player.score, int)
+    assert not hasattr(player, "__dict__")
+
+    assert MatchResult.from_points(0.5, 0.5) is MatchResult.DRAW
+    assert MatchResult.from_points(0, 1) is MatchResult.PLAYER2
+    assert MatchResult.from_points(0, 0) is MatchResult.PENDING
+    assert MatchResult.from_points(1, 1) is MatchResult.PENDING
+    assert MatchResult.DRAW.points == (0.5, 0.5)
+
+
+def test_packed_rounds_read_back_like_rounds(tournament):
+    played_round = tournament.rounds[-1]
+    played_round.matches[0].assign_outcome(MatchResult.PLAYER1)
+    played_round.matches[1].assign_outcome(MatchResult.DRAW)
+    data = tournament.serialize()
+
+    packed = Tournament("Open", "Paris")
+    packed.load(copy.deepcopy(data), packed=True)
+    assert isinstance(packed.rounds[0], PackedRound)
+    assert all(isinstance(match, Match)
+               for match in packed.rounds[0].matches)
+    assert packed.serialize()["rounds"] == data["rounds"]
@@ -0,0 +1,68 @@
+import random
+
+from models import Player
+from pairing import max_weight_matching, pair_players
+
+
+def make_players(count: int) -> list[Player]:
+    return [Player(f"pp{index:05d}", f"Nom{index}", f"Prénom{index}",
+                   "01/01/2000")
+            for index in range(count)]
+
+
+def test_max_weight_matching():
+    edges = [(0, 1, 5), (1, 2, 11), (2, 3, 5)]
+    assert max_weight_matching(edges) == [-1, 2, 1, -1]
+    assert max_weight_matching(edges, max_cardinality=True) == [1, 0, 3, 2]
+    # a blossom: the odd cycle 0-1-2 must be shrunk to reach vertex 3
+    edges = [(0, 1, 8), (0, 2, 9), (1, 2, 10), (2, 3, 7)]
+    assert max_weight_matching(edges) == [1, 0, 3, 2]
+
+
+def test_players_with_the_same_score_are_paired_together():
+    players = make_players(4)
+    players[0].score = 1
+    players[1].score = 1
+    assert pair_players(players) == [(players[0], players[1]),
+                                     (players[2], players[3])]
+
+
+def test_rounds_never_pair_opponents_twice():
+    generator = random.Random(2024)
+    players = make_players(12)
+    for _ in range(7):
+        pairs = pair_players(sorted(players, key=lambda player:
+                                    -player.score))
+        assert pairs is not None
+        paired = [player for pair in pairs for player in pair]
+        assert sorted(paired, key=id) == sorted(players, key=id)
+        for player1, player2 in pairs:
+            assert player2.national_player_number not in player1.opponents
+            player1.opponents.push(player2.national_player_number)
+            player2.opponents.push(player1.national_player_number)
+            points = generator.choice([(1, 0), (0.5, 0.5), (0, 1)])
+            player1.score += points[0]
+            player2.score += points[1]
+
+
+def test_no_pairing_is_returned_when_a_rematch_is_unavoidable():
+    players = make_players(4)
+    for opponent in players[1:]:
+        players[0].opponents.push(opponent.national_player_number)
+        opponent.opponents.push(players[0].national_player_number)
+    assert pair_players(players) is None
+    assert pair_players(make_players(3)) is None
+
+
+def test_the_full_graph_is_used_when_the_window_is_too_narrow():
+    players = make_players(4)
+    players[0].opponents.push(players[1].national_player_number)
+    players[1].opponents.push(players[0].national_player_number)
+
+    # with a window of 1, players 0 and 1 are only linked to player 2
+    pairs = pair_players(players, window=1)
+    assert pairs is not None
+    assert sorted(player.national_player_number
+                  for pair in pairs for player in pair) \
+        == [player.national_player_number for player in players]
+    assert (players[0], players[1]) not in pairs
@@ -0,0 +1,78 @@
+import threading
+
+from models import DataBase, MatchResult, PlayedGame
+
+
+def play_round(tournament, outcomes: list[MatchResult]):
+    played_round = tournament.rounds[-1]
+    for match, outcome in zip(played_round.matches, outcomes):
+        match.assign_outcome(outcome)
+        tournament.record_result(played_round, match)
+    played_round.ended()
+    tournament.record_round_end()
+
+
+def test_history_of_a_player(tournament):
+    data_base = DataBase()
+    match = tournament.rounds[0].matches[0]
+    player1 = match.player1.national_player_number
+    player2 = match.player2.national_player_number
+    assert data_base.find_player_history(player1) == [PlayedGame(
+        tournament.serialize()["start_date"], "Open.json", 1, 1, "white",
+        player2, None)]
+
+    play_round(tournament, 4 * [MatchResult.PLAYER1])
+    tournament.add_round()
+    tournament.rounds[-1].add_match()
+    tournament.record_round_start()
+
+    games = data_base.find_player_history(player1)
+    assert [(game.round_number, game.result) for game in games][0] == (1, 1)
+    assert len(games) == 2 and games[1].result is None
+    assert data_base.find_head_to_head(player1, player2) == (1, 0, 0)
+    assert data_base.find_head_to_head(player2, player1) == (0, 0, 1)
+    assert data_base.find_lifetime_score(player1) == 1
+    assert data_base.find_lifetime_score("zz99999") == 0
+
+
+def test_each_data_base_sees_the_saves_of_the_others(tournament):
+    data_base = DataBase()
+    match = tournament.rounds[0].matches[1]
+    player = match.player1.national_player_number
+    assert data_base.find_lifetime_score(player) == 0
+
+    # saved through the data bases opened by the tournament
+    match.assign_outcome(MatchResult.DRAW)
+    tournament.record_result(tournament.rounds[0], match)
+    assert data_base.find_lifetime_score(player) == 0.5
+    tournament.save()
+    assert data_base.find_lifetime_score(player) == 0.5
+    assert DataBase().find_lifetime_score(player) == 0.5
+
+
+def test_queries_while_another_thread_saves(tournament):
+    data_base = DataBase()
+    players = [player.national_player_number
+               for player in tournament.players]
+    errors = []
+
+    def query():
+        try:
+            for _ in range(200):
+                for player in players:
+                    data_base.find_player_history(player)
+                    data_base.find_lifetime_score(player)
+        except Exception as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=query)
+    thread.start()
+    for match in tournament.rounds[0].matches:
+        match.assign_outcome(MatchResult.PLAYER2)
+        tournament.record_result(tournament.rounds[0], match)
+        data_base.save_tournament(tournament)
+    thread.join()
+
+    assert errors == []
+    assert sum(data_base.find_lifetime_score(player)
+               for player in players) == 4
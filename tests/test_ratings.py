@@ -0,0 +1,64 @@
+import pytest
+
+from models import DataBase, MatchResult
+from ratings import RatingEngine
+
+
+def round_data(round_number: int, matches: list[tuple]) -> dict:
+    return {"round_number": round_number,
+            "matches": [{"players": [player1, player2], "result": result}
+                        for player1, player2, result in matches]}
+
+
+def test_ratings_follow_the_elo_formula(tmp_path):
+    engine = RatingEngine(str(tmp_path / "ratings.json"))
+    engine.rate_tournament({"rounds": [
+        round_data(2, [("ab00001", "ab00002", [0.5, 0.5])]),
+        round_data(1, [("ab00001", "ab00002", [1, 0]),
+                       ("ab00003", "ab00004", [0, 0])])]})
+
+    # round 1 first: both players start at 1500 with K = 40
+    expected = 1 / (1 + 10 ** ((1480 - 1520) / 400))
+    assert engine.rating("ab00001") == pytest.approx(
+        1520 + 40 * (0.5 - expected))
+    assert engine.rating("ab00002") == pytest.approx(
+        1480 - 40 * (0.5 - expected))
+    # a match without result is not rated
+    assert engine.rating("ab00003") is None
+    assert [player_number for player_number, _, _ in engine.ranking()] \
+        == ["ab00001", "ab00002"]
+
+
+def test_k_factor_depends_on_games_and_rating(tmp_path):
+    engine = RatingEngine(str(tmp_path / "ratings.json"),
+                          new_player_games=1, top_rating=1510)
+    engine.rate_tournament({"rounds": [
+        round_data(1, [("ab00001", "ab00002", [1, 0])]),
+        round_data(2, [("ab00001", "ab00002", [0, 1])])]})
+
+    # after one game, the winner is a top player (K = 10) and the loser
+    # an ordinary one (K = 20)
+    expected = 1 / (1 + 10 ** ((1480 - 1520) / 400))
+    assert engine.rating("ab00001") == pytest.approx(1520 - 10 * expected)
+    assert engine.rating("ab00002") == pytest.approx(1480 + 20 * expected)
+
+
+def test_update_rates_ended_tournaments_once(tournament):
+    played_round = tournament.rounds[-1]
+    for match in played_round.matches:
+        match.assign_outcome(MatchResult.PLAYER1)
+        tournament.record_result(played_round, match)
+    played_round.ended()
+    tournament.record_round_end()
+
+    engine = RatingEngine()
+    assert engine.update(DataBase()) == 0
+    tournament.ended()
+    assert engine.update(DataBase()) == 1
+    assert engine.update(DataBase()) == 0
+
+    engine = RatingEngine()
+    engine.read()
+    for match in played_round.matches:
+        assert engine.rating(match.player1.national_player_number) == 1520
+        assert engine.rating(match.player2.national_player_number) == 1480
@@ -0,0 +1,55 @@
+import pytest
+
+from search import PlayerSearchIndex, normalize
+
+
+@pytest.fixture
+def search_index() -> PlayerSearchIndex:
+    search_index = PlayerSearchIndex()
+    search_index.build([
+        {"national_player_number": "ab00000", "name": "Durand",
+         "first_name": "Jean"},
+        {"national_player_number": "ab00001", "name": "Dupont",
+         "first_name": "Zoé"},
+        {"national_player_number": "ab00002", "name": "Moreau",
+         "first_name": "Hélène"},
+        {"national_player_number": "ab00003", "name": "Le Goff",
+         "first_name": "Jean"},
+        {"national_player_number": "ab00004", "name": "Dupré",
+         "first_name": "Jean"},
+    ])
+    return search_index
+
+
+@pytest.mark.parametrize("text, number", [("durnad", "ab00000"),
+                                          ("druand", "ab00000"),
+                                          ("Moraeu", "ab00002")])
+def test_transposed_letters_are_found(search_index, text, number):
+    assert search_index.search(text)[0] == number
+
+
+def test_names_are_normalized():
+    assert normalize("  Lefèvre-Dupré ") == "lefevre dupre"
+    assert normalize("ŒUVRE") == "oeuvre"
+
+
+def test_players_are_found_by_the_beginning_of_their_names(search_index):
+    # the players found by prefix come first, in alphabetical order
+    assert search_index.search("DUP")[:2] == ["ab00001", "ab00004"]
+    assert search_index.search("jean d")[:2] == ["ab00004", "ab00000"]
+    assert search_index.search("hél")[0] == "ab00002"
+    assert search_index.search("goff")[0] == "ab00003"
+    assert search_index.search("legoff")[0] == "ab00003"
+    assert search_index.search("dup", limit=1) == ["ab00001"]
+    assert search_index.search(" - ") == []
+
+
+def test_similar_names_follow_the_prefix_matches(search_index):
+    # "dupond" starts no name: Dupont is the closest one
+    assert search_index.search("dupond")[0] == "ab00001"
+    assert search_index.search("xyzzy") == []
+
+    search_index.add({"national_player_number": "ab00005",
+                      "name": "Duran", "first_name": "Marie"})
+    assert search_index.search("durand")[:2] == ["ab00000", "ab00005"]
+    assert len(search_index) == 6
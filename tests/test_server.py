@@ -0,0 +1,121 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from models import DataBase, MatchResult
+from server import ResultServer
+
+
+@pytest.fixture
+def server(tournament):
+    """Returns a started result server on a free port, stopped after the
+    test."""
+    server = ResultServer(tournament, ("127.0.0.1", 0), 0.01, 0.05)
+    server.writer.start()
+    thread = threading.Thread(target=server.serve_forever,
+                              kwargs={"poll_interval": 0.01})
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+    server.writer.close()
+
+
+def request(server, method: str, path: str, body=None) -> tuple[int, dict]:
+    connection = http.client.HTTPConnection(*server.server_address)
+    if body is not None and not isinstance(body, bytes):
+        body = json.dumps(body).encode("utf-8")
+    connection.request(method, path, body)
+    response = connection.getresponse()
+    status, data = response.status, json.loads(response.read())
+    connection.close()
+    return status, data
+
+
+def test_results_are_assigned_and_written(server):
+    status, state = request(server, "GET", "/ronde")
+    assert status == 200
+    assert (state["round_number"], state["pending"]) == (1, 4)
+
+    assert request(server, "POST", "/resultats",
+                   {"match_number": 1, "result": "1-0"}) \
+        == (200, {"round_number": 1, "assigned": 1, "pending": 3,
+                  "ended": False})
+    # an arbiter retrying the same request
+    assert request(server, "POST", "/resultats",
+                   {"match_number": 1, "result": "1-0"})[1]["assigned"] == 0
+    assert request(server, "POST", "/resultats",
+                   [{"match_number": 2, "result": "0-1"},
+                    {"match_number": 3, "result": "½-½"},
+                    {"match_number": 4, "result": "0.5-0.5"}])[1] \
+        == {"round_number": 1, "assigned": 3, "pending": 0, "ended": True}
+
+    server.writer.flush()
+    played_round = DataBase.read_tournament("Open.json")["rounds"][0]
+    assert played_round["end_time"]
+    assert [MatchResult.from_points(*match["result"])
+            for match in played_round["matches"]] \
+        == [MatchResult.PLAYER1, MatchResult.PLAYER2,
+            MatchResult.DRAW, MatchResult.DRAW]
+
+
+@pytest.mark.parametrize("body, status", [
+    (b"{1: ", 400),
+    ({"match_number": True, "result": "1-0"}, 400),
+    ({"match_number": "1", "result": "1-0"}, 400),
+    ({"match_number": 1.0, "result": "1-0"}, 400),
+    ({"match_number": 1, "result": "2-0"}, 400),
+    ({"match_number": 1}, 400),
+    (["1 1-0"], 400),
+    ([{"match_number": 2, "result": "1-0"}, {"match_number": 0}], 400),
+    ({"match_number": 0, "result": "1-0"}, 404),
+    ({"match_number": 5, "result": "1-0"}, 404),
+    ({"match_number": 1, "result": "0-1"}, 409),
+    ([{"match_number": 2, "result": "1-0"},
+      {"match_number": 2, "result": "0-1"}], 409),
+])
+def test_bad_submissions_are_refused(server, body, status):
+    request(server, "POST", "/resultats",
+            {"match_number": 1, "result": "1-0"})
+
+    response_status, data = request(server, "POST", "/resultats", body)
+    assert response_status == status
+    assert data["error"]
+    # nothing was assigned by the refused request
+    assert [match.outcome for match in server.current_round.matches] \
+        == [MatchResult.PLAYER1] + 3 * [MatchResult.PENDING]
+    assert server.results == 1
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", ""])
+def test_invalid_lengths_are_refused(server, length):
+    connection = http.client.HTTPConnection(*server.server_address)
+    connection.putrequest("POST", "/resultats")
+    connection.putheader("Content-Length", length)
+    connection.endheaders()
+    response = connection.getresponse()
+    assert response.status == 400
+    assert json.loads(response.read())["error"]
+    connection.close()
+    assert server.results == 0
+
+
+def test_results_are_written_without_the_tournament_lock(server,
+                                                         tournament):
+    assert server.lock is tournament.lock
+    server.submit({"match_number": 1, "result": "1-0"})
+    with tournament.lock:
+        flusher = threading.Thread(target=server.writer.flush)
+        flusher.start()
+        flusher.join(5)
+        assert not flusher.is_alive()
+    assert server.writer.events == 1
+
+
+def test_unknown_paths_are_not_found(server):
+    assert request(server, "GET", "/joueurs")[0] == 404
+    assert request(server, "POST", "/ronde",
+                   {"match_number": 1, "result": "1-0"})[0] == 404
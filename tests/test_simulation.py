@@ -0,0 +1,35 @@
+import numpy as np
+
+from models import MatchResult
+from ratings import RatingEngine
+from simulation import simulate_tournament
+
+
+def test_every_simulation_ranks_every_player(tournament):
+    ratings = RatingEngine("ratings.json")
+    result = simulate_tournament(tournament, 100, workers=1, seed=7,
+                                 ratings=ratings)
+
+    assert result.simulations == 100
+    assert (result.positions.sum(axis=0) == 100).all()
+    assert (result.positions.sum(axis=1) == 100).all()
+    assert len(result.ranking()) == 8
+    # the same seed gives the same simulations
+    again = simulate_tournament(tournament, 100, workers=1, seed=7,
+                                ratings=ratings)
+    assert np.array_equal(again.positions, result.positions)
+
+
+def test_a_finished_tournament_has_a_known_ranking(tournament):
+    tournament.max_round = 1
+    played_round = tournament.rounds[-1]
+    for match in played_round.matches:
+        match.assign_outcome(MatchResult.PLAYER1)
+    played_round.ended()
+
+    result = simulate_tournament(tournament, 20, workers=1, seed=7,
+                                 ratings=RatingEngine("ratings.json"))
+    for match in played_round.matches:
+        assert result.chances(match.player1, 4) == 1
+        assert result.chances(match.player2, 4) == 0
+        assert result.mean_position(match.player2) > 4
@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+import sqlite_database
+from conftest import player_number
+from models import DataBase, MatchResult, Player
+from sqlite_database import SQLiteDataBase
+
+
+@pytest.fixture
+def sqlite_data_base(data_directory, monkeypatch):
+    """Returns a data base in a new SQLite file, closed after the test."""
+    monkeypatch.setattr(SQLiteDataBase, "connections", {})
+    monkeypatch.setattr(SQLiteDataBase, "locks", {})
+    monkeypatch.setattr(SQLiteDataBase, "search_indexes", {})
+    data_base = SQLiteDataBase(str(data_directory / "chess.sqlite3"))
+    yield data_base
+    data_base.connection.close()
+
+
+def test_a_saved_tournament_is_read_back(tournament, sqlite_data_base):
+    played_round = tournament.rounds[-1]
+    played_round.matches[0].assign_outcome(MatchResult.PLAYER1)
+    played_round.matches[1].assign_outcome(MatchResult.DRAW)
+
+    sqlite_data_base.save_tournament(tournament)
+
+    assert sqlite_data_base.read_tournament("Open") == tournament.serialize()
+    assert sqlite_data_base.read_tournament("Fermé") is None
+
+
+def test_recorded_events_update_the_rows(tournament, sqlite_data_base):
+    sqlite_data_base.save_tournament(tournament)
+    played_round = tournament.rounds[-1]
+    events = []
+    for match in played_round.matches:
+        match.assign_outcome(MatchResult.PLAYER2)
+        events.append(tournament.result_event(played_round, match))
+    played_round.ended()
+    events.append(tournament.round_end_event())
+
+    sqlite_data_base.record_tournament_events(tournament, events)
+
+    assert sqlite_data_base.read_tournament("Open") == tournament.serialize()
+    [header] = sqlite_data_base.find_tournaments("no_ended")
+    assert header["file"] == "Open"
+
+
+def test_json_files_are_migrated(tournament, sqlite_data_base):
+    played_round = tournament.rounds[-1]
+    match = played_round.matches[0]
+    match.assign_outcome(MatchResult.PLAYER1)
+    tournament.record_result(played_round, match)
+
+    assert sqlite_data_base.migrate_from_json() == (8, 1)
+
+    json_data = DataBase.read_tournament("Open.json")
+    del json_data["revision"]
+    assert sqlite_data_base.read_tournament("Open") == json_data
+    assert sqlite_data_base.find_player_in_json("ab00003") \
+        == DataBase().find_player_in_json("ab00003")
+    assert sqlite_data_base.count_players() == 8
+
+    # migrating again replaces the rows instead of adding them
+    assert sqlite_data_base.migrate_from_json() == (8, 1)
+    assert sqlite_data_base.count_players() == 8
+    assert len(sqlite_data_base.find_tournaments()) == 1
+
+
+def test_reads_wait_for_the_transactions_of_other_threads(sqlite_data_base):
+    counts = []
+    reader = threading.Thread(
+        target=lambda: counts.append(sqlite_data_base.count_players()))
+    with sqlite_data_base.transaction():
+        sqlite_data_base.connection.execute(
+            "INSERT INTO players VALUES (?, 'Nom', 'Prénom', '01/01/2000', 0)",
+            (player_number(0),))
+        reader.start()
+        reader.join(0.1)
+        assert reader.is_alive()
+    reader.join()
+    assert counts == [1]
+
+
+def test_players_are_iterated_by_batches(sqlite_data_base, monkeypatch):
+    monkeypatch.setattr(sqlite_database, "FETCH_SIZE", 2)
+    for index in range(5):
+        sqlite_data_base.write_new_player_in_json(Player(
+            player_number(index), f"Nom{index}", f"Prénom{index}",
+            "01/01/2000"))
+
+    players = sqlite_data_base.iter_players()
+    first = next(players)
+    # the lock is not held between the rows, so another thread can write
+    writer = threading.Thread(
+        target=sqlite_data_base.write_new_player_in_json,
+        args=(Player(player_number(9), "Nom9", "Prénom9", "01/01/2000"),))
+    writer.start()
+    writer.join(1)
+    assert not writer.is_alive()
+
+    numbers = [first["national_player_number"]]
+    numbers += [player["national_player_number"] for player in players]
+    assert numbers[:5] == [player_number(index) for index in range(5)]
@@ -0,0 +1,54 @@
+from conftest import player_number
+from models import TOURNAMENT_FORMAT_VERSION, Tournament
+from tie_breaks import TieBreaks
+
+
+def test_tie_breaks_of_a_small_tournament(data_directory):
+    # round 1: 0 beats 1, 2 draws with 3; round 2: 0 beats 2, 1 beats 3
+    rounds = [[(0, 1, 1, 0), (2, 3, 0.5, 0.5)],
+              [(0, 2, 1, 0), (1, 3, 1, 0)]]
+    tournament = Tournament("Open", "Paris")
+    tournament.load({
+        "version": TOURNAMENT_FORMAT_VERSION,
+        "name": "Open",
+        "place": "Paris",
+        "description": "",
+        "start_date": "2024-09-06T09:00",
+        "end_date": None,
+        "round_number": 2,
+        "max_round": 2,
+        "players": [{"national_player_number": player_number(index),
+                     "name": f"Nom{index}", "first_name": f"Prénom{index}",
+                     "birthday": "01/01/2000", "score": score}
+                    for index, score in enumerate([2, 1, 0.5, 0.5])],
+        "rounds": [{"name": f"round {number}",
+                    "round_number": number,
+                    "start_time": "2024-09-06T09:00",
+                    "end_time": "2024-09-06T11:00",
+                    "matches": [{"match_number": match_number,
+                                 "players": [player_number(index1),
+                                             player_number(index2)],
+                                 "result": [score1, score2]}
+                                for match_number,
+                                (index1, index2, score1, score2)
+                                in enumerate(matches, 1)]}
+                   for number, matches in enumerate(rounds, 1)]
+    })
+    players = {player.national_player_number: player
+               for player in tournament.players}
+
+    tie_breaks = TieBreaks(tournament)
+    assert [tie_breaks.of(players[player_number(index)])
+            for index in range(4)] == [
+        {"direct_encounter": 0, "buchholz_cut_1": 1, "buchholz": 1.5,
+         "sonneborn_berger": 1.5, "progressive": 3},
+        {"direct_encounter": 0, "buchholz_cut_1": 2, "buchholz": 2.5,
+         "sonneborn_berger": 0.5, "progressive": 1},
+        {"direct_encounter": 0.5, "buchholz_cut_1": 2, "buchholz": 2.5,
+         "sonneborn_berger": 0.25, "progressive": 1},
+        {"direct_encounter": 0.5, "buchholz_cut_1": 1, "buchholz": 1.5,
+         "sonneborn_berger": 0.25, "progressive": 1}]
+    # 2 and 3 have the same score and drew: Buchholz cut 1 separates them
+    assert [player.national_player_number
+            for player in tie_breaks.ranking()] \
+        == [player_number(index) for index in range(4)]
@@ -0,0 +1,29 @@
+from views import PaginatedTable
+
+
+def test_only_the_displayed_pages_are_fetched(monkeypatch, capsys):
+    requests = []
+
+    def fetch_rows(offset: int, limit: int) -> list[tuple]:
+        requests.append((offset, limit))
+        return [(f"ligne {position}",)
+                for position in range(offset, min(offset + limit, 45))]
+
+    def locate(text: str):
+        return 33 if text == "ligne 33" else None
+
+    table = PaginatedTable("Joueurs", [("Ligne", "", 20)], 45, fetch_rows,
+                           locate, page_size=10)
+    assert table.pages_number == 5
+
+    commands = iter(["", "f", "p", "2", "ligne 33", "inconnu", "q"])
+    monkeypatch.setattr(table.console, "input",
+                        lambda prompt: next(commands))
+    table.run()
+
+    assert requests == [(0, 10), (10, 10), (40, 10), (30, 10), (10, 10),
+                        (30, 10), (30, 10)]
+    output = capsys.readouterr().out
+    assert "(page 5/5)" in output
+    assert "ligne 44" in output
+    assert "Aucun résultat pour « inconnu »." in output
@@ -0,0 +1,116 @@
+import numpy as np
+
+from models import MatchResult
+
+TIE_BREAK_NAMES = {
+    "direct_encounter": "Conf.",
+    "buchholz_cut_1": "Bu-1",
+    "buchholz": "Bu",
+    "sonneborn_berger": "S-B",
+    "progressive": "Prog."
+}
+
+
+class TieBreaks:
+    """les départages d'un tournoi"""
+
+    def __init__(self, tournament):
+        """
+        Computes the tie-breaks of every player of a tournament.
+
+        The played matches are stored as a sparse player×player result
+        matrix: three arrays holding, for each game and from the point of
+        view of each of its two players, the index of the player, the
+        index of the opponent and the half-points scored. Every tie-break
+        is then an array operation over these games, so the cost grows
+        with the number of games instead of the square of the number of
+        players. Matches without a result yet are ignored.
+
+        Tie-breaks are expressed in points:
+        - direct_encounter: points scored against the players with the
+            same score.
+        - buchholz: sum of the scores of the opponents.
+        - buchholz_cut_1: Buchholz without the weakest opponent.
+        - sonneborn_berger: sum of the scores of the beaten opponents
+            and of half the scores of the opponents drawn.
+        - progressive: sum of the scores reached after each round.
+
+        :param tournament: The tournament whose players are ranked.
+        :type tournament: Tournament
+        """
+        self.players = list(tournament.players)
+        self.positions = {player: position
+                          for position, player in enumerate(self.players)}
+        players_number = len(self.players)
+        rounds_number = len(tournament.rounds)
+
+        games = [(self.positions[match.player1],
+                  self.positions[match.player2],
+                  *match.outcome.half_points,
+                  round_index)
+                 for round_index, played_round in enumerate(tournament.rounds)
+                 for match in played_round.matches
+                 if match.outcome is not MatchResult.PENDING]
+        games = np.array(games, dtype=np.int64).reshape(-1, 5)
+
+        player = np.concatenate((games[:, 0], games[:, 1]))
+        opponent = np.concatenate((games[:, 1], games[:, 0]))
+        points = np.concatenate((games[:, 2], games[:, 3]))
+        rounds = np.concatenate((games[:, 4], games[:, 4]))
+
+        per_round = np.zeros((players_number, max(rounds_number, 1)),
+                             dtype=np.int64)
+        np.add.at(per_round, (player, rounds), points)
+        self.half_points = per_round.sum(axis=1)
+        opponent_scores = self.half_points[opponent]
+
+        buchholz = np.bincount(player, weights=opponent_scores,
+                               minlength=players_number)
+        weakest = np.full(players_number, np.iinfo(np.int64).max)
+        np.minimum.at(weakest, player, opponent_scores)
+        games_played = np.bincount(player, minlength=players_number)
+        buchholz_cut_1 = buchholz - np.where(games_played > 0, weakest, 0)
+
+        # The product of two values in half-points is in quarter-points.
+        sonneborn_berger = np.bincount(player,
+                                       weights=points * opponent_scores,
+                                       minlength=players_number) / 2
+
+        same_score = self.half_points[player] == opponent_scores
+        direct_encounter = np.bincount(player[same_score],
+                                       weights=points[same_score],
+                                       minlength=players_number)
+
+        progressive = np.cumsum(per_round, axis=1).sum(axis=1)
+
+        self.values = {
+            "direct_encounter": direct_encounter / 2,
+            "buchholz_cut_1": buchholz_cut_1 / 2,
+            "buchholz": buchholz / 2,
+            "sonneborn_berger": sonneborn_berger / 2,
+            "progressive": progressive / 2
+        }
+
+    def ranking(self) -> list:
+        """
+        Returns the players sorted by score, then by each tie-break in the
+        order of `TIE_BREAK_NAMES`, best first.
+
+        :rtype: list[Player]
+        """
+        keys = [-self.values[name] for name in reversed(TIE_BREAK_NAMES)]
+        keys.append(-self.half_points)
+        return [self.players[position] for position in np.lexsort(keys)]
+
+    def of(self, player) -> dict:
+        """
+        Returns the tie-breaks of a player.
+
+        :param player: A player of the tournament.
+        :type player: Player
+        :return: The tie-breaks keyed as in `TIE_BREAK_NAMES`.
+        :rtype: dict[str, float]
+        """
+        position = self.positions[player]
+        return {name: float(values[position])
+                for name, values in self.values.items()}
@@ -1,11 +1,11 @@
 import os
 import re
-from typing import List, Union
-from rich import print
-from rich.console import Console
-from rich.table import Table
+import sys
+from typing import TYPE_CHECKING, Callable, List, Union
+from rich import get_console, print
 
-from models import Player, Match, Round, DataBase
+from models import (Player, Match, MatchResult, Round, DataBase,
+                    decode_timestamp, open_data_base)
 from settings import (TITLE_STYLE,
                       LINE_STYLE,
                       ERROR_STYLE,
@@ -13,16 +13,26 @@ from settings import (TITLE_STYLE,
                       TEXT_STYLE,
                       REQUEST_STYLE,
                       INFORMATION_STYLE,
-                      ACTUAL_YEAR)
+                      ACTUAL_YEAR,
+                      TABLE_PAGE_SIZE)
+
+# the tables and markup of rich, and the modules computing with numpy, are
+# imported by the methods using them, so that the menus start quickly
+if TYPE_CHECKING:
+    from export import ExportResult
+    from server import ResultServer
+    from simulation import SimulationResult
+    from tie_breaks import TieBreaks
 
 
 class TournamentView:
 
-    def __init__(self):
-        self.data_base_view = DataBaseView()
-        self.application_view = ApplicationView()
-        self.data_base = DataBase()
-        self.console = Console()
+    def __init__(self,
+                 data_base_view: Union["DataBaseView", None] = None,
+                 application_view: Union["ApplicationView", None] = None):
+        self.data_base_view = data_base_view or DataBaseView()
+        self.application_view = application_view or ApplicationView()
+        self.console = get_console()
 
     @staticmethod
     def display_menu_tournament():
@@ -220,7 +230,7 @@ class TournamentView:
         The function includes:
         - A message indicating the tournament is finished.
         - A final ranking of players, sorted by their score in descending
-            order.
+            order then by their tie-breaks.
         - Details of all rounds played during the tournament.
 
         :param tournament: The tournament to display, which must include
@@ -232,13 +242,12 @@ class TournamentView:
             SUCCESS_STYLE
         ))
 
+        from tie_breaks import TieBreaks
+        tie_breaks = TieBreaks(tournament)
         self.data_base_view.display_players_score(
-            self.data_base.sort_players(
-                tournament.players,
-                "score",
-                True
-            ),
-            "Voici le classement final"
+            tie_breaks.ranking(),
+            "Voici le classement final",
+            tie_breaks
         )
         print(apply_rich_style(
             "voici le détail des rondes jouées",
@@ -253,15 +262,54 @@ class TournamentView:
 
         This menu offers the following options:
         - 1: Record the results of the matches.
-        - 2: Return to the previous menu.
+        - 2: Display the chances of the players, from simulations of
+            the remaining rounds.
+        - 3: Return to the previous menu.
 
         """
         request = "Que voulez faire?"
         text = ["1- Renseigner les résultats des matchs.",
-                "2- Retour."
+                "2- Chances de podium des joueurs.",
+                "3- Retour."
                 ]
         display_styled_menu(None, request, text)
 
+    def display_simulation(self, result: "SimulationResult"):
+        """
+        Displays the chances of each player to win the tournament and to
+        finish among the best three, estimated by simulations.
+
+        :param result: The results of the simulations.
+        :type result: SimulationResult
+        """
+        from rich.table import Table
+
+        table = Table(title=f"Chances estimées sur {result.simulations} "
+                            f"simulations "
+                            f"({result.simulations_per_second:.0f}/s)",
+                      title_style=TITLE_STYLE,
+                      header_style=REQUEST_STYLE
+                      )
+        table.add_column("N.P.N.", justify="center", style=TEXT_STYLE)
+        table.add_column("Nom", justify="center", style=SUCCESS_STYLE)
+        table.add_column("Prénom", justify="center", style=SUCCESS_STYLE)
+        table.add_column("Score", justify="center", style=TEXT_STYLE)
+        table.add_column("1er", justify="center", style=TEXT_STYLE)
+        table.add_column("Top 3", justify="center", style=TEXT_STYLE)
+        table.add_column("Place moy.", justify="center", style=TEXT_STYLE)
+
+        for player in result.ranking():
+            table.add_row(player.national_player_number,
+                          player.name,
+                          player.first_name,
+                          str(player.score),
+                          f"{result.chances(player, 1):.1%}",
+                          f"{result.chances(player, 3):.1%}",
+                          f"{result.mean_position(player):.1f}")
+
+        self.console.print(table)
+        input()
+
     @staticmethod
     def display_matches_creation_error_message():
         print(apply_rich_style(
@@ -294,9 +342,22 @@ class TournamentView:
 
 class DataBaseView:
 
+    PLAYER_COLUMNS = [("N.P.N.", TEXT_STYLE, 10),
+                      ("Nom", SUCCESS_STYLE, 15),
+                      ("Prénom", SUCCESS_STYLE, 15),
+                      ("Date de naissance", TEXT_STYLE, 12)]
+    MATCH_COLUMNS = [("Match", TEXT_STYLE, 6),
+                     ("Nom", SUCCESS_STYLE, 15),
+                     ("Prénom", SUCCESS_STYLE, 15),
+                     ("Score", TEXT_STYLE, 6),
+                     ("VS", ERROR_STYLE, 4),
+                     ("Nom", SUCCESS_STYLE, 15),
+                     ("Prénom", SUCCESS_STYLE, 15),
+                     ("Score", TEXT_STYLE, 6)]
+
     def __init__(self):
-        self.console = Console()
-        self.data_base = DataBase()
+        self.console = get_console()
+        self.data_base = open_data_base()
 
     def ask_national_player_number(self) -> list[str]:
         """
@@ -306,13 +367,16 @@ class DataBaseView:
         The function validates each number against the pattern
         `r"[a-zA-Z]{2}\\d{5}"` and returns a list of valid
         player numbers after applying further validation.
+        When no player number is entered, the text is searched in the
+        names of the players, see `search_national_player_number`.
 
         :return: A list of valid National Player Numbers.
         :rtype: list[str]
         """
         players_number = []
         print(apply_rich_style(
-            "Vous pouvez entrer plusieurs numéros, séparés d'une virgule",
+            "Vous pouvez entrer plusieurs numéros, séparés d'une virgule, "
+            "ou le début du nom du joueur",
             INFORMATION_STYLE
         ))
         print("")
@@ -324,10 +388,60 @@ class DataBaseView:
         )
         pattern = r'\b[a-zA-Z]{2}\d{5}\b'
         extracted_players_number = re.findall(pattern, add_player_number)
+        if not extracted_players_number and add_player_number.strip():
+            return self.search_national_player_number(add_player_number)
         for number in extracted_players_number:
             players_number.append(self.validate_national_player_number(number))
         return players_number
 
+    def search_national_player_number(self, text: str) -> list[str]:
+        """
+        Searches for players by the beginning of their name or first name,
+        or by a similar name, and lets the user pick some of them.
+
+        :param text: The searched name, e.g. "Dup" or "dupont jean".
+        :type text: str
+        :return: The National Player Numbers of the chosen players.
+        :rtype: list[str]
+        """
+        from rich.markup import escape
+        from rich.table import Table
+
+        players = open_data_base().search_players(text)
+        if not players:
+            print(apply_rich_style(
+                f"Aucun joueur ne correspond à « {escape(text)} ».",
+                ERROR_STYLE
+            ))
+            return []
+
+        table = Table(title=f"Joueurs correspondant à « {escape(text)} »",
+                      title_style=TITLE_STYLE,
+                      header_style=REQUEST_STYLE
+                      )
+        table.add_column("N°", justify="center", style=REQUEST_STYLE)
+        for header, style, max_width in self.PLAYER_COLUMNS:
+            table.add_column(header,
+                             justify="center",
+                             style=style,
+                             max_width=max_width)
+        for index, player in enumerate(players, 1):
+            table.add_row(str(index),
+                          player["national_player_number"],
+                          player["name"],
+                          player["first_name"],
+                          player["birthday"])
+        self.console.print(table)
+
+        choice = self.console.input(apply_rich_style(
+            "Numéros (N°) des joueurs à retenir, séparés d'une virgule, "
+            "ou Entrée pour annuler : ",
+            REQUEST_STYLE
+        ))
+        return [players[int(index) - 1]["national_player_number"]
+                for index in re.findall(r"\d+", choice)
+                if 1 <= int(index) <= len(players)]
+
     def player_in_database(self, player: Player):
         """
         displays the player's information in the database
@@ -520,9 +634,48 @@ class DataBaseView:
         """menu to access data categories"""
         header = " DONNEES ENREGISTREES "
         request = "A quelles données voulez-vous accéder?"
-        text = ["1- Joueurs enregistrés", "2- Anciens tournois", "3- Retour"]
+        text = ["1- Joueurs enregistrés",
+                "2- Anciens tournois",
+                "3- Exporter les rapports",
+                "4- Retour"]
+        display_styled_menu(header, request, text)
+
+    @staticmethod
+    def display_menu_export_report():
+        """menu to select the report to export"""
+        header = " EXPORTER LES RAPPORTS "
+        request = "Quel rapport voulez-vous exporter?"
+        text = ["1- Liste des joueurs",
+                "2- Résultats des matchs de tous les tournois",
+                "3- Retour"]
         display_styled_menu(header, request, text)
 
+    @staticmethod
+    def display_menu_export_format():
+        """menu to select the file format of an export"""
+        request = "Sous quel format?"
+        text = ["1- CSV (tableur)",
+                "2- JSON Lines",
+                "3- Page HTML",
+                "4- Retour"]
+        display_styled_menu(None, request, text)
+
+    @staticmethod
+    def display_export_done(result: "ExportResult"):
+        """
+        Displays the file written by an export and its throughput.
+
+        :param result: The result of the export.
+        :type result: ExportResult
+        """
+        path = apply_rich_style(result.path, REQUEST_STYLE)
+        print(apply_rich_style(
+            f"{result.rows} lignes exportées dans {path} en "
+            f"{result.seconds:.2f} s ({result.rows_per_second:.0f} "
+            f"lignes/s).",
+            SUCCESS_STYLE
+        ))
+
     @staticmethod
     def display_menu_registered_players():
         """menu to select a sort criterion"""
@@ -532,14 +685,23 @@ class DataBaseView:
                 "2- Par nom"]
         display_styled_menu(header, request, text)
 
-    def display_players_score(self, players: List[Player], title: str):
+    def display_players_score(self,
+                              players: List[Player],
+                              title: str,
+                              tie_breaks: Union["TieBreaks", None] = None):
         """
         displays the player list in column
         :param players: A list of `Player` objects to be displayed.
         :type players: list[Player]
         :param title:  table title to display
         :type title: string
+        :param tie_breaks: The tie-breaks of the players, displayed in
+            extra columns when given.
+        :type tie_breaks: TieBreaks or None
         """
+        from rich.table import Table
+        from tie_breaks import TIE_BREAK_NAMES
+
         table = Table(title=title,
                       title_style=TITLE_STYLE,
                       header_style=REQUEST_STYLE
@@ -568,65 +730,106 @@ class DataBaseView:
             justify="center",
             style=TEXT_STYLE,
             max_width=12)
+        if tie_breaks:
+            for label in TIE_BREAK_NAMES.values():
+                table.add_column(
+                    label,
+                    justify="center",
+                    style=TEXT_STYLE,
+                    max_width=8)
 
         for player in players:
-            table.add_row(
-                player.national_player_number,
-                player.name,
-                player.first_name,
-                str(player.score)
-            )
+            row = [player.national_player_number,
+                   player.name,
+                   player.first_name,
+                   str(player.score)]
+            if tie_breaks:
+                row.extend(f"{value:g}"
+                           for value in tie_breaks.of(player).values())
+            table.add_row(*row)
 
         self.console.print(table)
 
-    def display_players_list(self, players: List[Player], title: str):
+    def display_players_list(self,
+                             players: List[Player],
+                             title: str,
+                             browse: bool = False):
         """
         displays the player list in column
         :param players: A list of `Player` objects to be displayed.
         :type players: list[Player]
         :param title:  table title to display
         :type title: string
+        :param browse: If True, the list is displayed one page at a time
+            when it holds more than `TABLE_PAGE_SIZE` players; otherwise
+            it is printed at once, e.g. before a prompt.
+        :type browse: bool
         """
-        table = Table(title=title,
-                      title_style=TITLE_STYLE,
-                      header_style=REQUEST_STYLE
-                      )
-
-        table.add_column(
-            "N.P.N.",
-            justify="center",
-            style=TEXT_STYLE,
-            max_width=10
-        )
-        table.add_column(
-            "Nom",
-            justify="center",
-            style=SUCCESS_STYLE,
-            max_width=15
-        )
-        table.add_column(
-            "Prénom",
-            justify="center",
-            style=SUCCESS_STYLE,
-            max_width=15
-        )
-        table.add_column(
-            "Date de naissance",
-            justify="center",
-            style=TEXT_STYLE,
-            max_width=12)
-
-        for player in players:
-            table.add_row(
-                player.national_player_number,
-                player.name,
-                player.first_name,
-                player.birthday
-            )
-
-        self.console.print(table)
-
-    def display_matches(self, matches: List[Match], title: str):
+        def locate(text: str) -> Union[int, None]:
+            text = text.lower()
+            for position, player in enumerate(players):
+                if (player.national_player_number.lower().startswith(text)
+                        or player.name.lower().startswith(text)):
+                    return position
+            return None
+
+        self.display_table(PaginatedTable(
+            title,
+            self.PLAYER_COLUMNS,
+            len(players),
+            lambda offset, limit: [(player.national_player_number,
+                                    player.name,
+                                    player.first_name,
+                                    player.birthday)
+                                   for player in players[offset:
+                                                         offset + limit]],
+            locate,
+            TABLE_PAGE_SIZE if browse else max(1, len(players))))
+
+    def browse_players(self,
+                       data_base: DataBase,
+                       criterion: str,
+                       title: str):
+        """
+        Displays the registered players one page at a time. Only the
+        players of the displayed page are read from the data base, and
+        the search looks for the beginning of the national player number
+        or of the name, depending on the sort order.
+
+        :param data_base: The data base holding the players.
+        :type data_base: DataBase
+        :param criterion: The sort order: "national_player_number" or
+            "name".
+        :type criterion: str
+        :param title: table title to display
+        :type title: str
+        """
+        def locate(text: str) -> Union[int, None]:
+            variant = (text.capitalize() if criterion == "name"
+                       else text.lower())
+            for prefix in dict.fromkeys((text, variant)):
+                position = data_base.find_player_position(criterion,
+                                                          prefix)
+                if position is not None:
+                    return position
+            return None
+
+        PaginatedTable(
+            title,
+            self.PLAYER_COLUMNS,
+            data_base.count_players(),
+            lambda offset, limit: [(player["national_player_number"],
+                                    player["name"],
+                                    player["first_name"],
+                                    player["birthday"])
+                                   for player in data_base.find_players_page(
+                                       criterion, offset, limit)],
+            locate).run()
+
+    def display_matches(self,
+                        matches: List[Match],
+                        title: str,
+                        browse: bool = False):
         """
         Displays a list of matches in a formatted columnar view.
 
@@ -634,40 +837,51 @@ class DataBaseView:
         :type matches: list[Match]
         :param title:  table title to display
         :type title: string
+        :param browse: If True, the list is displayed one page at a time
+            when it holds more than `TABLE_PAGE_SIZE` matches; otherwise
+            it is printed at once, e.g. before a prompt.
+        :type browse: bool
         """
-        table = Table(title=title,
-                      title_style=TITLE_STYLE,
-                      header_style=REQUEST_STYLE
-                      )
-        table.add_column(
-            "Match", justify="center", style=TEXT_STYLE, max_width=6)
-        table.add_column(
-            "Nom", justify="center", style=SUCCESS_STYLE, max_width=15)
-        table.add_column(
-            "Prénom", justify="center", style=SUCCESS_STYLE, max_width=15)
-        table.add_column(
-            "Score", justify="center", style=TEXT_STYLE, max_width=6)
-        table.add_column(
-            "VS", justify="center", style=ERROR_STYLE, max_width=4)
-        table.add_column(
-            "Nom", justify="center", style=SUCCESS_STYLE, max_width=15)
-        table.add_column(
-            "Prénom", justify="center", style=SUCCESS_STYLE, max_width=15)
-        table.add_column(
-            "Score", justify="center", style=TEXT_STYLE, max_width=6)
-
-        for match in matches:
-            table.add_row(str(match.number),
-                          match.player1.name,
-                          match.player1.first_name,
-                          str(match.result[0][1]),
-                          "",
-                          match.player2.name,
-                          match.player2.first_name,
-                          str(match.result[1][1])
-                          )
+        def locate(text: str) -> Union[int, None]:
+            text = text.lower()
+            for position, match in enumerate(matches):
+                if str(match.number) == text or any(
+                        player.national_player_number.lower().startswith(
+                            text) or player.name.lower().startswith(text)
+                        for player in (match.player1, match.player2)):
+                    return position
+            return None
+
+        self.display_table(PaginatedTable(
+            title,
+            self.MATCH_COLUMNS,
+            len(matches),
+            lambda offset, limit: [(str(match.number),
+                                    match.player1.name,
+                                    match.player1.first_name,
+                                    str(match.result[0][1]),
+                                    "",
+                                    match.player2.name,
+                                    match.player2.first_name,
+                                    str(match.result[1][1]))
+                                   for match in matches[offset:
+                                                        offset + limit]],
+            locate,
+            TABLE_PAGE_SIZE if browse else max(1, len(matches))))
 
-        self.console.print(table)
+    @staticmethod
+    def display_table(table: "PaginatedTable"):
+        """
+        Prints a table at once when it fits in a page, otherwise lets the
+        user browse its pages.
+
+        :param table: The table to display.
+        :type table: PaginatedTable
+        """
+        if table.pages_number == 1:
+            table.render(0)
+        else:
+            table.run()
 
     def display_reload_tournament(self, tournaments) -> str:
         """
@@ -684,8 +898,8 @@ class DataBaseView:
             - Current round number
             - Description
 
-            :param tournaments: A list of dictionaries representing
-                                tournaments.
+            :param tournaments: A list of tournament headers, as returned
+                                by `DataBase.find_tournaments`.
             Each dictionary should have the keys:
                 - 'name',
                 - 'place',
@@ -697,6 +911,8 @@ class DataBaseView:
             :return: The user-selected tournament index as a string.
             :rtype: str
             """
+        from rich.table import Table
+
         table = Table(title="listes des tournois disponibles",
                       title_style=TITLE_STYLE,
                       header_style=TEXT_STYLE
@@ -729,7 +945,8 @@ class DataBaseView:
             table.add_row(tournament_number,
                           tournament['name'],
                           tournament['place'],
-                          tournament['start_date'],
+                          decode_timestamp(
+                              tournament['start_date']).strftime("%d-%m-%Y"),
                           str(tournament['max_round']),
                           statut,
                           tournament['description'])
@@ -791,7 +1008,8 @@ class DataBaseView:
             self.display_matches(
                 tournament.rounds[i].matches,
                 f"liste des matchs de la ronde "
-                f"{tournament.rounds[i].round_number}"
+                f"{tournament.rounds[i].round_number}",
+                browse=True
             )
             start_time = apply_rich_style(
                 f"{tournament.rounds[i].start_time.strftime("%H:%M")}",
@@ -830,25 +1048,311 @@ class ApplicationView:
     @staticmethod
     def choose_option() -> str:
         """select one option"""
-        console = Console()
-
-        return console.input(apply_rich_style(
+        return get_console().input(apply_rich_style(
             "Sélectionnez une option: ",
             REQUEST_STYLE
         ))
 
     @staticmethod
     def clear_console():
+        """
+        Clears the terminal. On macOS and Linux, the escape sequences are
+        written directly instead of starting a shell for the `clear`
+        command on every menu. Nothing is cleared when the output is not a
+        terminal.
+        """
+        if not sys.stdout.isatty():
+            return
         if os.name == 'nt':  # Pour Windows
             os.system('cls')
         else:  # Pour macOS et Linux
-            os.system('clear')
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
 
     @staticmethod
     def break_point():
         input()
 
 
+class PaginatedTable:
+    """un tableau affiché page par page"""
+
+    def __init__(self,
+                 title: str,
+                 columns: list[tuple[str, str, int]],
+                 row_count: int,
+                 fetch_rows: Callable[[int, int], list[tuple]],
+                 locate: Union[Callable[[str], Union[int, None]],
+                               None] = None,
+                 page_size: int = TABLE_PAGE_SIZE):
+        """
+        Initializes a table displayed one page at a time.
+
+        Only the rows of the displayed page are requested from
+        `fetch_rows` and rendered, so the cost of a page does not depend
+        on the number of rows of the table.
+
+        :param title: The title of the table.
+        :type title: str
+        :param columns: The header, style and maximum width of each column.
+        :type columns: list[tuple[str, str, int]]
+        :param row_count: The number of rows of the table.
+        :type row_count: int
+        :param fetch_rows: Returns the rows from a position, given the
+            position and the number of rows.
+        :type fetch_rows: callable
+        :param locate: Returns the position of the first row matching a
+            searched text, or `None`. Search is disabled when not given.
+        :type locate: callable or None
+        :param page_size: The number of rows per page.
+        :type page_size: int
+        """
+        self.title = title
+        self.columns = columns
+        self.row_count = row_count
+        self.fetch_rows = fetch_rows
+        self.locate = locate
+        self.page_size = page_size
+        self.console = get_console()
+
+    @property
+    def pages_number(self) -> int:
+        return max(1, -(-self.row_count // self.page_size))
+
+    def render(self, page: int, highlighted: Union[int, None] = None):
+        """
+        Prints a page of the table.
+
+        :param page: The page number, from 0.
+        :type page: int
+        :param highlighted: The position of a row to highlight.
+        :type highlighted: int or None
+        """
+        from rich.table import Table
+
+        title = self.title
+        if self.pages_number > 1:
+            title += f" (page {page + 1}/{self.pages_number})"
+        table = Table(title=title,
+                      title_style=TITLE_STYLE,
+                      header_style=REQUEST_STYLE
+                      )
+        for header, style, max_width in self.columns:
+            table.add_column(header,
+                             justify="center",
+                             style=style,
+                             max_width=max_width)
+        offset = page * self.page_size
+        for position, row in enumerate(self.fetch_rows(offset,
+                                                       self.page_size),
+                                       offset):
+            table.add_row(*row,
+                          style="reverse" if position == highlighted
+                          else None)
+        self.console.print(table)
+
+    def run(self):
+        """
+        Displays the table and reads the commands of the user until they
+        quit:
+        - Enter or "s": next page, "p": previous page.
+        - "d": first page, "f": last page, a number: that page.
+        - "q": quit.
+        - any other text: go to the first row matching it.
+        """
+        from rich.markup import escape
+
+        page = 0
+        highlighted = None
+        message = ""
+        commands = ("Entrée ou s : suivante | p : précédente | d : début | "
+                    "f : fin | numéro : page")
+        if self.locate:
+            commands += " | texte : rechercher"
+        commands += " | q : quitter"
+
+        while True:
+            ApplicationView.clear_console()
+            self.render(page, highlighted)
+            if message:
+                print(apply_rich_style(message, ERROR_STYLE))
+                message = ""
+            print(apply_rich_style(commands, INFORMATION_STYLE))
+            command = self.console.input(
+                apply_rich_style("> ", REQUEST_STYLE)).strip()
+
+            highlighted = None
+            if command.lower() == "q":
+                break
+            elif command.lower() in ("", "s"):
+                page = min(page + 1, self.pages_number - 1)
+            elif command.lower() == "p":
+                page = max(page - 1, 0)
+            elif command.lower() == "d":
+                page = 0
+            elif command.lower() == "f":
+                page = self.pages_number - 1
+            elif command.isdigit():
+                page = min(max(int(command), 1), self.pages_number) - 1
+            elif self.locate:
+                position = self.locate(command)
+                if position is None:
+                    message = f"Aucun résultat pour « {escape(command)} »."
+                else:
+                    page = position // self.page_size
+                    highlighted = position
+
+
+class CommandLineView:
+    """l'affichage du mode en ligne de commande"""
+
+    @staticmethod
+    def write(*lines: str):
+        """
+        Writes lines of plain text, without styles, on the standard output
+        so that it can be read by scripts. Values are separated by
+        tabulations.
+
+        :param lines: The lines to write.
+        :type lines: str
+        """
+        sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+    @staticmethod
+    def display_error(message: str):
+        """
+        Writes an error message on the standard error output.
+
+        :param message: The message to write.
+        :type message: str
+        """
+        sys.stderr.write(f"Erreur : {message}\n")
+
+    @staticmethod
+    def display_warning(message: str):
+        """
+        Writes a warning on the standard error output.
+
+        :param message: The message to write.
+        :type message: str
+        """
+        sys.stderr.write(f"Attention : {message}\n")
+
+    def display_tournament_created(self, tournament):
+        """
+        Confirms the creation of a tournament.
+
+        :param tournament: The created tournament.
+        :type tournament: Tournament
+        """
+        self.write(f"Tournoi « {tournament.name} » créé : "
+                   f"{tournament.max_round} rondes.")
+
+    def display_registered_players(self,
+                                   tournament,
+                                   added: list[str],
+                                   already_registered: list[str]):
+        """
+        Lists the players just registered to a tournament.
+
+        :param tournament: The tournament.
+        :type tournament: Tournament
+        :param added: The national player numbers of the new players.
+        :type added: list[str]
+        :param already_registered: The national player numbers of the
+            players who were already registered.
+        :type already_registered: list[str]
+        """
+        for player_number in already_registered:
+            self.display_warning(f"{player_number} est déjà inscrit.")
+        self.write(f"{len(added)} joueurs inscrits, "
+                   f"{len(tournament.players)} au total.")
+
+    def display_pairings(self, played_round: Round):
+        """
+        Lists the matches of a round: match number, then national player
+        number, name and first name of both players.
+
+        :param played_round: The round.
+        :type played_round: Round
+        """
+        self.write(f"Ronde {played_round.round_number}",
+                   *(f"{match.number}\t"
+                     f"{match.player1.national_player_number}\t"
+                     f"{match.player1.name}\t{match.player1.first_name}\t"
+                     f"{match.player2.national_player_number}\t"
+                     f"{match.player2.name}\t{match.player2.first_name}"
+                     for match in played_round.matches))
+
+    def display_recorded_results(self, played_round: Round, recorded: int):
+        """
+        Confirms the results recorded in a round.
+
+        :param played_round: The round.
+        :type played_round: Round
+        :param recorded: The number of results just recorded.
+        :type recorded: int
+        """
+        if played_round.end_time:
+            status = "ronde terminée"
+        else:
+            pending = sum(match.outcome is MatchResult.PENDING
+                          for match in played_round.matches)
+            status = f"{pending} résultats attendus"
+        self.write(f"Ronde {played_round.round_number} : {recorded} "
+                   f"résultats enregistrés, {status}.")
+
+    def display_final_ranking(self, tournament):
+        """
+        Lists the final ranking of a tournament: rank, national player
+        number, name, first name, score, then the tie-breaks in the order
+        of `TIE_BREAK_NAMES`.
+
+        :param tournament: The ended tournament.
+        :type tournament: Tournament
+        """
+        from tie_breaks import TieBreaks
+        tie_breaks = TieBreaks(tournament)
+        self.write(f"Tournoi « {tournament.name} » terminé.",
+                   *(f"{rank}\t{player.national_player_number}\t"
+                     f"{player.name}\t{player.first_name}\t{player.score}\t"
+                     + "\t".join(f"{value:g}" for value
+                                 in tie_breaks.of(player).values())
+                     for rank, player in enumerate(tie_breaks.ranking(), 1)))
+
+    def display_server_started(self, server: "ResultServer"):
+        """
+        Shows the address of the result server.
+
+        :param server: The started server.
+        :type server: ResultServer
+        """
+        host, port = server.server_address[:2]
+        self.write(f"Saisie des résultats de la ronde "
+                   f"{server.current_round.round_number} sur "
+                   f"http://{host}:{port}/ronde, Ctrl+C pour arrêter.")
+
+    def display_server_stopped(self, server: "ResultServer"):
+        """
+        Confirms the results received by the result server.
+
+        :param server: The stopped server.
+        :type server: ResultServer
+        """
+        self.write(f"{server.results} résultats reçus, écrits en "
+                   f"{server.writer.batches} fois.")
+        self.display_recorded_results(server.current_round, server.results)
+
+    def display_export_done(self, result: "ExportResult"):
+        """
+        Confirms the export of a report.
+
+        :param result: The export.
+        :type result: ExportResult
+        """
+        self.write(f"{result.rows} lignes exportées dans {result.path}.")
+
+
 def apply_rich_style(message: str, style: str) -> str:
     """
     Applies a Rich style to a message.